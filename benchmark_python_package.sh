@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+#
+# Benchmark Python Package Helpers. Arguments are passed through to
+# benchmarks/run_benchmarks.py (see --help)
+#
+# Example Call:
+#    ./benchmark_python_package.sh {--scale=10k_x_10} {--compare=./benchmarks/results/1.0.0.json}
+#
+
+echo "$(date +%c): Running Benchmarks (Arguments = $*)"
+python3 ./benchmarks/run_benchmarks.py "$@"
+
+BENCHMARK_STATUS=$?
+echo "$(date +%c): Benchmark Exit Status - ${BENCHMARK_STATUS}"
+exit ${BENCHMARK_STATUS}
@@ -0,0 +1,838 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Benchmark the public helpers of data_science_helpers on synthetic
+        datasets, recording wall time and peak traced memory of each helper
+        at each scale to a JSON results file. Results files from different
+        versions can be compared to catch regressions before a release.
+
+    Example Call:
+        python3 benchmarks/run_benchmarks.py --scale 10k_x_10 --scale 100k_x_100
+        python3 benchmarks/run_benchmarks.py --compare benchmarks/results/old.json
+"""
+
+# Python Imports
+import argparse
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_science_helpers import (
+    data_engineering_helpers, data_exploration_helpers,
+    model_persistence_helpers, model_training_helpers
+)
+
+
+###
+# Benchmark Definitions
+###
+
+
+# Rows and columns of each synthetic dataset
+SCALES = {
+    "10k_x_10": (10_000, 10),
+    "100k_x_100": (100_000, 100),
+    "1m_x_100": (1_000_000, 100),
+    "10m_x_10": (10_000_000, 10),
+    "10k_x_1k": (10_000, 1_000),
+    "10k_x_5k": (10_000, 5_000),
+}
+
+# Modules whose public functions and classes are benchmarked
+BENCHMARKED_MODULES = (
+    data_engineering_helpers, data_exploration_helpers,
+    model_training_helpers, model_persistence_helpers,
+)
+
+RESULTS_SCHEMA_VERSION = 1
+
+# name: "module.function" benchmarked
+# run: function called with the arguments returned by setup
+# setup: function of a SyntheticDataset returning run's arguments; its
+#     time (e.g. copying a DataFrame updated in place) is not measured
+# max_columns / max_rows: largest scale to run at, for helpers whose cost
+#     grows with column pairs or with model fits
+BenchmarkCase = namedtuple(
+    "BenchmarkCase", ["name", "run", "setup", "max_columns", "max_rows"]
+)
+
+
+def benchmark_case(name, run, setup=None, max_columns=None, max_rows=None):
+    """
+    Purpose:
+        Create a BenchmarkCase, defaulting setup to a copy of the dataset
+    Args:
+        name (String): "module.function" benchmarked
+        run (Function): Function to time
+        setup (Function): Function of a SyntheticDataset returning a tuple
+            of run's arguments
+        max_columns (int): Skip scales with more columns
+        max_rows (int): Skip scales with more rows
+    Return:
+        case (BenchmarkCase): Benchmark definition
+    """
+
+    if setup is None:
+        setup = lambda data: (data.df.copy(), )
+
+    return BenchmarkCase(name, run, setup, max_columns, max_rows)
+
+
+def get_benchmark_cases():
+    """
+    Purpose:
+        Get the benchmark of every public helper
+    Args:
+        N/A
+    Return:
+        cases (List of BenchmarkCase): Benchmark definitions
+    """
+
+    engineering = data_engineering_helpers
+    exploration = data_exploration_helpers
+    training = model_training_helpers
+    persistence = model_persistence_helpers
+
+    def engineering_case(name, run=None, setup=None, **kwargs):
+        return benchmark_case(
+            f"data_engineering_helpers.{name}",
+            run or getattr(engineering, name), setup, **kwargs
+        )
+
+    def exploration_case(name, run=None, setup=None, **kwargs):
+        return benchmark_case(
+            f"data_exploration_helpers.{name}",
+            run or getattr(exploration, name),
+            setup or (lambda data: (data.df, )), **kwargs
+        )
+
+    def training_case(name, run, setup, **kwargs):
+        return benchmark_case(
+            f"model_training_helpers.{name}", run, setup, **kwargs
+        )
+
+    def persistence_case(name, run, setup, **kwargs):
+        return benchmark_case(
+            f"model_persistence_helpers.{name}", run, setup, **kwargs
+        )
+
+    def update_streaming_profile(chunks):
+        column_profile = engineering.StreamingColumnProfile()
+        for chunk in chunks:
+            column_profile.update(chunk)
+        return column_profile
+
+    profile_setup = lambda data: (engineering.ColumnProfile(data.df), )
+    view_setup = lambda data: (data.df, )
+
+    return [
+        # data_engineering_helpers
+        engineering_case("remove_overly_null_columns"),
+        engineering_case("remove_high_cardinality_numerical_columns"),
+        engineering_case("remove_high_cardinality_categorical_columns"),
+        engineering_case("remove_single_value_columns"),
+        engineering_case("remove_quantile_equality_columns"),
+        engineering_case("mask_outliers_numerical_columns"),
+        engineering_case(
+            "convert_categorical_columns_to_dummies",
+            setup=lambda data: (data.low_cardinality_df.copy(), )
+        ),
+        engineering_case("ensure_categorical_columns_all_string"),
+        engineering_case("encode_categorical_columns_as_integer"),
+        engineering_case("replace_null_values_numeric_columns"),
+        engineering_case("replace_null_values_categorical_columns"),
+        engineering_case("optimize_dataframe_memory"),
+        engineering_case("get_memory_optimized_dtypes", setup=view_setup),
+        benchmark_case(
+            "data_engineering_helpers.OutlierClipper",
+            lambda df: engineering.OutlierClipper().fit_transform(df)
+        ),
+        benchmark_case(
+            "data_engineering_helpers.CategoricalDummyEncoder",
+            lambda df: engineering.CategoricalDummyEncoder().fit_transform(df),
+            lambda data: (data.low_cardinality_df.copy(), )
+        ),
+        benchmark_case(
+            "data_engineering_helpers.CategoricalIntegerEncoder",
+            lambda df:
+                engineering.CategoricalIntegerEncoder().fit_transform(df)
+        ),
+        benchmark_case(
+            "data_engineering_helpers.NullImputer",
+            lambda df: engineering.NullImputer().fit_transform(df)
+        ),
+        engineering_case("ColumnProfile", setup=view_setup),
+        engineering_case("get_overly_null_columns", setup=profile_setup),
+        engineering_case(
+            "get_high_cardinality_numerical_columns", setup=profile_setup
+        ),
+        engineering_case(
+            "get_high_cardinality_categorical_columns", setup=profile_setup
+        ),
+        engineering_case("get_single_value_columns", setup=profile_setup),
+        engineering_case("get_quantile_equality_columns", setup=view_setup),
+        engineering_case("get_columns_to_drop", setup=profile_setup),
+        benchmark_case(
+            "data_engineering_helpers.StreamingColumnProfile",
+            update_streaming_profile, lambda data: (data.get_chunks(), )
+        ),
+        engineering_case(
+            "profile_dataframe_chunks", setup=lambda data: (data.get_chunks(), )
+        ),
+        engineering_case(
+            "iterate_parquet_row_groups",
+            lambda filename: list(engineering.iterate_parquet_row_groups(
+                filename
+            )),
+            lambda data: (data.get_parquet_filename(), )
+        ),
+        engineering_case("get_categorical_columns", setup=view_setup),
+        engineering_case("get_numeric_columns", setup=view_setup),
+        engineering_case(
+            "get_column_quantiles",
+            setup=lambda data: (data.df, [.05, .25, .5, .75, .95])
+        ),
+        engineering_case("get_columns_with_null_values", setup=view_setup),
+
+        # data_exploration_helpers
+        exploration_case("get_numerical_column_statistics"),
+        exploration_case("get_numerical_column_statistics_dataframe"),
+        exploration_case("get_column_correlation"),
+        exploration_case("get_column_absolute_correlation"),
+        exploration_case("get_column_pairs_significant_correlation"),
+        exploration_case(
+            "get_streaming_column_correlation",
+            setup=lambda data: (data.get_chunks(numeric=True), )
+        ),
+        exploration_case(
+            "write_blocked_correlation_matrix",
+            setup=lambda data: (
+                lambda: iter(data.get_chunks(numeric=True)),
+                data.get_filename("correlation.npy"),
+                list(data.numeric_df.columns)
+            )
+        ),
+        exploration_case(
+            "get_column_spearman_correlation", max_columns=1_000
+        ),
+        exploration_case(
+            "get_column_kendall_correlation", max_columns=20,
+            max_rows=1_000_000
+        ),
+        exploration_case(
+            "get_column_mutual_information", max_columns=100
+        ),
+        exploration_case("get_unique_column_paris", max_columns=1_000),
+        exploration_case(
+            "iterate_unique_column_pairs",
+            lambda df: sum(
+                1 for _ in exploration.iterate_unique_column_pairs(df)
+            ),
+            max_columns=1_000
+        ),
+        exploration_case("get_unique_column_pair_indices"),
+
+        # model_training_helpers
+        training_case(
+            "split_dataframe_for_model_training",
+            training.split_dataframe_for_model_training,
+            lambda data: (data.numeric_df, "target")
+        ),
+        training_case(
+            "get_train_test_split_indices",
+            training.get_train_test_split_indices, view_setup
+        ),
+        training_case(
+            "iterate_k_fold_indices",
+            lambda df: list(training.iterate_k_fold_indices(df)), view_setup
+        ),
+        training_case(
+            "split_dataframe_by_column", training.split_dataframe_by_column,
+            lambda data: (data.df, "category_low_0")
+        ),
+        training_case(
+            "get_column_partition_indices",
+            training.get_column_partition_indices,
+            lambda data: (data.df, "category_high_0")
+        ),
+        training_case(
+            "iterate_dataframe_partitions",
+            lambda df, column: sum(
+                1 for _ in training.iterate_dataframe_partitions(df, column)
+            ),
+            lambda data: (data.df, "category_low_0")
+        ),
+        training_case(
+            "write_dataframe_partitions_to_parquet",
+            training.write_dataframe_partitions_to_parquet,
+            lambda data: (
+                data.df, "category_low_0", data.get_filename("partitions")
+            )
+        ),
+        training_case(
+            "predict_dataframe_in_chunks",
+            lambda model, df: training.predict_dataframe_in_chunks(model, df),
+            lambda data: (data.model, data.feature_df)
+        ),
+        training_case(
+            "cross_validate_parameter_grid",
+            lambda train_x, train_y: training.cross_validate_parameter_grid(
+                Ridge(), train_x, train_y, {"alpha": [.1, 1, 10]}, n_splits=3
+            ),
+            lambda data: (data.feature_df, data.numeric_df["target"]),
+            max_rows=1_000_000
+        ),
+
+        # model_persistence_helpers
+        persistence_case(
+            "store_model_as_pickle", persistence.store_model_as_pickle,
+            lambda data: (data.model, data.get_filename("store.pkl"))
+        ),
+        persistence_case(
+            "store_model_as_buffer_container",
+            persistence.store_model_as_buffer_container,
+            lambda data: (data.model, data.get_filename("store.container"))
+        ),
+        persistence_case(
+            "load_pickled_model", persistence.load_pickled_model,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+        persistence_case(
+            "load_pickled_model (buffer container)",
+            persistence.load_pickled_model,
+            lambda data: (data.get_model_filename("container"), )
+        ),
+        persistence_case(
+            "load_model_config", persistence.load_model_config,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+        persistence_case(
+            "load_model_metadata", persistence.load_model_metadata,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+        persistence_case(
+            "get_model_sidecar_filename",
+            persistence.get_model_sidecar_filename,
+            lambda data: (data.get_model_filename("pickle"), "config")
+        ),
+        persistence_case(
+            "get_model_array_directory",
+            persistence.get_model_array_directory,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+        persistence_case(
+            "ModelCache",
+            lambda model_cache, filename: model_cache.get_model(filename),
+            lambda data: (
+                persistence.ModelCache(), data.get_model_filename("pickle")
+            )
+        ),
+        persistence_case(
+            "ModelPreloader",
+            lambda filenames: persistence.ModelPreloader(filenames).get_model(
+                filenames[-1]
+            ),
+            lambda data: ([
+                data.get_model_filename("pickle"),
+                data.get_model_filename("container"),
+            ], )
+        ),
+        persistence_case(
+            "get_model_file_signature", persistence.get_model_file_signature,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+        persistence_case(
+            "get_model_file_bytes", persistence.get_model_file_bytes,
+            lambda data: (data.get_model_filename("pickle"), )
+        ),
+    ]
+
+
+###
+# Synthetic Data
+###
+
+
+class SyntheticDataset(object):
+    """
+    Purpose:
+        Synthetic DataFrame of a given scale with the column types the
+        helpers handle: floats with nulls, integers, low and high
+        cardinality strings, a constant column, and a numeric target.
+        Derived inputs (chunks, files, a fitted model) are built lazily
+        and files are written to a temporary directory
+    Attributes:
+        rows (int): Rows in the dataset
+        columns (int): Columns in the dataset, excluding target
+        df (Pandas DataFrame): Mixed type dataset
+    """
+
+    def __init__(self, rows, columns, seed=0):
+        """
+        Purpose:
+            Generate the dataset
+        Args:
+            rows (int): Rows to generate
+            columns (int): Columns to generate, excluding target
+            seed (int): Random seed
+        Return:
+            N/A
+        """
+
+        self.rows = rows
+        self.columns = columns
+        self._random = np.random.default_rng(seed)
+        self._directory = tempfile.TemporaryDirectory(prefix="benchmark-")
+        self._cached_inputs = {}
+
+        category_columns = max(columns // 10, 2)
+        integer_columns = max(columns // 10, 1)
+        float_columns = max(columns - category_columns - integer_columns - 1, 1)
+
+        data = {}
+        float_values = self._random.standard_normal((rows, float_columns))
+        float_values[
+            self._random.random((rows, float_columns)) < .05
+        ] = np.nan
+        for index in range(float_columns):
+            data[f"float_{index}"] = float_values[:, index]
+        for index in range(integer_columns):
+            data[f"integer_{index}"] = self._random.integers(
+                0, 1000, size=rows
+            )
+        for index in range(category_columns):
+            cardinality = 10 if index % 2 == 0 else max(rows // 10, 10)
+            kind = "low" if index % 2 == 0 else "high"
+            levels = np.array(
+                [f"level_{level}" for level in range(cardinality)],
+                dtype=object
+            )
+            data[f"category_{kind}_{index // 2}"] = pd.Series(
+                levels[self._random.integers(0, cardinality, size=rows)],
+                dtype=str
+            )
+        data["constant"] = np.ones(rows)
+        data["target"] = float_values[:, 0] * 2 + self._random.random(rows)
+
+        self.df = pd.DataFrame(data)
+
+    @property
+    def numeric_df(self):
+        """
+        Purpose:
+            Numeric columns of the dataset, with nulls filled
+        Return:
+            numeric_df (Pandas DataFrame): Numeric dataset
+        """
+
+        if "numeric_df" not in self._cached_inputs:
+            self._cached_inputs["numeric_df"] = self.df[
+                data_engineering_helpers.get_numeric_columns(self.df)
+            ].fillna(0)
+
+        return self._cached_inputs["numeric_df"]
+
+    @property
+    def low_cardinality_df(self):
+        """
+        Purpose:
+            Dataset without its high cardinality string columns, as it
+            would be before dummy encoding
+        Return:
+            low_cardinality_df (Pandas DataFrame): Dataset
+        """
+
+        return self.df.drop(columns=[
+            column for column in self.df.columns
+            if column.startswith("category_high_")
+        ])
+
+    @property
+    def feature_df(self):
+        """
+        Purpose:
+            Numeric features of the dataset, without target
+        Return:
+            feature_df (Pandas DataFrame): Numeric features
+        """
+
+        return self.numeric_df.drop(columns=["target"])
+
+    @property
+    def model(self):
+        """
+        Purpose:
+            Tree ensemble fit on up to 20,000 rows of the dataset, so
+            model size does not grow with the dataset
+        Return:
+            model (RandomForestRegressor): Fitted model
+        """
+
+        if "model" not in self._cached_inputs:
+            sample_rows = min(self.rows, 20_000)
+            self._cached_inputs["model"] = RandomForestRegressor(
+                n_estimators=20, max_depth=12, n_jobs=-1, random_state=0
+            ).fit(
+                self.feature_df.iloc[:sample_rows],
+                self.numeric_df["target"].iloc[:sample_rows]
+            )
+
+        return self._cached_inputs["model"]
+
+    def get_chunks(self, numeric=False, chunk_rows=100_000):
+        """
+        Purpose:
+            Split the dataset into row chunks
+        Args:
+            numeric (Boolean): Chunk the numeric dataset
+            chunk_rows (int): Rows per chunk
+        Return:
+            chunks (List of Pandas DataFrames): Row chunks
+        """
+
+        df = self.numeric_df if numeric else self.df
+
+        return [
+            df.iloc[start:start + chunk_rows]
+            for start in range(0, len(df), chunk_rows)
+        ]
+
+    def get_filename(self, name):
+        """
+        Purpose:
+            Get a path in the dataset's temporary directory
+        Args:
+            name (String): File name
+        Return:
+            filename (String): Path of the file
+        """
+
+        return os.path.join(self._directory.name, name)
+
+    def get_parquet_filename(self):
+        """
+        Purpose:
+            Write the dataset to Parquet once (requires pyarrow)
+        Return:
+            filename (String): Parquet file of the dataset
+        """
+
+        filename = self.get_filename("dataset.parquet")
+        if not os.path.isfile(filename):
+            self.df.to_parquet(filename, row_group_size=100_000)
+
+        return filename
+
+    def get_model_filename(self, model_format):
+        """
+        Purpose:
+            Store the model once in a persistence format
+        Args:
+            model_format (String): "pickle" or "container"
+        Return:
+            filename (String): Stored model file
+        """
+
+        filename = self.get_filename(f"model.{model_format}")
+        if not os.path.isfile(filename):
+            if model_format == "pickle":
+                model_persistence_helpers.store_model_as_pickle(
+                    self.model, filename, config={"n_estimators": 20},
+                    metadata={"rows": self.rows}
+                )
+            else:
+                model_persistence_helpers.store_model_as_buffer_container(
+                    self.model, filename
+                )
+
+        return filename
+
+    def cleanup(self):
+        """
+        Purpose:
+            Remove the dataset's temporary files
+        Return:
+            N/A
+        """
+
+        self._directory.cleanup()
+
+
+###
+# Benchmark Execution
+###
+
+
+def run_benchmark_case(case, data, repeat):
+    """
+    Purpose:
+        Time a benchmark case and measure its peak traced memory
+    Args:
+        case (BenchmarkCase): Benchmark to run
+        data (SyntheticDataset): Dataset to run on
+        repeat (int): Timed runs
+    Return:
+        result (Dict): Timing and memory of the case
+    """
+
+    result = {
+        "benchmark": case.name,
+        "rows": data.rows,
+        "columns": data.columns,
+        "repeat": repeat,
+    }
+    if (case.max_columns and data.columns > case.max_columns) or (
+        case.max_rows and data.rows > case.max_rows
+    ):
+        result["status"] = "skipped"
+        result["error"] = "scale over benchmark limit"
+        return result
+
+    try:
+        timings = []
+        for _ in range(repeat):
+            args = case.setup(data)
+            start = time.perf_counter()
+            case.run(*args)
+            timings.append(time.perf_counter() - start)
+
+        args = case.setup(data)
+        tracemalloc.start()
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        case.run(*args)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except Exception as err:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result["status"] = "error"
+        result["error"] = f"{type(err).__name__}: {err}"
+        return result
+
+    result.update({
+        "status": "ok",
+        "seconds_min": min(timings),
+        "seconds_median": statistics.median(timings),
+        "peak_memory_bytes": peak_bytes - baseline_bytes,
+    })
+
+    return result
+
+
+def get_unbenchmarked_helpers(cases):
+    """
+    Purpose:
+        Get public helpers of the benchmarked modules without a case, so
+        new helpers are noticed in the results
+    Args:
+        cases (List of BenchmarkCase): Benchmark definitions
+    Return:
+        unbenchmarked (List of Strings): "module.name" of each helper
+    """
+
+    benchmarked = {case.name.split(" ")[0] for case in cases}
+    unbenchmarked = []
+    for module in BENCHMARKED_MODULES:
+        module_name = module.__name__.rsplit(".", 1)[-1]
+        for name, value in vars(module).items():
+            if (
+                not name.startswith("_")
+                and (inspect.isfunction(value) or inspect.isclass(value))
+                and value.__module__ == module.__name__
+                and f"{module_name}.{name}" not in benchmarked
+            ):
+                unbenchmarked.append(f"{module_name}.{name}")
+
+    return sorted(unbenchmarked)
+
+
+def get_environment():
+    """
+    Purpose:
+        Describe the package version and environment of a run
+    Args:
+        N/A
+    Return:
+        environment (Dict): Versions, commit, and machine details
+    """
+
+    package_directory = os.path.dirname(os.path.dirname(os.path.abspath(
+        __file__
+    )))
+    with open(os.path.join(package_directory, "VERSION")) as version_file:
+        version = version_file.readline().strip()
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=package_directory,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "package_version": version,
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scikit-learn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare_results(results, baseline_results, max_slowdown):
+    """
+    Purpose:
+        Compare median timings against a baseline results file
+    Args:
+        results (Dict): Results of this run
+        baseline_results (Dict): Results of a previous run
+        max_slowdown (float): Allowed fractional slowdown, e.g. .25
+    Return:
+        regressions (List of Dicts): Benchmarks slower than allowed
+    """
+
+    baseline_timings = {
+        (result["benchmark"], result["rows"], result["columns"]):
+            result["seconds_median"]
+        for result in baseline_results["results"]
+        if result["status"] == "ok"
+    }
+
+    regressions = []
+    for result in results["results"]:
+        key = (result["benchmark"], result["rows"], result["columns"])
+        if result["status"] != "ok" or key not in baseline_timings:
+            continue
+        ratio = result["seconds_median"] / max(baseline_timings[key], 1e-9)
+        print(
+            f"{result['benchmark']:<66} {result['rows']:>10} x "
+            f"{result['columns']:<6} {ratio:6.2f}x"
+        )
+        if ratio > 1 + max_slowdown:
+            regressions.append(dict(result, slowdown=ratio))
+
+    return regressions
+
+
+###
+# Main Functionality
+###
+
+
+def main():
+    """
+    Purpose:
+        Run the benchmarks and write the results file
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scale", action="append", choices=sorted(SCALES) + ["all"],
+        help="Dataset scale to run (repeatable). Defaults to 10k_x_10"
+    )
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks containing this"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs of each benchmark"
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="Results file. Defaults to benchmarks/results/<version>.json"
+    )
+    parser.add_argument(
+        "--compare", default=None, help="Baseline results file to compare"
+    )
+    parser.add_argument(
+        "--max-slowdown", type=float, default=.25,
+        help="Allowed fractional slowdown against the baseline"
+    )
+    args = parser.parse_args()
+
+    scales = args.scale or ["10k_x_10"]
+    if "all" in scales:
+        scales = list(SCALES)
+    cases = [
+        case for case in get_benchmark_cases() if args.filter in case.name
+    ]
+
+    results = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": get_environment(),
+        "unbenchmarked": get_unbenchmarked_helpers(get_benchmark_cases()),
+        "results": [],
+    }
+
+    for scale in scales:
+        rows, columns = SCALES[scale]
+        print(f"Generating {scale} Dataset ({rows} Rows, {columns} Columns)")
+        data = SyntheticDataset(rows, columns)
+        try:
+            for case in cases:
+                result = run_benchmark_case(case, data, args.repeat)
+                results["results"].append(result)
+                if result["status"] == "ok":
+                    print(
+                        f"{case.name:<66} {result['seconds_median']:10.4f}s "
+                        f"{result['peak_memory_bytes'] / 1024 ** 2:10.1f}MB"
+                    )
+                else:
+                    print(f"{case.name:<66} {result['status']}: "
+                          f"{result['error']}")
+        finally:
+            data.cleanup()
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"{results['environment']['package_version']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as output_file:
+        json.dump(results, output_file, indent=4)
+    print(f"Wrote Benchmark Results to {output}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline_results = json.load(baseline_file)
+        regressions = compare_results(
+            results, baseline_results, args.max_slowdown
+        )
+        if regressions:
+            print(f"{len(regressions)} Benchmarks Regressed:")
+            for regression in regressions:
+                print(
+                    f"    {regression['benchmark']} "
+                    f"({regression['rows']} x {regression['columns']}): "
+                    f"{regression['slowdown']:.2f}x"
+                )
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@
         Add Libraries to Path for Pip Installing
 """
 
+from .instrumentation_helpers import *
 from .data_engineering_helpers import *
+from .data_sketch_helpers import *
+from .data_pipeline_helpers import *
+from .data_cache_helpers import *
 from .data_exploration_helpers import *
 from .model_training_helpers import *
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+    Library for caching the results of data exploration helpers. Results are
+    keyed by a fingerprint of the DataFrame contents and schema plus the call
+    parameters, so repeated exploration of unchanged data returns instantly
+"""
+
+# Python Library Imports
+import sys
+import os
+import logging
+import functools
+import hashlib
+import inspect
+import pickle
+import threading
+import pandas as pd
+import numpy as np
+
+from collections import OrderedDict
+
+###
+# Fingerprint Functions
+###
+
+def get_dataframe_fingerprint(df):
+    """
+        Purpose:
+            Get a fingerprint of a DataFrame's contents and schema.
+            Row values and the index are hashed with
+            pd.util.hash_pandas_object; column names and dtypes are
+            hashed alongside them
+        Args:
+            df (Pandas DataFrame): DataFrame to fingerprint
+        Return
+            fingerprint (String): Hex digest of the DataFrame
+    """
+
+    fingerprint = hashlib.blake2b(digest_size=20)
+    fingerprint.update(
+        repr([(column, str(dtype)) for column, dtype in df.dtypes.items()])
+        .encode('utf-8')
+    )
+    fingerprint.update(repr(df.shape).encode('utf-8'))
+    fingerprint.update(
+        pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+    )
+
+    return fingerprint.hexdigest()
+
+
+def get_exploration_cache_key(function, df, *args, **kwargs):
+    """
+        Purpose:
+            Get the cache key of a call to an exploration function.
+            Arguments are bound to the function signature with
+            defaults applied, so equivalent calls share a key
+        Args:
+            function (Function): Exploration function called
+            df (Pandas DataFrame): DataFrame passed to the function
+            args (List): Other positional arguments
+            kwargs (Dict): Keyword arguments
+        Return
+            cache_key (String): Hex digest of the call
+    """
+
+    bound_arguments = inspect.signature(function).bind(df, *args, **kwargs)
+    bound_arguments.apply_defaults()
+    parameters = [
+        (name, value) for name, value in bound_arguments.arguments.items()
+        if value is not df
+    ]
+
+    cache_key = hashlib.blake2b(digest_size=20)
+    cache_key.update(
+        '{module}.{name}'.format(
+            module=function.__module__, name=function.__qualname__
+        ).encode('utf-8')
+    )
+    cache_key.update(repr(parameters).encode('utf-8'))
+    cache_key.update(get_dataframe_fingerprint(df).encode('utf-8'))
+
+    return cache_key.hexdigest()
+
+###
+# Cache Classes
+###
+
+class ExplorationCache(object):
+    """
+        Purpose:
+            Two tier cache of exploration results: an in-memory LRU
+            bounded by entry count and an optional on-disk tier of
+            pickle files bounded by total bytes (least recently used
+            files are removed first). Cached results are shared, so
+            copy a result before updating it
+        Attributes:
+            max_memory_entries (int): Results kept in memory
+            cache_directory (String): Directory of the disk tier, or
+                None for memory only
+            max_disk_bytes (int): Bytes kept in the disk tier
+            hits (int): Lookups answered from the cache
+            misses (int): Lookups that had to be computed
+    """
+
+    def __init__(
+        self, max_memory_entries=128, cache_directory=None,
+        max_disk_bytes=1024 ** 3):
+        """
+            Purpose:
+                Create an empty cache
+            Args:
+                max_memory_entries (int): Results kept in memory.
+                    Defaults to 128
+                cache_directory (String): Directory of the disk tier.
+                    Defaults to None (memory only)
+                max_disk_bytes (int): Bytes kept in the disk tier.
+                    Defaults to 1GB
+        """
+
+        self.max_memory_entries = max_memory_entries
+        self.cache_directory = cache_directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory_entries = OrderedDict()
+        self._lock = threading.RLock()
+
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+
+    def get(self, cache_key, default=None):
+        """
+            Purpose:
+                Get a cached result, checking memory then disk. Disk
+                hits are promoted to memory
+            Args:
+                cache_key (String): Key of the result
+                default (Any): Value returned on a miss
+            Return
+                result (Any): Cached result or default
+        """
+
+        with self._lock:
+            if cache_key in self._memory_entries:
+                self._memory_entries.move_to_end(cache_key)
+                self.hits += 1
+                return self._memory_entries[cache_key]
+
+            cache_filename = self._get_cache_filename(cache_key)
+            if cache_filename is not None and os.path.isfile(cache_filename):
+                with open(cache_filename, 'rb') as cache_file:
+                    result = pickle.load(cache_file)
+                os.utime(cache_filename)
+                self._set_memory_entry(cache_key, result)
+                self.hits += 1
+                return result
+
+            self.misses += 1
+            return default
+
+    def set(self, cache_key, result):
+        """
+            Purpose:
+                Store a result in memory and, if configured, on disk
+            Args:
+                cache_key (String): Key of the result
+                result (Any): Picklable result to store
+            Return
+                N/A
+        """
+
+        with self._lock:
+            self._set_memory_entry(cache_key, result)
+
+            cache_filename = self._get_cache_filename(cache_key)
+            if cache_filename is not None:
+                temporary_filename = '{filename}.tmp'.format(
+                    filename=cache_filename
+                )
+                with open(temporary_filename, 'wb') as cache_file:
+                    pickle.dump(
+                        result, cache_file, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+                os.replace(temporary_filename, cache_filename)
+                self._evict_disk_entries()
+
+    def get_or_compute(self, function, df, *args, **kwargs):
+        """
+            Purpose:
+                Return the cached result of function(df, *args,
+                **kwargs), computing and storing it on a miss
+            Args:
+                function (Function): Exploration function to call
+                df (Pandas DataFrame): DataFrame to explore
+                args (List): Other positional arguments
+                kwargs (Dict): Keyword arguments
+            Return
+                result (Any): Result of the call
+        """
+
+        cache_key = get_exploration_cache_key(function, df, *args, **kwargs)
+        missing = object()
+        result = self.get(cache_key, default=missing)
+        if result is missing:
+            logging.info(
+                'Exploration Cache Miss for %s', function.__name__
+            )
+            result = function(df, *args, **kwargs)
+            self.set(cache_key, result)
+
+        return result
+
+    def clear(self):
+        """
+            Purpose:
+                Remove every cached result from memory and disk
+            Args:
+                N/A
+            Return
+                N/A
+        """
+
+        with self._lock:
+            self._memory_entries.clear()
+            for cache_filename in self._get_disk_filenames():
+                os.remove(cache_filename)
+
+    def _set_memory_entry(self, cache_key, result):
+        """
+            Purpose:
+                Store a result in the memory tier, evicting the least
+                recently used results over max_memory_entries
+            Args:
+                cache_key (String): Key of the result
+                result (Any): Result to store
+            Return
+                N/A
+        """
+
+        self._memory_entries[cache_key] = result
+        self._memory_entries.move_to_end(cache_key)
+        while len(self._memory_entries) > self.max_memory_entries:
+            self._memory_entries.popitem(last=False)
+
+    def _get_cache_filename(self, cache_key):
+        """
+            Purpose:
+                Get the disk tier file of a key
+            Args:
+                cache_key (String): Key of the result
+            Return
+                cache_filename (String): File, or None without a
+                    disk tier
+        """
+
+        if self.cache_directory is None:
+            return None
+
+        return os.path.join(
+            self.cache_directory, '{key}.pkl'.format(key=cache_key)
+        )
+
+    def _get_disk_filenames(self):
+        """
+            Purpose:
+                Get every file in the disk tier
+            Args:
+                N/A
+            Return
+                cache_filenames (List of Strings): Cached result files
+        """
+
+        if self.cache_directory is None:
+            return []
+
+        return [
+            os.path.join(self.cache_directory, filename)
+            for filename in os.listdir(self.cache_directory)
+            if filename.endswith('.pkl')
+        ]
+
+    def _evict_disk_entries(self):
+        """
+            Purpose:
+                Remove the least recently used files until the disk
+                tier is under max_disk_bytes
+            Args:
+                N/A
+            Return
+                N/A
+        """
+
+        cache_files = []
+        for cache_filename in self._get_disk_filenames():
+            file_stat = os.stat(cache_filename)
+            cache_files.append(
+                (file_stat.st_mtime, file_stat.st_size, cache_filename)
+            )
+
+        total_bytes = sum(file_size for _, file_size, _ in cache_files)
+        for _, file_size, cache_filename in sorted(cache_files):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            os.remove(cache_filename)
+            total_bytes -= file_size
+
+###
+# Cache Decorators
+###
+
+def cacheable_exploration(function):
+    """
+        Purpose:
+            Decorator adding an opt-in cache keyword argument to an
+            exploration function taking a DataFrame first. Calls with
+            cache=ExplorationCache(...) are answered from the cache;
+            calls without it run as before
+        Args:
+            function (Function): Exploration function to wrap
+        Return
+            wrapped_function (Function): Function accepting cache
+    """
+
+    @functools.wraps(function)
+    def wrapped_function(df, *args, cache=None, **kwargs):
+        if cache is None:
+            return function(df, *args, **kwargs)
+
+        return cache.get_or_compute(function, df, *args, **kwargs)
+
+    return wrapped_function
@@ -7,17 +7,24 @@
 # Python Library Imports
 import sys
 import os
+import json
 import logging
 import pandas as pd
 import numpy as np
+import scipy.sparse
 
-from sklearn.preprocessing import LabelEncoder
+from data_science_helpers.data_sketch_helpers import (
+    ColumnQuantileSketch, HyperLogLog, hash_column_values
+)
+from data_science_helpers.instrumentation_helpers import instrumented
 
 ###
 # Alter DataFrame Functions
 ###
 
-def remove_overly_null_columns(df, percentage_null=.25):
+@instrumented
+def remove_overly_null_columns(
+    df, percentage_null=.25, column_profile=None):
     """
         Purpose:
             Remove columns with the count of null values
@@ -29,32 +36,33 @@ def remove_overly_null_columns(df, percentage_null=.25):
             percentage_null (float): Percentage of null values
                 that will be the threshold for removing or
                 keeping columns. Defaults to .25 (25%)
+            column_profile (ColumnProfile): Optional precomputed
+                profile of df. If not passed, one is computed
         Return
             df (Pandas DataFrame): DataFrame with columns removed
                 based on thresholds
     """
     logging.info('Removing Overly Null Columns from DataFrame')
-    logging.info(
-        'Null Percentage Set to {percentage}'.format(
-            percentage=percentage_null
-        )
-    )
+    logging.info('Null Percentage Set to %s', percentage_null)
 
-    columns_to_drop = []
-    for column in df.columns:
-        total_null = df[column].isnull().sum()
-        if (total_null / len(df.index)) > percentage_null:
-            columns_to_drop.append(column)
-            logging.info(
-                'Dropping Columns {column} due to high null counts'.format(
-                    column=column
-                )
-            )
+    if column_profile is None:
+        column_profile = ColumnProfile(df)
 
-    return df.drop(columns_to_drop, axis=1)
+    columns_to_drop = get_overly_null_columns(
+        column_profile, percentage_null=percentage_null
+    )
+    if columns_to_drop:
+        logging.info(
+            'Dropping %d Columns due to high null counts: %s',
+            len(columns_to_drop), columns_to_drop
+        )
 
+    return _drop_profiled_columns(df, columns_to_drop)
 
-def remove_high_cardinality_numerical_columns(df, percentage_unique=1):
+
+@instrumented
+def remove_high_cardinality_numerical_columns(
+    df, percentage_unique=1, column_profile=None):
     """
         Purpose:
             Remove columns with the count of unique values
@@ -69,32 +77,33 @@ def remove_high_cardinality_numerical_columns(df, percentage_unique=1):
             percentage_unique (float): Percentage of null values
                 that will be the threshold for removing or
                 keeping columns. Defaults to 1 (100%)
+            column_profile (ColumnProfile): Optional precomputed
+                profile of df. If not passed, one is computed
         Return
             df (Pandas DataFrame): DataFrame with columns removed
                 based on thresholds
     """
     logging.info('Removing Unique Identifiers from DataFrame')
-    logging.info(
-        'Uniqueness Percentage Set to {percentage}'.format(
-            percentage=percentage_unique
-        )
-    )
+    logging.info('Uniqueness Percentage Set to %s', percentage_unique)
 
-    columns_to_drop = []
-    for column in df.columns:
-        count_unique = df[column].nunique()
-        if (count_unique / len(df.index)) >= percentage_unique:
-            columns_to_drop.append(column)
-            logging.info(
-                'Dropping Columns {column} due to high uniqueness'.format(
-                    column=column
-                )
-            )
+    if column_profile is None:
+        column_profile = ColumnProfile(df)
 
-    return df.drop(columns_to_drop, axis=1)
+    columns_to_drop = get_high_cardinality_numerical_columns(
+        column_profile, percentage_unique=percentage_unique
+    )
+    if columns_to_drop:
+        logging.info(
+            'Dropping %d Columns due to high uniqueness: %s',
+            len(columns_to_drop), columns_to_drop
+        )
+
+    return _drop_profiled_columns(df, columns_to_drop)
 
 
-def remove_high_cardinality_categorical_columns(df, max_unique_values=20):
+@instrumented
+def remove_high_cardinality_categorical_columns(
+    df, max_unique_values=20, column_profile=None):
     """
         Purpose:
             Remove columns with the count of unique values
@@ -106,6 +115,8 @@ def remove_high_cardinality_categorical_columns(df, max_unique_values=20):
                 from
             max_unique_values (int): Integer of unique values
                 that is the threshold to remove column
+            column_profile (ColumnProfile): Optional precomputed
+                profile of df. If not passed, one is computed
         Return
             df (Pandas DataFrame): DataFrame with columns removed
                 based on thresholds
@@ -114,53 +125,77 @@ def remove_high_cardinality_categorical_columns(df, max_unique_values=20):
         'Removing Categorical Columns with a large number of '
         'options from DataFrame'
     )
-    logging.info(
-        'Uniqueness Threshold Set to {max_unique_values}'.format(
-            max_unique_values=max_unique_values
-        )
-    )
+    logging.info('Uniqueness Threshold Set to %s', max_unique_values)
 
-    columns_to_drop = []
-    for column in get_categorical_columns(df):
+    if column_profile is None:
+        column_profile = ColumnProfile(df)
 
-        if df[column].nunique() > max_unique_values:
-            columns_to_drop.append(column)
-            logging.info(
-                'Dropping Columns {column} due to too many '
-                'possibilities for categorical dataset'.format(
-                    column=column
-                )
-            )
+    columns_to_drop = get_high_cardinality_categorical_columns(
+        column_profile, max_unique_values=max_unique_values
+    )
+    if columns_to_drop:
+        logging.info(
+            'Dropping %d Columns due to too many possibilities for '
+            'categorical dataset: %s',
+            len(columns_to_drop), columns_to_drop
+        )
 
-    return df.drop(columns_to_drop, axis=1)
+    return _drop_profiled_columns(df, columns_to_drop)
 
 
-def remove_single_value_columns(df):
+@instrumented
+def remove_single_value_columns(df, column_profile=None):
     """
         Purpose:
             Remove columns with a single value
         Args:
             df (Pandas DataFrame): DataFrame to remove columns
                 from
+            column_profile (ColumnProfile): Optional precomputed
+                profile of df. If not passed, one is computed
         Return
             df (Pandas DataFrame): DataFrame with columns removed
     """
     logging.info('Removing Columns with One Value from DataFrame')
 
-    columns_to_drop = []
-    for column in df.columns:
-        if df[column].nunique() == 1:
-            columns_to_drop.append(column)
-            logging.info(
-                'Dropping Columns {column} with a single value'.format(
-                    column=column
-                )
-            )
+    if column_profile is None:
+        column_profile = ColumnProfile(df)
+
+    columns_to_drop = get_single_value_columns(column_profile)
+    if columns_to_drop:
+        logging.info(
+            'Dropping %d Columns with a single value: %s',
+            len(columns_to_drop), columns_to_drop
+        )
+
+    return _drop_profiled_columns(df, columns_to_drop)
+
+
+def _drop_profiled_columns(df, columns_to_drop):
+    """
+        Purpose:
+            Drop columns chosen from a ColumnProfile. The profile
+            may have been computed before earlier drops, so only
+            columns still in the DataFrame are dropped
+        Args:
+            df (Pandas DataFrame): DataFrame to remove columns
+                from
+            columns_to_drop (List of strings): Columns to drop
+        Return
+            df (Pandas DataFrame): DataFrame with columns removed
+    """
+
+    columns_to_drop = [
+        column for column in columns_to_drop if column in df.columns
+    ]
 
     return df.drop(columns_to_drop, axis=1)
 
 
-def remove_quantile_equality_columns(df, low_quantile=.05, high_quantile=.95):
+@instrumented
+def remove_quantile_equality_columns(
+    df, low_quantile=.05, high_quantile=.95, approximate=False,
+    quantile_sketch=None):
     """
         Purpose:
             Remove columns where the low quantile matches the
@@ -171,86 +206,85 @@ def remove_quantile_equality_columns(df, low_quantile=.05, high_quantile=.95):
                 from
             low_quantile (float): Percentage quantile to compare
             high_quantile (float): Percentage quantile to compare
+            approximate (bool): Use a KLL quantile sketch instead
+                of sorting every column. Defaults to False
+            quantile_sketch (ColumnQuantileSketch): Optional sketch
+                (e.g. built from chunks of a larger dataset) to read
+                the quantiles from instead of df
         Return
             df (Pandas DataFrame): DataFrame with columns removed
     """
     logging.info('Removing Columns with Equal Quantiles from DataFrame')
     logging.info(
-        'Quantiles set to Low: {low} and High: {high}'.format(
-            low=low_quantile,
-            high=high_quantile
-        )
+        'Quantiles set to Low: %s and High: %s', low_quantile, high_quantile
     )
 
-    quantiles_low = df.quantile(low_quantile)
-    quantiles_high = df.quantile(high_quantile)
-
-    columns_to_drop = []
-    for column in get_numeric_columns(df):
-        quantile_low = quantiles_low[column]
-        quantile_high = quantiles_high[column]
-        if quantile_low == quantile_high:
-            columns_to_drop.append(column)
+    columns_to_drop = get_quantile_equality_columns(
+        df, low_quantile=low_quantile, high_quantile=high_quantile,
+        approximate=approximate, quantile_sketch=quantile_sketch
+    )
 
-    return df.drop(columns_to_drop, axis=1)
+    return _drop_profiled_columns(df, columns_to_drop)
 
 
-def mask_outliers_numerical_columns(df, low_quantile=.05, high_quantile=.95):
+@instrumented
+def mask_outliers_numerical_columns(
+    df, low_quantile=.05, high_quantile=.95, approximate=False):
     """
         Purpose:
             Update outliers to be equal to the low_quantile and
-            high_quantile values specified.
+            high_quantile values specified. Use OutlierClipper
+            to reuse the same bounds on new data
         Args:
             df (Pandas DataFrame): DataFrame to update data
             low_quantile (float): Percentage quantile to set values
             high_quantile (float): Percentage quantile to set values
+            approximate (bool): Use a KLL quantile sketch instead
+                of sorting every column. Defaults to False
         Return
             df (Pandas DataFrame): DataFrame with columns updated
     """
     logging.info('Masking Outliers with Values in Quantiles')
-    logging.info(
-        'Quantiles set to Low: {low} and High: {high}'.format(
-            low=low_quantile,
-            high=high_quantile
-        )
-    )
 
-    outliers_low = (df < low_quantiles)
-    outliers_high = (df > high_quantiles)
+    outlier_clipper = OutlierClipper(
+        low_quantile=low_quantile, high_quantile=high_quantile,
+        approximate=approximate
+    )
 
-    df = df.mask(outliers_low, low_quantiles, axis=1)
-    df = df.mask(outliers_high, high_quantiles, axis=1)
+    return outlier_clipper.fit(df).transform(df.copy())
 
-    return df
 
-
-def convert_categorical_columns_to_dummies(df, drop_first=True):
+@instrumented
+def convert_categorical_columns_to_dummies(
+    df, drop_first=True, sparse_threshold=None):
     """
         Purpose:
             Convert Categorical Values into Dummies. Will also
             remove the initial column being converted. If
             remove first is true, will remove one of the
-            dummy variables to remove prevent multicollinearity
+            dummy variables to remove prevent multicollinearity.
+            Use CategoricalDummyEncoder to reuse the same columns
+            on new data
         Args:
             df (Pandas DataFrame): DataFrame to convert columns
             drop_first (bool): to remove or not remove a column
                 from dummies generated
+            sparse_threshold (int): Columns with more categories
+                than this are converted to pandas sparse dummies.
+                Defaults to None (all dummies dense)
         Return
             df (Pandas DataFrame): DataFrame with columns converted
     """
     logging.info('Converting Categorical Columns into Dummies')
 
-    for column in get_categorical_columns(df):
-        dummies = pd.get_dummies(
-            df[column], drop_first=drop_first,
-            prefix=column, prefix_sep=':'
-        )
-        df.drop([column], axis=1, inplace=True)
-        df = pd.concat([df, dummies], axis=1)
+    dummy_encoder = CategoricalDummyEncoder(
+        drop_first=drop_first, sparse_threshold=sparse_threshold
+    )
 
-    return df
+    return dummy_encoder.fit_transform(df)
 
 
+@instrumented
 def ensure_categorical_columns_all_string(df):
     """
         Purpose:
@@ -269,11 +303,13 @@ def ensure_categorical_columns_all_string(df):
     return df
 
 
+@instrumented
 def encode_categorical_columns_as_integer(df):
     """
         Purpose:
             Convert Categorical Values into single value
-            using sklearn LabelEncoder
+            using CategoricalIntegerEncoder. Use the encoder
+            directly to reuse the same codes on new data
         Args:
             df (Pandas DataFrame): DataFrame to convert columns
         Return
@@ -281,23 +317,18 @@ def encode_categorical_columns_as_integer(df):
     """
     logging.info('Converting Categorical Columns into Encoded Column')
 
-    lable_encoder_object = LabelEncoder()
-    for column in get_categorical_columns(df):
-        column_encoder = lable_encoder_object.fit(df[column])
-        df['LabelEncoded:{0}'.format(column)] =\
-            column_encoder.transform(df[column])
-        df.drop([column], axis=1, inplace=True)
-
-    return df
+    return CategoricalIntegerEncoder().fit_transform(df)
 
 
+@instrumented
 def replace_null_values_numeric_columns(df, replace_operation='median'):
     """
         Purpose:
             Replace all null values in a dataframe with other
             values. Options include 0, mean, and median; the
             default operation converts numeric columns to
-            median
+            median. Use NullImputer to reuse the same fill
+            values on new data
         Args:
             df (Pandas DataFrame): DataFrame to remove columns
                 from
@@ -307,28 +338,18 @@ def replace_null_values_numeric_columns(df, replace_operation='median'):
             df (Pandas DataFrame): DataFrame with nulls replaced
     """
     logging.info(
-        'Replacing Null Values of Numeric Columns with Operation: '
-        '{replace_op}'.format(
-            replace_op=replace_operation
-        )
+        'Replacing Null Values of Numeric Columns with Operation: %s',
+        replace_operation
     )
 
-    categorical_columns = get_categorical_columns(df)
-    null_columns = get_columns_with_null_values(df)
-
-    for column in (null_columns.keys() - categorical_columns):
-        logging.info(
-            'Filling Nulls in Column {column}'.format(column=column))
-        if replace_operation == '0':
-            df[column].fillna(0, inplace=True)
-        elif replace_operation == 'median':
-            df[column].fillna(df[column].median(), inplace=True)
-        elif replace_operation == 'mean':
-            df[column].fillna(df[column].mean(), inplace=True)
+    null_imputer = NullImputer(
+        numeric_operation=replace_operation, categorical_value=None
+    )
 
-    return df
+    return null_imputer.fit_transform(df)
 
 
+@instrumented
 def replace_null_values_categorical_columns(df):
     """
         Purpose:
@@ -336,8 +357,6 @@ def replace_null_values_categorical_columns(df):
         Args:
             df (Pandas DataFrame): DataFrame to remove columns
                 from
-            replace_operation (string/enum): operation to perform
-                in replacing null values in the dataframe
         Return
             df (Pandas DataFrame): DataFrame with nulls replaced
     """
@@ -345,21 +364,1545 @@ def replace_null_values_categorical_columns(df):
         'Replacing Null Values of Categorical Columns with "Unknown"'
     )
 
-    numeric_columns = get_numeric_columns(df)
-    null_columns = get_columns_with_null_values(df)
+    null_imputer = NullImputer(
+        numeric_operation=None, categorical_value='Unknown'
+    )
+
+    return null_imputer.fit_transform(df)
+
+
+@instrumented
+def optimize_dataframe_memory(
+    df, categorical_threshold=.5, string_dtype=None):
+    """
+        Purpose:
+            Reduce the memory of a DataFrame by downcasting numeric
+            columns to the smallest dtype that holds their values
+            exactly and converting low cardinality text columns to
+            category. All columns are converted with one astype
+        Args:
+            df (Pandas DataFrame): DataFrame to optimize
+            categorical_threshold (float): Text columns with a
+                unique value percentage at or under this are
+                converted to category. Defaults to .5 (50%)
+            string_dtype (string): dtype for the remaining text
+                columns, e.g. "string[pyarrow]". Defaults to None
+                (left as is)
+        Return
+            df (Pandas DataFrame): DataFrame with columns converted
+            memory_report (Pandas DataFrame): dtype and bytes before
+                and after for each column
+            dtype_map (Dict): dtype per converted column, can be
+                passed as dtype= to pd.read_csv so later chunk loads
+                arrive optimized
+    """
+    logging.info('Optimizing DataFrame Memory')
+
+    dtype_map = get_memory_optimized_dtypes(
+        df, categorical_threshold=categorical_threshold,
+        string_dtype=string_dtype
+    )
+
+    bytes_before = df.memory_usage(deep=True, index=False)
+    dtypes_before = df.dtypes.astype(str)
+    df = df.astype(dtype_map)
+
+    memory_report = pd.DataFrame({
+        'dtype_before': dtypes_before,
+        'dtype_after': df.dtypes.astype(str),
+        'bytes_before': bytes_before,
+        'bytes_after': df.memory_usage(deep=True, index=False),
+    })
+    logging.info(
+        'DataFrame Memory Reduced from %d to %d Bytes',
+        memory_report['bytes_before'].sum(),
+        memory_report['bytes_after'].sum()
+    )
+
+    return df, memory_report, dtype_map
+
+
+@instrumented
+def get_memory_optimized_dtypes(
+    df, categorical_threshold=.5, string_dtype=None):
+    """
+        Purpose:
+            Get the smallest safe dtype for each column. Integer
+            columns are sized from their min/max (nullable integer
+            columns keep a nullable dtype), float64 columns
+            become float32 only if every value round trips exactly,
+            and low cardinality text columns become category
+        Args:
+            df (Pandas DataFrame): DataFrame to describe
+            categorical_threshold (float): Text columns with a
+                unique value percentage at or under this are
+                converted to category. Defaults to .5 (50%)
+            string_dtype (string): dtype for the remaining text
+                columns. Defaults to None (left as is)
+        Return
+            dtype_map (Dict): dtype per column that can be shrunk
+    """
+    logging.info('Getting Memory Optimized dtypes for DataFrame')
+
+    dtype_map = {}
+
+    integer_df = df.select_dtypes(include=['integer'])
+    if len(integer_df.columns):
+        min_values = integer_df.min()
+        max_values = integer_df.max()
+        for column in integer_df.columns:
+            if pd.isna(min_values[column]):
+                continue
+            # Nullable (extension) integer columns keep a nullable dtype
+            nullable = isinstance(
+                integer_df[column].dtype, pd.api.extensions.ExtensionDtype
+            )
+            for integer_dtype in (
+                'uint8', 'uint16', 'uint32', 'int8', 'int16', 'int32'
+            ):
+                integer_info = np.iinfo(integer_dtype)
+                if (
+                    integer_info.min <= min_values[column] and
+                    max_values[column] <= integer_info.max
+                ):
+                    if nullable:
+                        integer_dtype = integer_dtype.capitalize().replace(
+                            'Uint', 'UInt'
+                        )
+                    if integer_dtype != str(integer_df[column].dtype):
+                        dtype_map[column] = integer_dtype
+                    break
+
+    for column in df.select_dtypes(include=['float64']).columns:
+        values = df[column].to_numpy()
+        if np.array_equal(
+            values.astype(np.float32).astype(np.float64), values,
+            equal_nan=True
+        ):
+            dtype_map[column] = 'float32'
+
+    text_columns = df.select_dtypes(include=['object', 'string']).columns
+    if len(text_columns) and len(df.index):
+        unique_percentages = df[text_columns].nunique() / len(df.index)
+        for column in text_columns:
+            if unique_percentages[column] <= categorical_threshold:
+                dtype_map[column] = 'category'
+            elif string_dtype is not None:
+                dtype_map[column] = string_dtype
+
+    return dtype_map
+
+###
+# Fitted Transformer Classes
+###
+
+class OutlierClipper(object):
+    """
+        Purpose:
+            Clip outliers in numeric columns to per column bounds
+            learned once with fit. The bounds can be saved and
+            loaded so scoring never recomputes quantiles
+        Attributes:
+            low_quantile (float): Quantile used for the lower bound
+            high_quantile (float): Quantile used for the upper bound
+            approximate (bool): Fit bounds from KLL quantile sketches
+            columns (List of strings): Columns clipped
+            lower_bounds (Numpy Array): Lower bound per column
+            upper_bounds (Numpy Array): Upper bound per column
+    """
+
+    def __init__(self, low_quantile=.05, high_quantile=.95, approximate=False):
+        """
+            Purpose:
+                Create an unfitted clipper
+            Args:
+                low_quantile (float): Quantile used for the lower
+                    bound. Defaults to .05
+                high_quantile (float): Quantile used for the upper
+                    bound. Defaults to .95
+                approximate (bool): Fit bounds from KLL quantile
+                    sketches. Defaults to False
+        """
+
+        self.low_quantile = low_quantile
+        self.high_quantile = high_quantile
+        self.approximate = approximate
+        self.columns = None
+        self.lower_bounds = None
+        self.upper_bounds = None
 
-    for column in (null_columns.keys() - numeric_columns):
+    @instrumented
+    def fit(self, df):
+        """
+            Purpose:
+                Learn the lower and upper bound of every numeric
+                column
+            Args:
+                df (Pandas DataFrame): DataFrame to learn bounds from
+            Return
+                self (OutlierClipper): Fitted clipper
+        """
         logging.info(
-            'Filling Nulls in Column {column}'.format(column=column))
-        df[column].fillna('Unknown', inplace=True)
-        df[column].replace([np.nan], ['Unknown'], inplace=True)
+            'Fitting Outlier Clipper with Quantiles Low: %s and High: %s',
+            self.low_quantile, self.high_quantile
+        )
 
-    return df
+        quantiles = get_column_quantiles(
+            df, [self.low_quantile, self.high_quantile],
+            approximate=self.approximate
+        )
+
+        # Columns without values have NaN quantiles; leave them unclipped
+        self.columns = list(quantiles.columns)
+        self.lower_bounds =\
+            np.nan_to_num(quantiles.iloc[0].to_numpy(), nan=-np.inf)
+        self.upper_bounds =\
+            np.nan_to_num(quantiles.iloc[1].to_numpy(), nan=np.inf)
+
+        return self
+
+    @instrumented
+    def transform(self, df):
+        """
+            Purpose:
+                Clip the fitted columns to their bounds. float64
+                columns are clipped with a single vectorized clip;
+                other columns are clipped one at a time and keep
+                their dtype (integer bounds are rounded inwards).
+                df is updated in place
+            Args:
+                df (Pandas DataFrame): DataFrame to clip
+            Return
+                df (Pandas DataFrame): DataFrame with columns clipped
+        """
+
+        if self.columns is None:
+            raise ValueError('OutlierClipper must be fit before transform')
+
+        is_float64 = np.array(
+            [df[column].dtype == np.float64 for column in self.columns],
+            dtype=bool
+        )
+        float_columns = [
+            column for column, is_float in zip(self.columns, is_float64)
+            if is_float
+        ]
+        if float_columns:
+            df[float_columns] = np.clip(
+                df[float_columns].to_numpy(),
+                self.lower_bounds[is_float64], self.upper_bounds[is_float64]
+            )
+
+        for column, is_float, lower_bound, upper_bound in zip(
+            self.columns, is_float64, self.lower_bounds, self.upper_bounds):
+            if is_float:
+                continue
+            if pd.api.types.is_integer_dtype(df[column].dtype):
+                lower_bound = np.ceil(lower_bound)
+                upper_bound = np.floor(upper_bound)
+            df[column] = df[column].clip(
+                lower=None if np.isinf(lower_bound) else lower_bound,
+                upper=None if np.isinf(upper_bound) else upper_bound
+            ).astype(df[column].dtype)
+
+        return df
+
+    @instrumented
+    def fit_transform(self, df):
+        """
+            Purpose:
+                Fit the clipper and clip df in place
+            Args:
+                df (Pandas DataFrame): DataFrame to fit and clip
+            Return
+                df (Pandas DataFrame): DataFrame with columns clipped
+        """
+
+        return self.fit(df).transform(df)
+
+    def save(self, filename):
+        """
+            Purpose:
+                Save the fitted bounds to a JSON file
+            Args:
+                filename (String): File to store the bounds in
+            Return
+                N/A
+        """
+
+        _store_json_artifact(filename, {
+            'low_quantile': self.low_quantile,
+            'high_quantile': self.high_quantile,
+            'approximate': self.approximate,
+            'columns': self.columns,
+            'lower_bounds': self.lower_bounds.tolist(),
+            'upper_bounds': self.upper_bounds.tolist(),
+        })
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Purpose:
+                Load bounds saved with save
+            Args:
+                filename (String): File the bounds are stored in
+            Return
+                outlier_clipper (OutlierClipper): Fitted clipper
+        """
+
+        artifact = _load_json_artifact(filename)
+        outlier_clipper = cls(
+            low_quantile=artifact['low_quantile'],
+            high_quantile=artifact['high_quantile'],
+            approximate=artifact['approximate'],
+        )
+        outlier_clipper.columns = artifact['columns']
+        outlier_clipper.lower_bounds =\
+            np.array(artifact['lower_bounds'], dtype=np.float64)
+        outlier_clipper.upper_bounds =\
+            np.array(artifact['upper_bounds'], dtype=np.float64)
+
+        return outlier_clipper
+
+
+class CategoricalDummyEncoder(object):
+    """
+        Purpose:
+            One-hot encode categorical columns with a category
+            vocabulary frozen at fit. transform looks up category
+            codes with a hashed pd.Index per column (built once at
+            fit), builds each dummy block directly from its codes, and
+            concatenates once, so scoring batches get the identical
+            column layout. Unseen and null values get no dummy set
+        Attributes:
+            drop_first (bool): Drop the first category of each column
+            sparse_threshold (int): Columns with more categories than
+                this get pandas sparse dummies. None for all dense
+            vocabularies (Dict): Sorted categories per column
+            feature_names (List of strings): Output dummy columns
+    """
+
+    def __init__(self, drop_first=True, sparse_threshold=None):
+        """
+            Purpose:
+                Create an unfitted encoder
+            Args:
+                drop_first (bool): Drop the first category of each
+                    column. Defaults to True
+                sparse_threshold (int): Columns with more categories
+                    than this get pandas sparse dummies. Defaults to
+                    None (all dense)
+        """
+
+        self.drop_first = drop_first
+        self.sparse_threshold = sparse_threshold
+        self.vocabularies = None
+        self._vocabulary_indexes = {}
+
+    @property
+    def feature_names(self):
+        """
+            Purpose:
+                Dummy column names ("column:category") in output
+                order
+        """
+
+        return [
+            '{column}:{category}'.format(column=column, category=category)
+            for column, categories in self._encoded_categories()
+            for category in categories
+        ]
+
+    @instrumented
+    def fit(self, df):
+        """
+            Purpose:
+                Learn the categories of every categorical column
+            Args:
+                df (Pandas DataFrame): DataFrame to learn from
+            Return
+                self (CategoricalDummyEncoder): Fitted encoder
+        """
+        logging.info('Fitting Categorical Dummy Encoder')
+
+        numeric_columns = set(get_numeric_columns(df))
+        self._set_vocabularies({
+            column: pd.Categorical(df[column]).categories.tolist()
+            for column in df.columns if column not in numeric_columns
+        })
+
+        return self
+
+    @instrumented
+    def transform(self, df):
+        """
+            Purpose:
+                Replace the fitted categorical columns with dummies
+            Args:
+                df (Pandas DataFrame): DataFrame to convert columns
+            Return
+                df (Pandas DataFrame): DataFrame with columns converted
+        """
+
+        dummy_blocks = []
+        for column, categories, encoded_rows, codes in\
+            self._get_dummy_codes(df):
+            block_columns = [
+                '{column}:{category}'.format(
+                    column=column, category=category
+                )
+                for category in categories
+            ]
+
+            if (
+                self.sparse_threshold is not None and
+                len(self.vocabularies[column]) > self.sparse_threshold
+            ):
+                block_matrix = scipy.sparse.csc_matrix(
+                    (np.ones(len(encoded_rows), dtype=bool),
+                        (encoded_rows, codes)),
+                    shape=(len(df.index), len(categories))
+                )
+                dummy_blocks.append(pd.DataFrame.sparse.from_spmatrix(
+                    block_matrix, index=df.index, columns=block_columns
+                ))
+            else:
+                block_values = np.zeros(
+                    (len(df.index), len(categories)), dtype=bool
+                )
+                block_values[encoded_rows, codes] = True
+                dummy_blocks.append(pd.DataFrame(
+                    block_values, index=df.index, columns=block_columns
+                ))
+
+        return pd.concat(
+            [df.drop(list(self.vocabularies.keys()), axis=1)] + dummy_blocks,
+            axis=1
+        )
+
+    def transform_sparse_matrix(self, df):
+        """
+            Purpose:
+                Encode the fitted categorical columns as a scipy
+                CSR matrix with one column per feature_names entry
+            Args:
+                df (Pandas DataFrame): DataFrame to encode
+            Return
+                dummy_matrix (scipy.sparse.csr_matrix): Boolean dummy
+                    matrix with a row per row of df
+        """
+
+        row_indices = []
+        column_indices = []
+        offset = 0
+        for _, categories, encoded_rows, codes in self._get_dummy_codes(df):
+            row_indices.append(encoded_rows)
+            column_indices.append(codes + offset)
+            offset += len(categories)
+
+        row_indices = np.concatenate(row_indices + [np.empty(0, np.int64)])
+        column_indices =\
+            np.concatenate(column_indices + [np.empty(0, np.int64)])
+
+        return scipy.sparse.csr_matrix(
+            (np.ones(len(row_indices), dtype=bool),
+                (row_indices, column_indices)),
+            shape=(len(df.index), offset)
+        )
+
+    @instrumented
+    def fit_transform(self, df):
+        """
+            Purpose:
+                Fit the encoder and replace categorical columns
+                with dummies
+            Args:
+                df (Pandas DataFrame): DataFrame to fit and convert
+            Return
+                df (Pandas DataFrame): DataFrame with columns converted
+        """
+
+        return self.fit(df).transform(df)
+
+    def save(self, filename):
+        """
+            Purpose:
+                Save the fitted vocabularies to a JSON file
+            Args:
+                filename (String): File to store the vocabularies in
+            Return
+                N/A
+        """
+
+        _store_json_artifact(filename, {
+            'drop_first': self.drop_first,
+            'sparse_threshold': self.sparse_threshold,
+            'vocabularies': _vocabularies_to_json(self.vocabularies),
+        })
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Purpose:
+                Load vocabularies saved with save
+            Args:
+                filename (String): File the vocabularies are stored in
+            Return
+                dummy_encoder (CategoricalDummyEncoder): Fitted encoder
+        """
+
+        artifact = _load_json_artifact(filename)
+        dummy_encoder = cls(
+            drop_first=artifact['drop_first'],
+            sparse_threshold=artifact['sparse_threshold'],
+        )
+        # Stored as pairs so non-string column names survive JSON
+        dummy_encoder._set_vocabularies(
+            _vocabularies_from_json(artifact['vocabularies'])
+        )
+
+        return dummy_encoder
+
+    def _encoded_categories(self):
+        """
+            Purpose:
+                Get the categories that get a dummy column for each
+                fitted column, in output order
+            Args:
+                N/A
+            Return
+                encoded_categories (List of Tuples): Column and the
+                    categories encoded for it
+        """
+
+        first_category = 1 if self.drop_first else 0
+
+        return [
+            (column, categories[first_category:])
+            for column, categories in self.vocabularies.items()
+        ]
+
+    def _get_dummy_codes(self, df):
+        """
+            Purpose:
+                Look up the dummy column of every row for each fitted
+                column
+            Args:
+                df (Pandas DataFrame): DataFrame to encode
+            Return
+                dummy_codes (List of Tuples): Column, the categories
+                    encoded for it, the rows with a dummy set, and
+                    the position of that dummy within the column's
+                    categories
+        """
+
+        if self.vocabularies is None:
+            raise ValueError(
+                'CategoricalDummyEncoder must be fit before transform'
+            )
+
+        dummy_codes = []
+        for column, categories in self._encoded_categories():
+            codes = self._vocabulary_indexes[column].get_indexer(
+                df[column]
+            ).astype(np.int64)
+            if self.drop_first:
+                codes -= 1
+
+            encoded_rows = np.flatnonzero(codes >= 0)
+            dummy_codes.append(
+                (column, categories, encoded_rows, codes[encoded_rows])
+            )
+
+        return dummy_codes
+
+    def _set_vocabularies(self, vocabularies):
+        """
+            Purpose:
+                Set the vocabularies and build the lookup index for
+                each column once
+            Args:
+                vocabularies (Dict): Sorted categories per column
+            Return
+                N/A
+        """
+
+        self.vocabularies = vocabularies
+        self._vocabulary_indexes = {
+            column: pd.Index(categories)
+            for column, categories in vocabularies.items()
+        }
+
+
+class CategoricalIntegerEncoder(object):
+    """
+        Purpose:
+            Encode categorical columns as integer codes with a
+            category vocabulary learned at fit. Codes are positions
+            in the sorted vocabulary (the same codes LabelEncoder
+            gives) and are looked up with a hashed pd.Index per
+            column. Unseen and null values get unknown_code instead
+            of raising
+        Attributes:
+            unknown_code (int): Code for values not in the vocabulary
+            vocabularies (Dict): Sorted categories per column
+    """
+
+    def __init__(self, unknown_code=-1):
+        """
+            Purpose:
+                Create an unfitted encoder
+            Args:
+                unknown_code (int): Code for values not in the
+                    vocabulary. Defaults to -1
+        """
+
+        self.unknown_code = unknown_code
+        self.vocabularies = None
+        self._vocabulary_indexes = {}
+
+    @instrumented
+    def fit(self, df):
+        """
+            Purpose:
+                Learn the categories of every categorical column
+            Args:
+                df (Pandas DataFrame): DataFrame to learn from
+            Return
+                self (CategoricalIntegerEncoder): Fitted encoder
+        """
+        logging.info('Fitting Categorical Integer Encoder')
+
+        numeric_columns = set(get_numeric_columns(df))
+        self._set_vocabularies({
+            column: pd.Categorical(df[column]).categories.tolist()
+            for column in df.columns if column not in numeric_columns
+        })
+
+        return self
+
+    @instrumented
+    def transform(self, df):
+        """
+            Purpose:
+                Replace the fitted categorical columns with
+                "LabelEncoded:column" integer columns
+            Args:
+                df (Pandas DataFrame): DataFrame to convert columns
+            Return
+                df (Pandas DataFrame): DataFrame with columns converted
+        """
+
+        if self.vocabularies is None:
+            raise ValueError(
+                'CategoricalIntegerEncoder must be fit before transform'
+            )
+
+        encoded_df = pd.DataFrame(
+            {
+                'LabelEncoded:{0}'.format(column):
+                    self.encode_values(column, df[column])
+                for column in self.vocabularies
+            },
+            index=df.index
+        )
+
+        return pd.concat(
+            [df.drop(list(self.vocabularies.keys()), axis=1), encoded_df],
+            axis=1
+        )
+
+    def encode_values(self, column, values):
+        """
+            Purpose:
+                Encode values of one fitted column, e.g. a single
+                record during online scoring
+            Args:
+                column (string): Fitted column the values belong to
+                values (Array-like): Values to encode
+            Return
+                codes (Numpy Array): int64 code per value
+        """
+
+        codes = self._vocabulary_indexes[column].get_indexer(
+            pd.Index(values)
+        ).astype(np.int64)
+        codes[codes == -1] = self.unknown_code
+
+        return codes
+
+    @instrumented
+    def fit_transform(self, df):
+        """
+            Purpose:
+                Fit the encoder and encode categorical columns
+            Args:
+                df (Pandas DataFrame): DataFrame to fit and convert
+            Return
+                df (Pandas DataFrame): DataFrame with columns converted
+        """
+
+        return self.fit(df).transform(df)
+
+    def save(self, filename):
+        """
+            Purpose:
+                Save the fitted vocabularies to a JSON file
+            Args:
+                filename (String): File to store the vocabularies in
+            Return
+                N/A
+        """
+
+        _store_json_artifact(filename, {
+            'unknown_code': self.unknown_code,
+            'vocabularies': _vocabularies_to_json(self.vocabularies),
+        })
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Purpose:
+                Load vocabularies saved with save
+            Args:
+                filename (String): File the vocabularies are stored in
+            Return
+                integer_encoder (CategoricalIntegerEncoder): Fitted
+                    encoder
+        """
+
+        artifact = _load_json_artifact(filename)
+        integer_encoder = cls(unknown_code=artifact['unknown_code'])
+        integer_encoder._set_vocabularies(
+            _vocabularies_from_json(artifact['vocabularies'])
+        )
+
+        return integer_encoder
+
+    def _set_vocabularies(self, vocabularies):
+        """
+            Purpose:
+                Set the vocabularies and build the lookup index for
+                each column once
+            Args:
+                vocabularies (Dict): Sorted categories per column
+            Return
+                N/A
+        """
+
+        self.vocabularies = vocabularies
+        self._vocabulary_indexes = {
+            column: pd.Index(categories)
+            for column, categories in vocabularies.items()
+        }
+
+
+class NullImputer(object):
+    """
+        Purpose:
+            Replace null values with fill values learned at fit.
+            Numeric fill values come from one median()/mean() over
+            the numeric block, optionally within groups of a key
+            column, and are applied with a single fillna. The fill
+            values can be saved and loaded for scoring
+        Attributes:
+            numeric_operation (string): "median", "mean", or "0" for
+                numeric columns. None leaves numeric columns as is
+            categorical_value (string): Fill value for categorical
+                columns. None leaves categorical columns as is
+            group_column (string): Column to group numeric fill
+                values by. None for one fill value per column
+            fill_values (Dict): Fill value per column
+            group_fill_values (Pandas DataFrame): Numeric fill value
+                per group (row) and column, if grouped
+    """
+
+    def __init__(
+        self, numeric_operation='median', categorical_value='Unknown',
+        group_column=None):
+        """
+            Purpose:
+                Create an unfitted imputer
+            Args:
+                numeric_operation (string): "median", "mean", or "0".
+                    Defaults to "median"
+                categorical_value (string): Fill value for
+                    categorical columns. Defaults to "Unknown"
+                group_column (string): Column to group numeric fill
+                    values by. Defaults to None
+        """
+
+        if numeric_operation not in (None, 'median', 'mean', '0'):
+            raise ValueError(
+                'Unknown Null Replace Operation: {operation}'.format(
+                    operation=numeric_operation
+                )
+            )
+
+        self.numeric_operation = numeric_operation
+        self.categorical_value = categorical_value
+        self.group_column = group_column
+        self.fill_values = None
+        self.group_fill_values = None
+
+    @instrumented
+    def fit(self, df):
+        """
+            Purpose:
+                Learn the fill value of every column
+            Args:
+                df (Pandas DataFrame): DataFrame to learn from
+            Return
+                self (NullImputer): Fitted imputer
+        """
+        logging.info(
+            'Fitting Null Imputer with Operation: %s', self.numeric_operation
+        )
+
+        numeric_columns = set(get_numeric_columns(df))
+        numeric_columns.discard(self.group_column)
+        numeric_columns = [
+            column for column in df.columns if column in numeric_columns
+        ]
+        categorical_columns = [
+            column for column in df.columns
+            if column not in numeric_columns and column != self.group_column
+        ]
+
+        self.fill_values = {}
+        if self.numeric_operation is not None and numeric_columns:
+            numeric_df = df[numeric_columns]
+            if self.numeric_operation == '0':
+                self.fill_values.update(dict.fromkeys(numeric_columns, 0))
+            else:
+                self.fill_values.update(
+                    getattr(numeric_df, self.numeric_operation)().to_dict()
+                )
+                if self.group_column is not None:
+                    self.group_fill_values = getattr(
+                        numeric_df.groupby(df[self.group_column]),
+                        self.numeric_operation
+                    )()
+        if self.categorical_value is not None:
+            self.fill_values.update(
+                dict.fromkeys(categorical_columns, self.categorical_value)
+            )
+
+        return self
+
+    @instrumented
+    def transform(self, df):
+        """
+            Purpose:
+                Replace nulls in the fitted columns
+            Args:
+                df (Pandas DataFrame): DataFrame to replace nulls in
+            Return
+                df (Pandas DataFrame): DataFrame with nulls replaced
+        """
+
+        if self.fill_values is None:
+            raise ValueError('NullImputer must be fit before transform')
+
+        fill_values = {
+            column: value for column, value in self.fill_values.items()
+            if column in df.columns
+        }
+
+        new_categories = {
+            column: value for column, value in fill_values.items()
+            if isinstance(df[column].dtype, pd.CategoricalDtype) and
+            value not in df[column].cat.categories
+        }
+        if new_categories:
+            df = df.copy()
+            for column, value in new_categories.items():
+                df[column] = df[column].cat.add_categories([value])
+
+        if self.group_fill_values is not None:
+            group_columns = [
+                column for column in self.group_fill_values.columns
+                if column in df.columns
+            ]
+            group_fills = self.group_fill_values[group_columns].reindex(
+                df[self.group_column].to_numpy()
+            )
+            group_fills.index = df.index
+            df = df.fillna(group_fills)
+
+        return df.fillna(fill_values)
+
+    @instrumented
+    def fit_transform(self, df):
+        """
+            Purpose:
+                Fit the imputer and replace nulls
+            Args:
+                df (Pandas DataFrame): DataFrame to fit and replace
+                    nulls in
+            Return
+                df (Pandas DataFrame): DataFrame with nulls replaced
+        """
+
+        return self.fit(df).transform(df)
+
+    def save(self, filename):
+        """
+            Purpose:
+                Save the fitted fill values to a JSON file
+            Args:
+                filename (String): File to store the fill values in
+            Return
+                N/A
+        """
+
+        group_fill_values = None
+        if self.group_fill_values is not None:
+            group_fill_values = {
+                'groups': self.group_fill_values.index.tolist(),
+                'columns': self.group_fill_values.columns.tolist(),
+                'values': self.group_fill_values.to_numpy().tolist(),
+            }
+
+        _store_json_artifact(filename, {
+            'numeric_operation': self.numeric_operation,
+            'categorical_value': self.categorical_value,
+            'group_column': self.group_column,
+            'fill_values': [
+                (column, _to_json_scalar(value))
+                for column, value in self.fill_values.items()
+            ],
+            'group_fill_values': group_fill_values,
+        })
+
+    @classmethod
+    def load(cls, filename):
+        """
+            Purpose:
+                Load fill values saved with save
+            Args:
+                filename (String): File the fill values are stored in
+            Return
+                null_imputer (NullImputer): Fitted imputer
+        """
+
+        artifact = _load_json_artifact(filename)
+        null_imputer = cls(
+            numeric_operation=artifact['numeric_operation'],
+            categorical_value=artifact['categorical_value'],
+            group_column=artifact['group_column'],
+        )
+        null_imputer.fill_values = dict(artifact['fill_values'])
+
+        group_fill_values = artifact['group_fill_values']
+        if group_fill_values is not None:
+            null_imputer.group_fill_values = pd.DataFrame(
+                group_fill_values['values'],
+                index=group_fill_values['groups'],
+                columns=group_fill_values['columns'],
+                dtype=np.float64
+            )
+
+        return null_imputer
+
+
+def _to_json_scalar(value):
+    """
+        Purpose:
+            Convert numpy scalars to Python scalars for JSON
+        Args:
+            value (Any): Value to convert
+        Return
+            value (Any): Python scalar
+    """
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def _vocabularies_to_json(vocabularies):
+    """
+        Purpose:
+            Convert fitted vocabularies to JSON safe column and
+            category pairs. Timestamp and Timedelta categories (from
+            datetime columns) are tagged so they load back as the
+            same values
+        Args:
+            vocabularies (Dict): Sorted categories per column
+        Return
+            json_vocabularies (List of Lists): Column and JSON safe
+                categories pairs
+    """
+
+    json_vocabularies = []
+    for column, categories in vocabularies.items():
+        json_categories = []
+        for category in categories:
+            if isinstance(category, pd.Timestamp):
+                category = {'timestamp': category.isoformat()}
+            elif isinstance(category, pd.Timedelta):
+                category = {'timedelta': category.value}
+            json_categories.append(_to_json_scalar(category))
+        json_vocabularies.append([column, json_categories])
+
+    return json_vocabularies
+
+
+def _vocabularies_from_json(json_vocabularies):
+    """
+        Purpose:
+            Convert vocabularies stored with _vocabularies_to_json
+            back to categories per column
+        Args:
+            json_vocabularies (List of Lists): Column and JSON safe
+                categories pairs
+        Return
+            vocabularies (Dict): Sorted categories per column
+    """
+
+    vocabularies = {}
+    for column, json_categories in json_vocabularies:
+        categories = []
+        for category in json_categories:
+            if isinstance(category, dict) and 'timestamp' in category:
+                category = pd.Timestamp(category['timestamp'])
+            elif isinstance(category, dict) and 'timedelta' in category:
+                category = pd.Timedelta(category['timedelta'])
+            categories.append(category)
+        vocabularies[column] = categories
+
+    return vocabularies
+
+
+def _store_json_artifact(filename, artifact):
+    """
+        Purpose:
+            Store fitted transformer state as JSON
+        Args:
+            filename (String): File to store the artifact in
+            artifact (Dict): JSON serializable state
+        Return
+            N/A
+    """
+    logging.info('Storing Fitted Artifact to %s', filename)
+
+    with open(filename, 'w') as artifact_file:
+        json.dump(artifact, artifact_file)
+
+
+def _load_json_artifact(filename):
+    """
+        Purpose:
+            Load fitted transformer state stored as JSON
+        Args:
+            filename (String): File the artifact is stored in
+        Return
+            artifact (Dict): Stored state
+    """
+    logging.info('Loading Fitted Artifact from %s', filename)
+
+    with open(filename, 'r') as artifact_file:
+        return json.load(artifact_file)
+
+###
+# Column Profile Functions
+###
+
+class ColumnProfile(object):
+    """
+        Purpose:
+            Summary statistics for every column in a DataFrame,
+            computed once with vectorized DataFrame reductions.
+            The profile can be passed to the remove_* helpers so
+            each decides on its drops without scanning the data
+            again
+        Attributes:
+            row_count (int): Number of rows in the DataFrame
+            columns (List of strings): Columns profiled, in
+                DataFrame order
+            numeric_columns (List of strings): Numeric columns
+            categorical_columns (List of strings): Non-numeric
+                columns
+            null_counts (Pandas Series): Null count per column
+            unique_counts (Pandas Series): Count of distinct
+                non-null values per column
+            min_values (Pandas Series): Minimum of each numeric
+                column
+            max_values (Pandas Series): Maximum of each numeric
+                column
+    """
+
+    def __init__(self, df):
+        """
+            Purpose:
+                Profile the passed in DataFrame
+            Args:
+                df (Pandas DataFrame): DataFrame to profile
+        """
+        logging.info('Profiling DataFrame Columns')
+
+        numeric_df = df._get_numeric_data()
+        numeric_columns = set(numeric_df.columns)
+
+        self.row_count = len(df.index)
+        self.columns = list(df.columns)
+        self.numeric_columns = [
+            column for column in self.columns if column in numeric_columns
+        ]
+        self.categorical_columns = [
+            column for column in self.columns
+            if column not in numeric_columns
+        ]
+        self.null_counts = df.isnull().sum()
+        self.unique_counts = df.nunique()
+        self.min_values = numeric_df.min()
+        self.max_values = numeric_df.max()
+
+    def get_dtype_class(self, column):
+        """
+            Purpose:
+                Get the dtype class (numeric or categorical) of
+                a profiled column
+            Args:
+                column (string): Column to classify
+            Return
+                dtype_class (string): "numeric" or "categorical"
+        """
+
+        if column in self.numeric_columns:
+            return 'numeric'
+
+        return 'categorical'
+
+
+@instrumented
+def get_overly_null_columns(column_profile, percentage_null=.25):
+    """
+        Purpose:
+            Get the columns where the count of null values exceeds
+            the passed in percentage
+        Args:
+            column_profile (ColumnProfile): Profile of the DataFrame
+            percentage_null (float): Percentage of null values
+                that will be the threshold for removing or
+                keeping columns. Defaults to .25 (25%)
+        Return
+            overly_null_columns (List of strings): Columns over
+                the threshold
+    """
+
+    if not column_profile.row_count:
+        return []
+
+    null_percentages = column_profile.null_counts / column_profile.row_count
+
+    return list(null_percentages.index[null_percentages > percentage_null])
+
+
+@instrumented
+def get_high_cardinality_numerical_columns(
+    column_profile, percentage_unique=1):
+    """
+        Purpose:
+            Get the columns where the count of unique values
+            compared to the count of rows meets the passed in
+            percentage
+        Args:
+            column_profile (ColumnProfile): Profile of the DataFrame
+            percentage_unique (float): Percentage of unique values
+                that will be the threshold for removing or
+                keeping columns. Defaults to 1 (100%)
+        Return
+            high_cardinality_columns (List of strings): Columns
+                at or over the threshold
+    """
+
+    if not column_profile.row_count:
+        return []
+
+    unique_percentages =\
+        column_profile.unique_counts / column_profile.row_count
+
+    return list(
+        unique_percentages.index[unique_percentages >= percentage_unique]
+    )
+
+
+@instrumented
+def get_high_cardinality_categorical_columns(
+    column_profile, max_unique_values=20):
+    """
+        Purpose:
+            Get the categorical columns where the count of unique
+            values is over the passed in threshold
+        Args:
+            column_profile (ColumnProfile): Profile of the DataFrame
+            max_unique_values (int): Integer of unique values
+                that is the threshold to remove column
+        Return
+            high_cardinality_columns (List of strings): Columns
+                over the threshold
+    """
+
+    unique_counts =\
+        column_profile.unique_counts[column_profile.categorical_columns]
+
+    return list(unique_counts.index[unique_counts > max_unique_values])
+
+
+@instrumented
+def get_single_value_columns(column_profile):
+    """
+        Purpose:
+            Get the columns with a single distinct value
+        Args:
+            column_profile (ColumnProfile): Profile of the DataFrame
+        Return
+            single_value_columns (List of strings): Columns with
+                one value
+    """
+
+    unique_counts = column_profile.unique_counts
+
+    return list(unique_counts.index[unique_counts == 1])
+
+
+@instrumented
+def get_quantile_equality_columns(
+    df, low_quantile=.05, high_quantile=.95, approximate=False,
+    quantile_sketch=None):
+    """
+        Purpose:
+            Get the numeric columns where the low quantile matches
+            the high quantile
+        Args:
+            df (Pandas DataFrame): DataFrame to describe
+            low_quantile (float): Percentage quantile to compare
+            high_quantile (float): Percentage quantile to compare
+            approximate (bool): Use a KLL quantile sketch instead
+                of sorting every column. Defaults to False
+            quantile_sketch (ColumnQuantileSketch): Optional sketch
+                to read the quantiles from instead of df
+        Return
+            quantile_equality_columns (List of strings): Columns
+                with equal quantiles
+    """
+
+    if quantile_sketch is not None:
+        quantiles = quantile_sketch.quantiles([low_quantile, high_quantile])
+    else:
+        quantiles = get_column_quantiles(
+            df, [low_quantile, high_quantile], approximate=approximate
+        )
+
+    equal_quantiles = quantiles.iloc[0] == quantiles.iloc[1]
+
+    return list(equal_quantiles.index[equal_quantiles])
+
+
+@instrumented
+def get_columns_to_drop(
+    column_profile, percentage_null=.25, percentage_unique=1,
+    max_unique_values=20):
+    """
+        Purpose:
+            Get every column that remove_overly_null_columns,
+            remove_high_cardinality_numerical_columns,
+            remove_high_cardinality_categorical_columns, and
+            remove_single_value_columns would drop from the
+            profiled data
+        Args:
+            column_profile (ColumnProfile): Profile of the DataFrame
+            percentage_null (float): Null percentage threshold.
+                Defaults to .25 (25%)
+            percentage_unique (float): Unique percentage threshold.
+                Defaults to 1 (100%)
+            max_unique_values (int): Unique value threshold for
+                categorical columns. Defaults to 20
+        Return
+            columns_to_drop (List of strings): Columns to drop, in
+                profile order
+    """
+    logging.info('Getting Columns to Drop from Column Profile')
+
+    columns_to_drop = set(
+        get_overly_null_columns(
+            column_profile, percentage_null=percentage_null
+        )
+    )
+    columns_to_drop.update(
+        get_high_cardinality_numerical_columns(
+            column_profile, percentage_unique=percentage_unique
+        )
+    )
+    columns_to_drop.update(
+        get_high_cardinality_categorical_columns(
+            column_profile, max_unique_values=max_unique_values
+        )
+    )
+    columns_to_drop.update(get_single_value_columns(column_profile))
+
+    return [
+        column for column in column_profile.columns
+        if column in columns_to_drop
+    ]
+
+###
+# Streaming Column Profile Functions
+###
+
+class StreamingColumnProfile(ColumnProfile):
+    """
+        Purpose:
+            ColumnProfile built from chunks of rows (e.g.
+            pd.read_csv(chunksize=...) or Parquet row groups) so
+            columns can be pruned on data larger than memory.
+            Memory is bounded by the chunk size and the distinct
+            count sketches. Profiles from separate partitions can be
+            combined with merge. unique_counts are exact up to
+            exact_limit distinct values and HyperLogLog estimates
+            above that, so percentage_unique thresholds of 1 should
+            be loosened slightly (e.g. .99) for streamed data
+        Attributes:
+            precision (int): HyperLogLog precision per column
+            exact_limit (int): Distinct values counted exactly per
+                column
+    """
+
+    def __init__(self, precision=14, exact_limit=1024):
+        """
+            Purpose:
+                Create an empty streaming profile
+            Args:
+                precision (int): HyperLogLog precision per column.
+                    Defaults to 14
+                exact_limit (int): Distinct values counted exactly
+                    per column. Defaults to 1024
+        """
+
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.row_count = 0
+        self.columns = []
+        self._numeric_flags = {}
+        self._null_counts = {}
+        self._sketches = {}
+        self._min_values = pd.Series(dtype=np.float64)
+        self._max_values = pd.Series(dtype=np.float64)
+
+    def update(self, chunk):
+        """
+            Purpose:
+                Add a chunk of rows to the profile
+            Args:
+                chunk (Pandas DataFrame): Chunk of rows to profile
+            Return
+                N/A
+        """
+
+        numeric_chunk = chunk._get_numeric_data()
+        numeric_columns = set(numeric_chunk.columns)
+        null_counts = chunk.isnull().sum()
+
+        for column in chunk.columns:
+            if column not in self._sketches:
+                self.columns.append(column)
+                self._numeric_flags[column] = True
+                self._null_counts[column] = self.row_count
+                self._sketches[column] = HyperLogLog(
+                    precision=self.precision, exact_limit=self.exact_limit
+                )
+
+            self._numeric_flags[column] &= column in numeric_columns
+            self._null_counts[column] += int(null_counts[column])
+            self._sketches[column].update(hash_column_values(chunk[column]))
+
+        for column in set(self.columns) - set(chunk.columns):
+            self._null_counts[column] += len(chunk.index)
+
+        self.row_count += len(chunk.index)
+        self._update_min_max(numeric_chunk.min(), numeric_chunk.max())
+
+    def merge(self, other):
+        """
+            Purpose:
+                Merge a profile of another partition of the same
+                data into this profile
+            Args:
+                other (StreamingColumnProfile): Profile to merge
+            Return
+                N/A
+        """
+
+        for column in self.columns:
+            if column not in other._sketches:
+                self._null_counts[column] += other.row_count
+
+        for column in other.columns:
+            if column not in self._sketches:
+                self.columns.append(column)
+                self._numeric_flags[column] = True
+                self._null_counts[column] = self.row_count
+                self._sketches[column] = HyperLogLog(
+                    precision=self.precision, exact_limit=self.exact_limit
+                )
+
+            self._numeric_flags[column] &= other._numeric_flags[column]
+            self._null_counts[column] += other._null_counts[column]
+            self._sketches[column].merge(other._sketches[column])
+
+        self.row_count += other.row_count
+        self._update_min_max(other._min_values, other._max_values)
+
+    @property
+    def numeric_columns(self):
+        """
+            Purpose:
+                Numeric columns (numeric in every chunk)
+        """
+
+        return [
+            column for column in self.columns
+            if self._numeric_flags[column]
+        ]
+
+    @property
+    def categorical_columns(self):
+        """
+            Purpose:
+                Non-numeric columns
+        """
+
+        return [
+            column for column in self.columns
+            if not self._numeric_flags[column]
+        ]
+
+    @property
+    def null_counts(self):
+        """
+            Purpose:
+                Null count per column
+        """
+
+        return pd.Series(self._null_counts, index=self.columns, dtype=np.int64)
+
+    @property
+    def unique_counts(self):
+        """
+            Purpose:
+                Distinct non-null count per column
+        """
+
+        unique_counts = pd.Series(
+            {
+                column: sketch.count()
+                for column, sketch in self._sketches.items()
+            },
+            index=self.columns, dtype=np.int64
+        )
+
+        # Estimates can never exceed the count of non-null values
+        return unique_counts.clip(upper=self.row_count - self.null_counts)
+
+    @property
+    def min_values(self):
+        """
+            Purpose:
+                Minimum of each numeric column
+        """
+
+        return self._min_values.reindex(self.numeric_columns)
+
+    @property
+    def max_values(self):
+        """
+            Purpose:
+                Maximum of each numeric column
+        """
+
+        return self._max_values.reindex(self.numeric_columns)
+
+    def _update_min_max(self, min_values, max_values):
+        """
+            Purpose:
+                Combine per column min/max values into the profile
+            Args:
+                min_values (Pandas Series): Minimum per column
+                max_values (Pandas Series): Maximum per column
+            Return
+                N/A
+        """
+
+        self._min_values = pd.concat(
+            [self._min_values, min_values], axis=1
+        ).min(axis=1)
+        self._max_values = pd.concat(
+            [self._max_values, max_values], axis=1
+        ).max(axis=1)
+
+
+@instrumented
+def profile_dataframe_chunks(chunks, precision=14, exact_limit=1024):
+    """
+        Purpose:
+            Build a StreamingColumnProfile from an iterator of
+            DataFrame chunks. The result can be passed to
+            get_columns_to_drop or the get_* column functions to
+            get the same drop decisions as the remove_* helpers
+        Args:
+            chunks (Iterator of Pandas DataFrames): Chunks of rows,
+                e.g. pd.read_csv(filename, chunksize=100000) or
+                iterate_parquet_row_groups(filename)
+            precision (int): HyperLogLog precision per column.
+                Defaults to 14
+            exact_limit (int): Distinct values counted exactly per
+                column. Defaults to 1024
+        Return
+            column_profile (StreamingColumnProfile): Profile of
+                all chunks
+    """
+    logging.info('Profiling DataFrame Columns from Chunks')
+
+    column_profile = StreamingColumnProfile(
+        precision=precision, exact_limit=exact_limit
+    )
+    for chunk in chunks:
+        column_profile.update(chunk)
+
+    logging.info('Profiled %d Rows from Chunks', column_profile.row_count)
+
+    return column_profile
+
+
+def iterate_parquet_row_groups(filename, columns=None):
+    """
+        Purpose:
+            Read a Parquet file one row group at a time. Requires
+            pyarrow
+        Args:
+            filename (string): Parquet file to read
+            columns (List of strings): Columns to read. Defaults
+                to all columns
+        Return
+            chunks (Generator of Pandas DataFrames): One DataFrame
+                per row group
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(filename)
+    for row_group in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(
+            row_group, columns=columns
+        ).to_pandas()
 
 ###
 # Describe DataFrame Functions
 ###
 
+@instrumented
 def get_categorical_columns(df):
     """
         Purpose:
@@ -376,6 +1919,7 @@ def get_categorical_columns(df):
     return list(set(df.columns) - set(get_numeric_columns(df)))
 
 
+@instrumented
 def get_numeric_columns(df):
     """
         Purpose:
@@ -392,6 +1936,41 @@ def get_numeric_columns(df):
     return list(set(df._get_numeric_data().columns))
 
 
+@instrumented
+def get_column_quantiles(df, quantiles, approximate=False, k=200):
+    """
+        Purpose:
+            Get every requested quantile of the numeric columns in
+            a DataFrame in one pass. Exact quantiles sort each column
+            once for all quantiles; approximate quantiles are read
+            from a KLL sketch per column instead of sorting. Boolean
+            columns have no quantiles and are left out
+        Args:
+            df (Pandas DataFrame): DataFrame to describe
+            quantiles (List of floats): Quantiles between 0 and 1
+            approximate (bool): Use KLL quantile sketches. Defaults
+                to False
+            k (int): Size of the KLL top compactor when approximate
+                (~1.7 / k rank error). Defaults to 200
+        Return
+            column_quantiles (Pandas DataFrame): DataFrame indexed by
+                quantile with a column per numeric column
+    """
+    logging.info('Getting Column Quantiles from DataFrame')
+
+    numeric_df = df._get_numeric_data().select_dtypes(
+        exclude=['bool', 'boolean']
+    )
+
+    if approximate:
+        quantile_sketch = ColumnQuantileSketch(k=k)
+        quantile_sketch.update(numeric_df)
+        return quantile_sketch.quantiles(quantiles)
+
+    return numeric_df.quantile(quantiles)
+
+
+@instrumented
 def get_columns_with_null_values(df):
     """
         Purpose:
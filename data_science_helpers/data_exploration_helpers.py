@@ -8,22 +8,40 @@
 import sys
 import os
 import logging
+import itertools
 import pandas as pd
+import numpy as np
 
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import kendalltau
+
+from data_science_helpers.data_cache_helpers import cacheable_exploration
 from data_science_helpers.data_engineering_helpers import *
+from data_science_helpers.data_sketch_helpers import (
+    ColumnQuantileSketch, CovarianceAccumulator
+)
+from data_science_helpers.instrumentation_helpers import instrumented
 
 ###
 # Describe Data Functions
 ###
 
-def get_numerical_column_statistics(df):
+@instrumented
+@cacheable_exploration
+def get_numerical_column_statistics(df, approximate=False):
     """
         Purpose:
             Describe the numerical columns in a dataframe.
             This will include, total_count, count_null, count_0,
-            mean, median, mode, sum, 5% quantile, and 95% quantile.
+            mean, median, sum, 5%, 25%, 50%, 75%, and 95%
+            quantiles, max, min, skew, std, and var.
         Args:
             df (Pandas DataFrame): DataFrame to describe
+            approximate (bool): Compute quantiles from KLL quantile
+                sketches instead of sorting every column. Defaults
+                to False
+            cache (ExplorationCache): Return a cached result for
+                unchanged data and parameters. Defaults to None
         Return
             num_statistics (dictionary): Dictionary with key being
             the column and the data being statistics for the
@@ -31,37 +49,133 @@ def get_numerical_column_statistics(df):
     """
     logging.info('Calculating Numerical Column Statistics')
 
-    quantiles_5 = df.quantile(0.05)
-    quantiles_25 = df.quantile(0.25)
-    quantiles_50 = df.quantile(0.50)
-    quantiles_75 = df.quantile(0.75)
-    quantiles_95 = df.quantile(0.95)
-
-    num_statistics = {}
-    for column in get_numeric_columns(df):
-
-        num_statistics[column] = {
-            'quantile_5': quantiles_5[column],
-            'quantile_25': quantiles_25[column],
-            'quantile_50': quantiles_50[column],
-            'quantile_75': quantiles_75[column],
-            'quantile_95': quantiles_95[column],
-            'mean': df[column].mean(),
-            'median': df[column].median(),
-            'max': df[column].max(),
-            'min': df[column].min(),
-            'sum': df[column].sum(),
-            'skew': df[column].skew(),
-            'std': df[column].std(),
-            'var': df[column].var(),
-        }
-
-    return num_statistics
+    statistics_df = get_numerical_column_statistics_dataframe(
+        df, approximate=approximate
+    )
+
+    return statistics_df.to_dict(orient='index')
+
+
+@instrumented
+def get_numerical_column_statistics_dataframe(df, approximate=False):
+    """
+        Purpose:
+            Describe the numerical columns in a dataframe as a tidy
+            DataFrame. Statistics are computed with NumPy over the
+            2D numeric block: moments with vectorized reductions
+            across all columns at once and exact quantiles from one
+            sort of the block
+        Args:
+            df (Pandas DataFrame): DataFrame to describe
+            approximate (bool): Compute quantiles from KLL quantile
+                sketches instead of sorting the block. Defaults to
+                False
+        Return
+            statistics_df (Pandas DataFrame): DataFrame with a row per
+                numeric column and a column per statistic
+    """
+    logging.info('Calculating Numerical Column Statistics DataFrame')
+
+    numeric_df = df._get_numeric_data()
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    quantiles = [0.05, 0.25, 0.50, 0.75, 0.95]
+
+    null_mask = np.isnan(values)
+    total_count = len(values)
+    count = total_count - null_mask.sum(axis=0)
+    value_sum = np.nansum(values, axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = value_sum / count
+        deviations = np.where(null_mask, 0., values - mean)
+        squared_deviations = deviations ** 2
+        sum_squares = squared_deviations.sum(axis=0)
+        sum_cubes = (squared_deviations * deviations).sum(axis=0)
+
+        var = np.where(count > 1, sum_squares / (count - 1), np.nan)
+        skew = np.where(
+            count > 2,
+            np.where(
+                sum_squares > 0,
+                count * (count - 1) ** .5 / (count - 2) *
+                sum_cubes / sum_squares ** 1.5,
+                0.
+            ),
+            np.nan
+        )
+
+    if approximate:
+        quantile_sketch = ColumnQuantileSketch()
+        quantile_sketch.update(numeric_df)
+        quantile_values = quantile_sketch.quantiles(quantiles).to_numpy()
+    else:
+        quantile_values = _get_sorted_block_quantiles(values, count, quantiles)
+
+    statistics_df = pd.DataFrame(
+        {
+            'total_count': total_count,
+            'count_null': total_count - count,
+            'count_0': (values == 0).sum(axis=0),
+            'quantile_5': quantile_values[0],
+            'quantile_25': quantile_values[1],
+            'quantile_50': quantile_values[2],
+            'quantile_75': quantile_values[3],
+            'quantile_95': quantile_values[4],
+            'mean': mean,
+            'median': quantile_values[2],
+            'max': np.fmax.reduce(values, axis=0, initial=np.nan),
+            'min': np.fmin.reduce(values, axis=0, initial=np.nan),
+            'sum': value_sum,
+            'skew': skew,
+            'std': np.sqrt(var),
+            'var': var,
+        },
+        index=numeric_df.columns
+    )
+
+    return statistics_df
+
+
+def _get_sorted_block_quantiles(values, count, quantiles):
+    """
+        Purpose:
+            Get exact quantiles (linear interpolation, matching
+            df.quantile) of every column of a 2D block from one
+            sort. Nulls sort to the end of each column, so each
+            column's quantile positions only span its non-null count
+        Args:
+            values (Numpy Array): 2D float64 block, rows by columns
+            count (Numpy Array): Non-null count per column
+            quantiles (List of floats): Quantiles between 0 and 1
+        Return
+            quantile_values (Numpy Array): Array with a row per
+                quantile and a column per block column
+    """
+
+    sorted_values = np.sort(values, axis=0)
+    column_positions = np.arange(values.shape[1])
+
+    quantile_values = np.full((len(quantiles), values.shape[1]), np.nan)
+    has_values = count > 0
+    for quantile_index, quantile in enumerate(quantiles):
+        positions = quantile * (count[has_values] - 1)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.ceil(positions).astype(np.intp)
+        lower_values =\
+            sorted_values[lower, column_positions[has_values]]
+        upper_values =\
+            sorted_values[upper, column_positions[has_values]]
+        quantile_values[quantile_index, has_values] =\
+            lower_values + (upper_values - lower_values) * (positions - lower)
+
+    return quantile_values
 
 ###
 # Describe Column Correlation Functions
 ###
 
+@instrumented
+@cacheable_exploration
 def get_column_correlation(df):
     """
         Purpose:
@@ -72,19 +186,24 @@ def get_column_correlation(df):
             and the direction of the correlation
         Args:
             df (Pandas DataFrame): DataFrame to determine correlation
+            cache (ExplorationCache): Return a cached result for
+            unchanged data. Default None
         Return
             unique_value_correlation (Pandas DataFrame): DataFrame
             of correlations for each column set in the DataFrame
     """
     logging.info('Getting Column Correlation')
 
-    base_correlation = df.corr().unstack()
-    unique_value_correlation =\
-        base_correlation[get_unique_column_paris(df)]
+    correlation = df._get_numeric_data().corr()
+    rows, cols = get_unique_column_pair_indices(correlation)
+    unique_value_correlation = _unstack_column_pairs(
+        correlation.columns, rows, cols, correlation.to_numpy()[rows, cols]
+    )
 
     return unique_value_correlation
 
 
+@instrumented
 def get_column_absolute_correlation(df):
     """
         Purpose:
@@ -102,26 +221,37 @@ def get_column_absolute_correlation(df):
     """
     logging.info('Getting Column Correlation (Absolute Value)')
 
-    abs_correlation = df.corr().abs().unstack()
-    unique_value_abs_correlation =\
-        abs_correlation[get_unique_column_paris(df)]
+    unique_value_abs_correlation = get_column_correlation(df).abs()
 
     return unique_value_abs_correlation
 
 
-def get_column_pairs_significant_correlation(df, pos_corr=.20, neg_corr=.20):
+@instrumented
+@cacheable_exploration
+def get_column_pairs_significant_correlation(
+    df, pos_corr=.20, neg_corr=.20, top_k=None, as_dataframe=False):
     """
         Purpose:
             Determine Columns with highly positive or highly
             negative correlation. Defaults for positive and
             negative correlations are 20% and can be passed
-            in as parameters
+            in as parameters. Pairs are found by thresholding the
+            upper triangle of the correlation matrix with NumPy
+            boolean masks and are sorted strongest first
         Args:
             df (Pandas DataFrame): DataFrame to determine correlation
             pos_corr (float): Float percentage to consider a positive
             correlation as significant. Default 20%
             neg_corr (float): Float percentage to consider a negative
-            correlation as significant. Default 20%
+            correlation as significant (correlation <= -neg_corr).
+            Default 20%
+            top_k (int): Only return the k strongest pairs of each
+            direction. Default None (all pairs)
+            as_dataframe (bool): Return DataFrames with column_a,
+            column_b, and correlation columns instead of lists.
+            Default False
+            cache (ExplorationCache): Return a cached result for
+            unchanged data and parameters. Default None
         Return
             high_positive_correlation_pairs (List of Sets): List of column
             pairs with a high positive correlation
@@ -129,33 +259,404 @@ def get_column_pairs_significant_correlation(df, pos_corr=.20, neg_corr=.20):
             pairs with a high negative correlation
     """
     logging.info('Getting Signification Correlation Column Pairs')
-    logging.info('Positive Correlation Threshold: {0}'.format(pos_corr))
-    logging.info('Negative Correlation Threshold: {0}'.format(neg_corr))
+    logging.info('Positive Correlation Threshold: %s', pos_corr)
+    logging.info('Negative Correlation Threshold: %s', neg_corr)
+
+    correlation = df._get_numeric_data().corr()
+    columns = correlation.columns
+    rows, cols = get_unique_column_pair_indices(correlation)
+    pair_correlation = correlation.to_numpy()[rows, cols]
+
+    significant_pairs = []
+    for significant_mask, direction in (
+        (pair_correlation >= pos_corr, -1),
+        (pair_correlation <= -neg_corr, 1),
+    ):
+        pair_positions = np.flatnonzero(significant_mask)
+        ordered_correlation = direction * pair_correlation[pair_positions]
+        if top_k is not None and top_k < len(pair_positions):
+            strongest = np.argpartition(ordered_correlation, top_k)[:top_k]
+            pair_positions = pair_positions[strongest]
+            ordered_correlation = ordered_correlation[strongest]
+        pair_positions =\
+            pair_positions[np.argsort(ordered_correlation, kind='stable')]
 
-    correlation = get_column_correlation(df)
-    unique_pairs = get_unique_column_paris(df)
+        column_a = columns[rows[pair_positions]]
+        column_b = columns[cols[pair_positions]]
+        if as_dataframe:
+            significant_pairs.append(pd.DataFrame({
+                'column_a': column_a,
+                'column_b': column_b,
+                'correlation': pair_correlation[pair_positions],
+            }))
+        else:
+            significant_pairs.append(list(zip(column_a, column_b)))
 
-    positive_correlation_pairs = []
-    negative_correlation_pairs = []
-    for pair in unique_pairs:
-        if correlation[pair] >= pos_corr:
-            positive_correlation_pairs.append(pair)
-        if correlation[pair] <= neg_corr:
-            negative_correlation_pairs.append(pair)
+    positive_correlation_pairs, negative_correlation_pairs =\
+        significant_pairs
 
     return positive_correlation_pairs, negative_correlation_pairs
 
+
+@instrumented
+def get_streaming_column_correlation(chunks, columns=None):
+    """
+        Purpose:
+            Determine the true correlation between all column pairs
+            of data read in chunks of rows, without holding the data
+            in memory. Chunks are combined with a mergeable
+            CovarianceAccumulator
+        Args:
+            chunks (Iterator of Pandas DataFrames): Chunks of rows,
+                e.g. pd.read_csv(filename, chunksize=100000)
+            columns (List of strings): Columns to correlate. Defaults
+                to the numeric columns of the first chunk
+        Return
+            unique_value_correlation (Pandas Series): Correlation for
+            each unique column pair, indexed by the pair
+    """
+    logging.info('Getting Column Correlation from Chunks')
+
+    covariance_accumulator = CovarianceAccumulator(columns=columns)
+    for chunk in chunks:
+        covariance_accumulator.update(chunk)
+
+    correlation = covariance_accumulator.correlation()
+    rows, cols = get_unique_column_pair_indices(correlation)
+
+    return _unstack_column_pairs(
+        correlation.columns, rows, cols, correlation.to_numpy()[rows, cols]
+    )
+
+
+@instrumented
+def write_blocked_correlation_matrix(
+    chunk_loader, filename, columns, block_size=1000, dtype=np.float32):
+    """
+        Purpose:
+            Build a correlation matrix too large for memory tile by
+            tile into a memory-mapped .npy file. Each block of rows
+            of the upper triangle is accumulated over one pass of
+            the data and mirrored into the lower triangle, so memory
+            is bounded by block_size x len(columns)
+        Args:
+            chunk_loader (Function): Function returning a new iterator
+                of DataFrame chunks, called once per block of rows,
+                e.g. lambda: pd.read_csv(filename, chunksize=100000)
+            filename (String): .npy file to write the matrix to
+            columns (List of strings): Columns to correlate, in the
+                order of the matrix rows and columns
+            block_size (int): Columns per block of rows. Defaults
+                to 1000
+            dtype (Numpy dtype): dtype of the stored matrix. Defaults
+                to float32
+        Return
+            correlation_matrix (Numpy memmap): Read only memory-mapped
+                matrix; row/column i is columns[i]
+    """
+    logging.info('Writing Blocked Correlation Matrix to %s', filename)
+
+    columns = list(columns)
+    correlation_matrix = np.lib.format.open_memmap(
+        filename, mode='w+', dtype=dtype, shape=(len(columns), len(columns))
+    )
+
+    for block_start in range(0, len(columns), block_size):
+        block_end = min(block_start + block_size, len(columns))
+        logging.info(
+            'Correlating Columns %d to %d', block_start, block_end
+        )
+
+        covariance_accumulator = CovarianceAccumulator(
+            columns=columns[block_start:block_end],
+            paired_columns=columns[block_start:]
+        )
+        for chunk in chunk_loader():
+            covariance_accumulator.update(chunk)
+
+        block_correlation = covariance_accumulator.correlation().to_numpy()
+        correlation_matrix[block_start:block_end, block_start:] =\
+            block_correlation
+        correlation_matrix[block_start:, block_start:block_end] =\
+            block_correlation.T
+
+    correlation_matrix.flush()
+    del correlation_matrix
+
+    return np.load(filename, mmap_mode='r')
+
+###
+# Describe Column Rank Correlation Functions
+###
+
+@instrumented
+def get_column_spearman_correlation(df):
+    """
+        Purpose:
+            Determine the Spearman rank correlation between all
+            numeric column pairs. Each column is ranked once and
+            the ranks are correlated with Pearson. Nulls are left
+            out of each column's ranks
+        Args:
+            df (Pandas DataFrame): DataFrame to determine correlation
+        Return
+            unique_value_correlation (Pandas Series): Correlation for
+            each unique column pair, indexed by the pair
+    """
+    logging.info('Getting Column Spearman Correlation')
+
+    rank_df = df._get_numeric_data().rank()
+    rows, cols = get_unique_column_pair_indices(rank_df)
+
+    return _unstack_column_pairs(
+        rank_df.columns, rows, cols, rank_df.corr().to_numpy()[rows, cols]
+    )
+
+
+@instrumented
+def get_column_kendall_correlation(df, n_jobs=None):
+    """
+        Purpose:
+            Determine the Kendall tau-b rank correlation between all
+            numeric column pairs. Each column is ranked once, each
+            pair uses scipy's O(n log n) Kendall algorithm, and the
+            pairs are spread across a process pool
+        Args:
+            df (Pandas DataFrame): DataFrame to determine correlation
+            n_jobs (int): Worker processes. Defaults to None (one per
+                CPU); 1 runs in this process
+        Return
+            unique_value_correlation (Pandas Series): Correlation for
+            each unique column pair, indexed by the pair
+    """
+    logging.info('Getting Column Kendall Correlation')
+
+    rank_df = df._get_numeric_data().rank()
+
+    return _get_parallel_column_pair_values(
+        rank_df.columns, rank_df.to_numpy(dtype=np.float64, na_value=np.nan),
+        _get_kendall_pair_values, n_jobs=n_jobs
+    )
+
+
+@instrumented
+def get_column_mutual_information(df, bins=16, n_jobs=None):
+    """
+        Purpose:
+            Determine the mutual information (in nats) between all
+            numeric column pairs. Each column is ranked once and cut
+            into equal frequency bins, and each pair's mutual
+            information is read from its binned joint histogram. The
+            pairs are spread across a process pool
+        Args:
+            df (Pandas DataFrame): DataFrame to determine mutual
+                information
+            bins (int): Bins per column. Defaults to 16
+            n_jobs (int): Worker processes. Defaults to None (one per
+                CPU); 1 runs in this process
+        Return
+            unique_value_mutual_information (Pandas Series): Mutual
+            information for each unique column pair, indexed by the
+            pair
+    """
+    logging.info('Getting Column Mutual Information')
+
+    percentile_df = df._get_numeric_data().rank(pct=True)
+    binned_values = np.minimum(
+        np.floor(
+            percentile_df.to_numpy(dtype=np.float64, na_value=np.nan) * bins
+        ),
+        bins - 1
+    )
+    binned_values[np.isnan(binned_values)] = -1
+
+    return _get_parallel_column_pair_values(
+        percentile_df.columns, binned_values.astype(np.int64),
+        _get_mutual_information_pair_values, n_jobs=n_jobs,
+        pair_function_args=(bins,)
+    )
+
+
+def _get_parallel_column_pair_values(
+    columns, values, pair_function, n_jobs=None, pair_function_args=()):
+    """
+        Purpose:
+            Compute a value for every unique column pair, splitting
+            the pairs into batches over a process pool. The values
+            block is sent to each worker once, not once per batch
+        Args:
+            columns (Pandas Index): Column names of values
+            values (Numpy Array): 2D block, rows by columns
+            pair_function (Function): Module level function taking
+                (values, rows, cols, *pair_function_args) and
+                returning a value per pair
+            n_jobs (int): Worker processes. None for one per CPU;
+                1 runs in this process
+            pair_function_args (Tuple): Extra pair_function args
+        Return
+            unique_value_pairs (Pandas Series): Value for each unique
+            column pair, indexed by the pair
+    """
+
+    rows, cols = np.triu_indices(len(columns), k=1)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1 or len(rows) < 2:
+        pair_values = pair_function(values, rows, cols, *pair_function_args)
+        return _unstack_column_pairs(columns, rows, cols, pair_values)
+
+    batch_count = min(len(rows), n_jobs * 4)
+    row_batches = np.array_split(rows, batch_count)
+    col_batches = np.array_split(cols, batch_count)
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=_set_worker_values,
+        initargs=(values,)
+    ) as executor:
+        pair_values = np.concatenate(list(executor.map(
+            _get_worker_pair_values,
+            [pair_function] * batch_count, row_batches, col_batches,
+            [pair_function_args] * batch_count
+        )))
+
+    return _unstack_column_pairs(columns, rows, cols, pair_values)
+
+
+_WORKER_VALUES = None
+
+
+def _set_worker_values(values):
+    """
+        Purpose:
+            Process pool initializer storing the values block
+            once per worker
+        Args:
+            values (Numpy Array): 2D block, rows by columns
+        Return
+            N/A
+    """
+    global _WORKER_VALUES
+
+    _WORKER_VALUES = values
+
+
+def _get_worker_pair_values(pair_function, rows, cols, pair_function_args):
+    """
+        Purpose:
+            Run a pair function over a batch of pairs in a worker
+        Args:
+            pair_function (Function): Function to run
+            rows (Numpy Array): First column position of each pair
+            cols (Numpy Array): Second column position of each pair
+            pair_function_args (Tuple): Extra pair_function args
+        Return
+            pair_values (Numpy Array): Value per pair
+    """
+
+    return pair_function(_WORKER_VALUES, rows, cols, *pair_function_args)
+
+
+def _get_kendall_pair_values(rank_values, rows, cols):
+    """
+        Purpose:
+            Kendall tau-b of each pair over rows where both columns
+            are non-null
+        Args:
+            rank_values (Numpy Array): 2D block of column ranks
+            rows (Numpy Array): First column position of each pair
+            cols (Numpy Array): Second column position of each pair
+        Return
+            pair_values (Numpy Array): Kendall tau-b per pair
+    """
+
+    valid = ~np.isnan(rank_values)
+    pair_values = np.full(len(rows), np.nan)
+    for pair_index, (row, col) in enumerate(zip(rows, cols)):
+        both_valid = valid[:, row] & valid[:, col]
+        if both_valid.sum() > 1:
+            pair_values[pair_index] = kendalltau(
+                rank_values[both_valid, row], rank_values[both_valid, col]
+            )[0]
+
+    return pair_values
+
+
+def _get_mutual_information_pair_values(binned_values, rows, cols, bins):
+    """
+        Purpose:
+            Mutual information of each pair from its joint histogram
+            over rows where both columns are non-null
+        Args:
+            binned_values (Numpy Array): 2D block of bin numbers,
+                -1 for nulls
+            rows (Numpy Array): First column position of each pair
+            cols (Numpy Array): Second column position of each pair
+            bins (int): Bins per column
+        Return
+            pair_values (Numpy Array): Mutual information per pair
+    """
+
+    pair_values = np.full(len(rows), np.nan)
+    for pair_index, (row, col) in enumerate(zip(rows, cols)):
+        both_valid =\
+            (binned_values[:, row] >= 0) & (binned_values[:, col] >= 0)
+        if not both_valid.any():
+            continue
+
+        joint_counts = np.bincount(
+            binned_values[both_valid, row] * bins +
+            binned_values[both_valid, col],
+            minlength=bins * bins
+        ).reshape(bins, bins)
+        joint_probability = joint_counts / joint_counts.sum()
+        row_probability = joint_probability.sum(axis=1, keepdims=True)
+        col_probability = joint_probability.sum(axis=0, keepdims=True)
+
+        non_zero = joint_probability > 0
+        pair_values[pair_index] = np.sum(
+            joint_probability[non_zero] * np.log(
+                joint_probability[non_zero] /
+                (row_probability @ col_probability)[non_zero]
+            )
+        )
+
+    return pair_values
+
+
+def _unstack_column_pairs(columns, rows, cols, pair_values):
+    """
+        Purpose:
+            Build the unstacked pair format used by the correlation
+            helpers from column positions and a value per pair
+        Args:
+            columns (Pandas Index): Column names
+            rows (Numpy Array): First column position of each pair
+            cols (Numpy Array): Second column position of each pair
+            pair_values (Numpy Array): Value per pair
+        Return
+            unique_value_pairs (Pandas Series): Value for each unique
+            column pair, indexed by the pair
+    """
+
+    return pd.Series(
+        pair_values,
+        index=pd.MultiIndex.from_arrays([columns[rows], columns[cols]])
+    )
+
 ###
 # Describe DataFrame Shape Functions
 ###
 
+@instrumented
 def get_unique_column_paris(df):
     """
         Purpose:
             Get unique pairs of columns from a DataFrame. This
             assumes there is no direction (A, B) and returns
             a Set of column pairs that can be used for identifying
-            correlation, mapping columns, and other functions
+            correlation, mapping columns, and other functions.
+            This holds every pair in memory; prefer
+            iterate_unique_column_pairs or
+            get_unique_column_pair_indices for wide DataFrames
         Args:
             df (Pandas DataFrame): DataFrame to determine column pairs
         Return
@@ -163,11 +664,42 @@ def get_unique_column_paris(df):
     """
     logging.info('Getting Unique Column Pairs')
 
-    unique_pairs = set()
-    columns = df.columns
+    return set(iterate_unique_column_pairs(df))
 
-    for i in range(0, len(columns)):
-        for j in range(i+1, len(columns)):
-            unique_pairs.add((columns[i], columns[j]))
 
-    return unique_pairs
+@instrumented
+def iterate_unique_column_pairs(df):
+    """
+        Purpose:
+            Lazily generate the unique pairs of columns from a
+            DataFrame in a fixed order: (columns[i], columns[j]) for
+            every i < j, ordered by i then j. Pairs are generated
+            one at a time, so no pair is held in memory
+        Args:
+            df (Pandas DataFrame): DataFrame to determine column pairs
+        Return
+            unique_pairs (Generator of Tuples): Unique column pairs
+    """
+
+    return itertools.combinations(df.columns, 2)
+
+
+@instrumented
+def get_unique_column_pair_indices(df):
+    """
+        Purpose:
+            Get the positions of the unique pairs of columns from a
+            DataFrame as two index arrays (the upper triangle of a
+            column by column matrix), in the same order as
+            iterate_unique_column_pairs. Use them to fancy index a
+            correlation matrix or df.columns
+        Args:
+            df (Pandas DataFrame): DataFrame to determine column pairs
+        Return
+            rows (Numpy Array): Position of the first column of
+                each pair
+            cols (Numpy Array): Position of the second column of
+                each pair
+    """
+
+    return np.triu_indices(len(df.columns), k=1)
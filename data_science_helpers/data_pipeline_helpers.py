@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+    Library for chaining the data engineering helpers into a preprocessing
+    pipeline. Steps are planned before they run so consecutive column drops
+    share one scan of the data and one projection, and transform steps are
+    fit on training data and reused on new batches
+"""
+
+# Python Library Imports
+import sys
+import os
+import logging
+import pandas as pd
+import numpy as np
+
+from data_science_helpers.data_engineering_helpers import (
+    CategoricalDummyEncoder, CategoricalIntegerEncoder, ColumnProfile,
+    NullImputer, OutlierClipper, ensure_categorical_columns_all_string,
+    get_high_cardinality_categorical_columns,
+    get_high_cardinality_numerical_columns, get_overly_null_columns,
+    get_quantile_equality_columns, get_single_value_columns
+)
+from data_science_helpers.instrumentation_helpers import instrumented
+
+###
+# Pipeline Step Definitions
+###
+
+# Drop steps decide their columns from a shared ColumnProfile
+PROFILE_DROP_STEPS = {
+    'remove_overly_null_columns': get_overly_null_columns,
+    'remove_high_cardinality_numerical_columns':
+        get_high_cardinality_numerical_columns,
+    'remove_high_cardinality_categorical_columns':
+        get_high_cardinality_categorical_columns,
+    'remove_single_value_columns': get_single_value_columns,
+}
+
+# Drop steps that decide their columns from the data itself
+DATA_DROP_STEPS = {
+    'remove_quantile_equality_columns': get_quantile_equality_columns,
+}
+
+# Transform steps with state learned at fit
+FITTED_TRANSFORM_STEPS = {
+    'mask_outliers_numerical_columns':
+        lambda low_quantile=.05, high_quantile=.95, approximate=False:
+            OutlierClipper(
+                low_quantile=low_quantile, high_quantile=high_quantile,
+                approximate=approximate
+            ),
+    'convert_categorical_columns_to_dummies':
+        lambda drop_first=True, sparse_threshold=None:
+            CategoricalDummyEncoder(
+                drop_first=drop_first, sparse_threshold=sparse_threshold
+            ),
+    'encode_categorical_columns_as_integer':
+        lambda: CategoricalIntegerEncoder(),
+    'replace_null_values_numeric_columns':
+        lambda replace_operation='median':
+            NullImputer(
+                numeric_operation=replace_operation, categorical_value=None
+            ),
+    'replace_null_values_categorical_columns':
+        lambda: NullImputer(
+            numeric_operation=None, categorical_value='Unknown'
+        ),
+}
+
+# Transform steps without state
+STATELESS_TRANSFORM_STEPS = {
+    'ensure_categorical_columns_all_string':
+        ensure_categorical_columns_all_string,
+}
+
+###
+# Pipeline Classes
+###
+
+class Pipeline(object):
+    """
+        Purpose:
+            Declarative preprocessing pipeline over the
+            data_engineering_helpers functions. Steps are planned
+            into stages: consecutive drop steps are fused so their
+            statistics come from one ColumnProfile and all of their
+            drops are applied in one projection, and transform steps
+            use the fitted transformer classes so fit learns on
+            training data and transform replays on new batches
+        Attributes:
+            steps (List of Tuples): Step name and keyword arguments
+            stages (List of Tuples): Planned stages, either
+                ("drop", steps) or ("transform", name, kwargs)
+            stage_columns_to_drop (Dict): Columns dropped by each
+                fitted drop stage
+            stage_transformers (Dict): Fitted transformer for each
+                fitted transform stage
+    """
+
+    def __init__(self, steps):
+        """
+            Purpose:
+                Create and plan an unfitted pipeline
+            Args:
+                steps (List): Steps in order. Each step is the name of
+                    a data_engineering_helpers function, or a tuple of
+                    the name and a dict of its keyword arguments, e.g.
+                    ("remove_overly_null_columns", {"percentage_null": .5})
+        """
+
+        self.steps = [self._normalize_step(step) for step in steps]
+        self.stages = self._plan_stages(self.steps)
+        self.stage_columns_to_drop = None
+        self.stage_transformers = None
+
+    @instrumented
+    def fit(self, df):
+        """
+            Purpose:
+                Fit every stage on training data
+            Args:
+                df (Pandas DataFrame): Training DataFrame
+            Return
+                self (Pipeline): Fitted pipeline
+        """
+
+        self.fit_transform(df)
+
+        return self
+
+    @instrumented
+    def fit_transform(self, df):
+        """
+            Purpose:
+                Fit every stage on training data and return the
+                preprocessed training data
+            Args:
+                df (Pandas DataFrame): Training DataFrame
+            Return
+                df (Pandas DataFrame): Preprocessed DataFrame
+        """
+        logging.info('Fitting Pipeline with %d Stages', len(self.stages))
+
+        self.stage_columns_to_drop = {}
+        self.stage_transformers = {}
+
+        return self._run_stages(df, fit=True)
+
+    @instrumented
+    def transform(self, df):
+        """
+            Purpose:
+                Preprocess a new batch with the fitted stages
+            Args:
+                df (Pandas DataFrame): DataFrame to preprocess
+            Return
+                df (Pandas DataFrame): Preprocessed DataFrame
+        """
+
+        if self.stage_columns_to_drop is None:
+            raise ValueError('Pipeline must be fit before transform')
+
+        return self._run_stages(df, fit=False)
+
+    def _run_stages(self, df, fit):
+        """
+            Purpose:
+                Run every planned stage over a DataFrame. The passed
+                in DataFrame is never updated in place
+            Args:
+                df (Pandas DataFrame): DataFrame to preprocess
+                fit (bool): Fit each stage before applying it
+            Return
+                df (Pandas DataFrame): Preprocessed DataFrame
+        """
+
+        owns_df = False
+        for stage_index, stage in enumerate(self.stages):
+            if stage[0] == 'drop':
+                if fit:
+                    self.stage_columns_to_drop[stage_index] =\
+                        self._get_stage_columns_to_drop(df, stage[1])
+                columns_to_drop = [
+                    column
+                    for column in self.stage_columns_to_drop[stage_index]
+                    if column in df.columns
+                ]
+                df = df.drop(columns_to_drop, axis=1)
+                owns_df = True
+                continue
+
+            _, name, kwargs = stage
+            if name in STATELESS_TRANSFORM_STEPS:
+                if not owns_df:
+                    df = df.copy()
+                df = STATELESS_TRANSFORM_STEPS[name](df, **kwargs)
+            else:
+                if fit:
+                    self.stage_transformers[stage_index] =\
+                        FITTED_TRANSFORM_STEPS[name](**kwargs).fit(df)
+                transformer = self.stage_transformers[stage_index]
+                if isinstance(transformer, OutlierClipper) and not owns_df:
+                    df = df.copy()
+                df = transformer.transform(df)
+            owns_df = True
+
+        return df
+
+    def _get_stage_columns_to_drop(self, df, drop_steps):
+        """
+            Purpose:
+                Get the columns a fused drop stage removes, profiling
+                the DataFrame at most once for all of its steps
+            Args:
+                df (Pandas DataFrame): DataFrame entering the stage
+                drop_steps (List of Tuples): Step name and keyword
+                    arguments of each drop step in the stage
+            Return
+                columns_to_drop (List of strings): Columns to drop,
+                    in DataFrame order
+        """
+
+        column_profile = None
+        columns_to_drop = set()
+        for name, kwargs in drop_steps:
+            if name in PROFILE_DROP_STEPS:
+                if column_profile is None:
+                    column_profile = ColumnProfile(df)
+                columns_to_drop.update(
+                    PROFILE_DROP_STEPS[name](column_profile, **kwargs)
+                )
+            else:
+                columns_to_drop.update(DATA_DROP_STEPS[name](df, **kwargs))
+
+        logging.info('Pipeline Dropping %d Columns', len(columns_to_drop))
+
+        return [column for column in df.columns if column in columns_to_drop]
+
+    @staticmethod
+    def _normalize_step(step):
+        """
+            Purpose:
+                Convert a step to a (name, kwargs) tuple and check
+                that the step is supported
+            Args:
+                step (string or Tuple): Step name, or name and kwargs
+            Return
+                step (Tuple): Step name and keyword arguments
+        """
+
+        if isinstance(step, str):
+            name, kwargs = step, {}
+        else:
+            name, kwargs = step
+
+        if not any(
+            name in step_definitions
+            for step_definitions in (
+                PROFILE_DROP_STEPS, DATA_DROP_STEPS,
+                FITTED_TRANSFORM_STEPS, STATELESS_TRANSFORM_STEPS
+            )
+        ):
+            raise ValueError(
+                'Unsupported Pipeline Step: {name}'.format(name=name)
+            )
+
+        return name, dict(kwargs)
+
+    @staticmethod
+    def _plan_stages(steps):
+        """
+            Purpose:
+                Group consecutive drop steps into one drop stage and
+                give every transform step its own stage
+            Args:
+                steps (List of Tuples): Step name and keyword arguments
+            Return
+                stages (List of Tuples): Planned stages
+        """
+
+        stages = []
+        for name, kwargs in steps:
+            if name in PROFILE_DROP_STEPS or name in DATA_DROP_STEPS:
+                if stages and stages[-1][0] == 'drop':
+                    stages[-1][1].append((name, kwargs))
+                else:
+                    stages.append(('drop', [(name, kwargs)]))
+            else:
+                stages.append(('transform', name, kwargs))
+
+        return stages
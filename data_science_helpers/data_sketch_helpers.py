@@ -0,0 +1,776 @@
+#!/usr/bin/env python3
+"""
+    Library for mergeable, bounded-memory sketches of column data. Sketches
+    are updated chunk by chunk and merged across partitions so statistics can
+    be computed over data that does not fit in memory
+"""
+
+# Python Library Imports
+import io
+import sys
+import os
+import logging
+import pandas as pd
+import numpy as np
+
+from data_science_helpers.instrumentation_helpers import instrumented
+
+###
+# Hashing Functions
+###
+
+def hash_column_values(series):
+    """
+        Purpose:
+            Hash the non-null values of a column into 64 bit
+            integers. Numeric values are hashed as float64 so the
+            same value hashes the same when chunks of a column are
+            read with different dtypes (e.g. int64 and float64)
+        Args:
+            series (Pandas Series): Column to hash
+        Return
+            hashes (Numpy Array): uint64 hash of each non-null value
+    """
+
+    series = series.dropna()
+    if pd.api.types.is_numeric_dtype(series):
+        series = series.astype(np.float64)
+
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+###
+# Distinct Count Sketches
+###
+
+class HyperLogLog(object):
+    """
+        Purpose:
+            Mergeable distinct count sketch. Hashes are kept exactly
+            until exact_limit distinct hashes are seen, so small
+            cardinalities (e.g. single value columns) are counted
+            exactly. Past that, the count is estimated from 2**precision
+            registers with a relative error of about
+            1.04 / sqrt(2**precision)
+        Attributes:
+            precision (int): Number of bits used to pick a register
+            exact_limit (int): Number of distinct hashes to keep
+                before switching to the estimate
+            registers (Numpy Array): uint8 register per bucket
+            exact_hashes (Numpy Array): Sorted distinct hashes, or
+                None once exact_limit is exceeded
+    """
+
+    def __init__(self, precision=14, exact_limit=1024):
+        """
+            Purpose:
+                Create an empty sketch
+            Args:
+                precision (int): Number of bits used to pick a
+                    register, between 11 and 18. Defaults to 14
+                    (~0.8% error, 16KB per sketch)
+                exact_limit (int): Number of distinct hashes to
+                    count exactly. Defaults to 1024
+        """
+
+        if not 11 <= precision <= 18:
+            raise ValueError(
+                'HyperLogLog precision must be between 11 and 18, '
+                'got {precision}'.format(precision=precision)
+            )
+
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+        self.exact_hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, hashes):
+        """
+            Purpose:
+                Add hashed values to the sketch
+            Args:
+                hashes (Numpy Array): uint64 hashes, e.g. from
+                    hash_column_values
+            Return
+                N/A
+        """
+
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if not len(hashes):
+            return
+
+        value_bits = 64 - self.precision
+        buckets = (hashes >> np.uint64(value_bits)).astype(np.intp)
+        remainders = hashes & np.uint64((1 << value_bits) - 1)
+
+        # value_bits <= 53, so float64 holds each remainder exactly
+        ranks = np.full(len(hashes), value_bits + 1, dtype=np.uint8)
+        non_zero = remainders > 0
+        ranks[non_zero] = value_bits - np.floor(
+            np.log2(remainders[non_zero].astype(np.float64))
+        ).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+
+        if self.exact_hashes is not None:
+            self._update_exact_hashes(np.unique(hashes))
+
+    def merge(self, other):
+        """
+            Purpose:
+                Merge another sketch (e.g. from another chunk or
+                worker process) into this sketch
+            Args:
+                other (HyperLogLog): Sketch with the same precision
+            Return
+                N/A
+        """
+
+        if other.precision != self.precision:
+            raise ValueError(
+                'Cannot merge HyperLogLog sketches with precision '
+                '{precision} and {other_precision}'.format(
+                    precision=self.precision,
+                    other_precision=other.precision
+                )
+            )
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self.exact_hashes is not None and other.exact_hashes is not None:
+            self._update_exact_hashes(other.exact_hashes)
+        else:
+            self.exact_hashes = None
+
+    def count(self):
+        """
+            Purpose:
+                Get the distinct count seen by the sketch
+            Args:
+                N/A
+            Return
+                count (int): Exact count while under exact_limit,
+                    otherwise the HyperLogLog estimate
+        """
+
+        if self.exact_hashes is not None:
+            return len(self.exact_hashes)
+
+        register_count = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / register_count)
+        estimate = alpha * register_count ** 2 / np.sum(
+            np.ldexp(1.0, -self.registers.astype(np.int64))
+        )
+
+        empty_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * register_count and empty_registers:
+            estimate = register_count * np.log(
+                register_count / empty_registers
+            )
+
+        return int(round(estimate))
+
+    def _update_exact_hashes(self, hashes):
+        """
+            Purpose:
+                Union hashes into the exact hash set, dropping the
+                set once it grows past exact_limit
+            Args:
+                hashes (Numpy Array): Distinct uint64 hashes
+            Return
+                N/A
+        """
+
+        if len(hashes) > self.exact_limit:
+            self.exact_hashes = None
+            return
+
+        exact_hashes = np.union1d(self.exact_hashes, hashes)
+        if len(exact_hashes) > self.exact_limit:
+            self.exact_hashes = None
+        else:
+            self.exact_hashes = exact_hashes
+
+###
+# Quantile Sketches
+###
+
+class KLLSketch(object):
+    """
+        Purpose:
+            Mergeable quantile sketch (Karnin, Lang, and Liberty).
+            Values are held in levels of compactors where an item at
+            level h stands for 2**h values. Every requested quantile
+            is read from one sort of the retained items. The rank
+            error is about 1.7 / k of the count, independent of the
+            number of values
+        Attributes:
+            k (int): Size of the top compactor, controls the error
+            count (int): Number of values added
+            min_value (float): Smallest value added
+            max_value (float): Largest value added
+            levels (List of Numpy Arrays): Retained items per level
+    """
+
+    def __init__(self, k=200, seed=None):
+        """
+            Purpose:
+                Create an empty sketch
+            Args:
+                k (int): Size of the top compactor. Defaults to 200
+                    (~0.85% rank error)
+                seed (int): Seed for the compaction coin flips
+        """
+
+        if k < 8:
+            raise ValueError(
+                'KLLSketch k must be at least 8, got {k}'.format(k=k)
+            )
+
+        self.k = k
+        self.count = 0
+        self.min_value = np.nan
+        self.max_value = np.nan
+        self.levels = [np.empty(0, dtype=np.float64)]
+        self._random = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+            Purpose:
+                Add values to the sketch. Null values are ignored
+            Args:
+                values (Array-like): Numeric values to add
+            Return
+                N/A
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+
+        self.count += len(values)
+        self.min_value = np.fmin(self.min_value, values.min())
+        self.max_value = np.fmax(self.max_value, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+            Purpose:
+                Merge another sketch (e.g. from another chunk or
+                worker process) into this sketch
+            Args:
+                other (KLLSketch): Sketch to merge
+            Return
+                N/A
+        """
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+
+        self.count += other.count
+        self.min_value = np.fmin(self.min_value, other.min_value)
+        self.max_value = np.fmax(self.max_value, other.max_value)
+        self._compress()
+
+    def quantiles(self, quantiles):
+        """
+            Purpose:
+                Get approximate quantiles of the values added
+            Args:
+                quantiles (List of floats): Quantiles between 0 and 1
+            Return
+                quantile_values (Numpy Array): Value for each quantile,
+                    NaN if the sketch is empty
+        """
+
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if not self.count:
+            return np.full(len(quantiles), np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2 ** level, dtype=np.int64)
+            for level, level_items in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative_weights = np.cumsum(weights[order])
+
+        positions = np.searchsorted(
+            cumulative_weights, quantiles * cumulative_weights[-1],
+            side='left'
+        )
+        quantile_values = items[np.minimum(positions, len(items) - 1)]
+        quantile_values[quantiles <= 0] = self.min_value
+        quantile_values[quantiles >= 1] = self.max_value
+
+        return quantile_values
+
+    def to_bytes(self):
+        """
+            Purpose:
+                Serialize the sketch so it can be stored or sent to
+                another process and merged there
+            Args:
+                N/A
+            Return
+                sketch_bytes (bytes): Serialized sketch
+        """
+
+        sketch_buffer = io.BytesIO()
+        np.savez(
+            sketch_buffer,
+            header=np.array(
+                [self.k, self.count, self.min_value, self.max_value],
+                dtype=np.float64
+            ),
+            **{
+                'level_{level}'.format(level=level): items
+                for level, items in enumerate(self.levels)
+            }
+        )
+
+        return sketch_buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, sketch_bytes, seed=None):
+        """
+            Purpose:
+                Load a sketch serialized with to_bytes
+            Args:
+                sketch_bytes (bytes): Serialized sketch
+                seed (int): Seed for the compaction coin flips
+            Return
+                sketch (KLLSketch): Loaded sketch
+        """
+
+        with np.load(io.BytesIO(sketch_bytes), allow_pickle=False) as arrays:
+            k, count, min_value, max_value = arrays['header']
+            sketch = cls(k=int(k), seed=seed)
+            sketch.count = int(count)
+            sketch.min_value = min_value
+            sketch.max_value = max_value
+            sketch.levels = [
+                arrays['level_{level}'.format(level=level)]
+                for level in range(len(arrays.files) - 1)
+            ]
+
+        return sketch
+
+    def _capacity(self, level):
+        """
+            Purpose:
+                Get the number of items a level may hold before it
+                is compacted. Capacity shrinks by 2/3 per level below
+                the top level
+            Args:
+                level (int): Level to get the capacity of
+            Return
+                capacity (int): Items the level may hold
+        """
+
+        depth = len(self.levels) - level - 1
+
+        return max(2, int(np.ceil(self.k * (2. / 3.) ** depth)))
+
+    def _compress(self):
+        """
+            Purpose:
+                Compact levels over capacity. Compacting sorts a
+                level and promotes every other item (random offset)
+                to the next level, where each item counts double
+            Args:
+                N/A
+            Return
+                N/A
+        """
+
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+
+            items = np.sort(items)
+            kept = items[:len(items) % 2]
+            promoted = items[len(kept):][self._random.integers(2)::2]
+            self.levels[level] = kept
+            self.levels[level + 1] = np.concatenate(
+                [self.levels[level + 1], promoted]
+            )
+
+            # Capacities depend on the number of levels, so recheck
+            # from the bottom once a level is added
+            level = 0
+
+
+class ColumnQuantileSketch(object):
+    """
+        Purpose:
+            KLLSketch per numeric column of a DataFrame, updated
+            chunk by chunk and mergeable across partitions
+        Attributes:
+            k (int): Size of the top compactor of each sketch
+            sketches (Dict of KLLSketch): Sketch per column
+    """
+
+    def __init__(self, k=200, seed=None):
+        """
+            Purpose:
+                Create an empty set of sketches
+            Args:
+                k (int): Size of the top compactor of each sketch.
+                    Defaults to 200 (~0.85% rank error)
+                seed (int): Seed for the compaction coin flips
+        """
+
+        self.k = k
+        self.seed = seed
+        self.sketches = {}
+
+    def update(self, chunk):
+        """
+            Purpose:
+                Add the numeric columns of a chunk of rows
+            Args:
+                chunk (Pandas DataFrame): Chunk of rows to add
+            Return
+                N/A
+        """
+
+        numeric_chunk = chunk._get_numeric_data()
+        values = numeric_chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+        for position, column in enumerate(numeric_chunk.columns):
+            if column not in self.sketches:
+                self.sketches[column] = KLLSketch(k=self.k, seed=self.seed)
+            self.sketches[column].update(values[:, position])
+
+    def merge(self, other):
+        """
+            Purpose:
+                Merge the sketches of another partition
+            Args:
+                other (ColumnQuantileSketch): Sketches to merge
+            Return
+                N/A
+        """
+
+        for column, sketch in other.sketches.items():
+            if column not in self.sketches:
+                self.sketches[column] = KLLSketch(k=self.k, seed=self.seed)
+            self.sketches[column].merge(sketch)
+
+    def quantiles(self, quantiles):
+        """
+            Purpose:
+                Get approximate quantiles of every column
+            Args:
+                quantiles (List of floats): Quantiles between 0 and 1
+            Return
+                column_quantiles (Pandas DataFrame): DataFrame indexed
+                    by quantile with a column per sketched column,
+                    matching the layout of df.quantile(quantiles)
+        """
+
+        return pd.DataFrame(
+            {
+                column: sketch.quantiles(quantiles)
+                for column, sketch in self.sketches.items()
+            },
+            index=pd.Index(quantiles, dtype=np.float64),
+            columns=list(self.sketches.keys())
+        )
+
+    def to_dict(self):
+        """
+            Purpose:
+                Serialize every column sketch
+            Args:
+                N/A
+            Return
+                serialized_sketches (Dict): Serialized KLLSketch bytes
+                    per column
+        """
+
+        return {
+            column: sketch.to_bytes()
+            for column, sketch in self.sketches.items()
+        }
+
+    @classmethod
+    def from_dict(cls, serialized_sketches, k=200, seed=None):
+        """
+            Purpose:
+                Load sketches serialized with to_dict
+            Args:
+                serialized_sketches (Dict): Serialized KLLSketch
+                    bytes per column
+                k (int): Size of the top compactor for new columns
+                seed (int): Seed for the compaction coin flips
+            Return
+                column_sketch (ColumnQuantileSketch): Loaded sketches
+        """
+
+        column_sketch = cls(k=k, seed=seed)
+        for column, sketch_bytes in serialized_sketches.items():
+            column_sketch.sketches[column] =\
+                KLLSketch.from_bytes(sketch_bytes, seed=seed)
+
+        return column_sketch
+
+
+@instrumented
+def sketch_dataframe_chunk_quantiles(chunks, k=200, seed=None):
+    """
+        Purpose:
+            Build a ColumnQuantileSketch from an iterator of
+            DataFrame chunks
+        Args:
+            chunks (Iterator of Pandas DataFrames): Chunks of rows
+            k (int): Size of the top compactor of each sketch.
+                Defaults to 200 (~0.85% rank error)
+            seed (int): Seed for the compaction coin flips
+        Return
+            column_sketch (ColumnQuantileSketch): Sketches of all
+                chunks
+    """
+    logging.info('Sketching Column Quantiles from Chunks')
+
+    column_sketch = ColumnQuantileSketch(k=k, seed=seed)
+    for chunk in chunks:
+        column_sketch.update(chunk)
+
+    return column_sketch
+
+###
+# Covariance Accumulators
+###
+
+class CovarianceAccumulator(object):
+    """
+        Purpose:
+            Mergeable pairwise covariance and correlation of columns,
+            updated chunk by chunk. Each chunk is reduced with a few
+            matrix products over mean shifted values and combined
+            with the Chan et al. parallel update, so results match
+            pandas pairwise-complete df.corr()/df.cov() without
+            holding the data. Accumulators from separate partitions
+            or worker processes (they pickle) combine with merge
+        Attributes:
+            columns (List of strings): Row columns of the matrix
+            paired_columns (List of strings): Columns paired with
+                each row column (defaults to columns)
+            counts (Numpy Array): Rows where both columns are non-null
+            means (Numpy Array): Mean of the row column over those rows
+            paired_means (Numpy Array): Mean of the paired column
+                over those rows
+            sum_squares (Numpy Array): Centered sum of squares of
+                the row column over those rows
+            paired_sum_squares (Numpy Array): Centered sum of squares
+                of the paired column over those rows
+            co_moments (Numpy Array): Centered sum of products
+    """
+
+    def __init__(self, columns=None, paired_columns=None):
+        """
+            Purpose:
+                Create an empty accumulator
+            Args:
+                columns (List of strings): Row columns. Defaults to
+                    the numeric columns of the first chunk
+                paired_columns (List of strings): Columns paired with
+                    each row column. Defaults to columns (a square
+                    matrix)
+        """
+
+        self.columns = None if columns is None else list(columns)
+        self.paired_columns =\
+            None if paired_columns is None else list(paired_columns)
+        self.counts = None
+
+    def update(self, chunk):
+        """
+            Purpose:
+                Add a chunk of rows to the accumulator
+            Args:
+                chunk (Pandas DataFrame): Chunk of rows to add
+            Return
+                N/A
+        """
+
+        if self.columns is None:
+            self.columns = list(chunk._get_numeric_data().columns)
+        if self.paired_columns is None:
+            self.paired_columns = list(self.columns)
+
+        values = chunk[self.columns].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        paired_values = chunk[self.paired_columns].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+
+        chunk_accumulator = CovarianceAccumulator(
+            columns=self.columns, paired_columns=self.paired_columns
+        )
+        chunk_accumulator._set_chunk_moments(values, paired_values)
+        self.merge(chunk_accumulator)
+
+    def merge(self, other):
+        """
+            Purpose:
+                Merge an accumulator over other rows of the same
+                columns into this accumulator
+            Args:
+                other (CovarianceAccumulator): Accumulator to merge
+            Return
+                N/A
+        """
+
+        if other.counts is None:
+            return
+        if self.counts is None:
+            self.columns = other.columns
+            self.paired_columns = other.paired_columns
+            for attribute in self._moment_attributes():
+                setattr(self, attribute, getattr(other, attribute).copy())
+            return
+
+        counts = self.counts + other.counts
+        with np.errstate(divide='ignore', invalid='ignore'):
+            other_weight = np.where(counts > 0, other.counts / counts, 0.)
+            cross_weight = np.where(
+                counts > 0, self.counts * other.counts / counts, 0.
+            )
+        mean_deltas = np.where(other.counts > 0, other.means - self.means, 0.)
+        paired_mean_deltas = np.where(
+            other.counts > 0, other.paired_means - self.paired_means, 0.
+        )
+
+        self.means = self.means + mean_deltas * other_weight
+        self.paired_means =\
+            self.paired_means + paired_mean_deltas * other_weight
+        self.sum_squares = self.sum_squares + other.sum_squares +\
+            mean_deltas ** 2 * cross_weight
+        self.paired_sum_squares =\
+            self.paired_sum_squares + other.paired_sum_squares +\
+            paired_mean_deltas ** 2 * cross_weight
+        self.co_moments = self.co_moments + other.co_moments +\
+            mean_deltas * paired_mean_deltas * cross_weight
+        self.counts = counts
+
+    def covariance(self):
+        """
+            Purpose:
+                Get the sample covariance (ddof=1) of each pair
+            Args:
+                N/A
+            Return
+                covariance (Pandas DataFrame): Covariance indexed by
+                    columns with a column per paired column
+        """
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = np.where(
+                self.counts > 1, self.co_moments / (self.counts - 1), np.nan
+            )
+
+        return pd.DataFrame(
+            covariance, index=self.columns, columns=self.paired_columns
+        )
+
+    def correlation(self):
+        """
+            Purpose:
+                Get the Pearson correlation of each pair
+            Args:
+                N/A
+            Return
+                correlation (Pandas DataFrame): Correlation indexed by
+                    columns with a column per paired column
+        """
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = self.co_moments / np.sqrt(
+                self.sum_squares * self.paired_sum_squares
+            )
+        correlation[self.counts < 2] = np.nan
+
+        return pd.DataFrame(
+            np.clip(correlation, -1., 1.),
+            index=self.columns, columns=self.paired_columns
+        )
+
+    def _set_chunk_moments(self, values, paired_values):
+        """
+            Purpose:
+                Compute the moments of one chunk with matrix products
+                over values shifted by their column means, which
+                keeps the one pass sums numerically stable
+            Args:
+                values (Numpy Array): Chunk values of the row columns
+                paired_values (Numpy Array): Chunk values of the
+                    paired columns
+            Return
+                N/A
+        """
+
+        valid = ~np.isnan(values)
+        paired_valid = ~np.isnan(paired_values)
+        shifts = _get_column_shifts(values, valid)
+        paired_shifts = _get_column_shifts(paired_values, paired_valid)
+        shifted = np.where(valid, values - shifts, 0.)
+        paired_shifted =\
+            np.where(paired_valid, paired_values - paired_shifts, 0.)
+        valid = valid.astype(np.float64)
+        paired_valid = paired_valid.astype(np.float64)
+
+        counts = valid.T @ paired_valid
+        sums = shifted.T @ paired_valid
+        paired_sums = valid.T @ paired_shifted
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(counts > 0, sums / counts, 0.)
+            paired_means = np.where(counts > 0, paired_sums / counts, 0.)
+
+        self.counts = counts
+        self.means = means + shifts[:, None]
+        self.paired_means = paired_means + paired_shifts[None, :]
+        self.sum_squares = (shifted ** 2).T @ paired_valid - sums * means
+        self.paired_sum_squares =\
+            valid.T @ paired_shifted ** 2 - paired_sums * paired_means
+        self.co_moments = shifted.T @ paired_shifted - sums * paired_means
+
+    @staticmethod
+    def _moment_attributes():
+        """
+            Purpose:
+                Names of the accumulated moment matrices
+        """
+
+        return (
+            'counts', 'means', 'paired_means', 'sum_squares',
+            'paired_sum_squares', 'co_moments'
+        )
+
+
+def _get_column_shifts(values, valid):
+    """
+        Purpose:
+            Get the mean of each column of a block, 0 for columns
+            without values
+        Args:
+            values (Numpy Array): 2D block, rows by columns
+            valid (Numpy Array): Boolean mask of non-null values
+        Return
+            shifts (Numpy Array): Mean per column
+    """
+
+    counts = valid.sum(axis=0)
+    sums = np.where(valid, values, 0.).sum(axis=0)
+
+    return np.where(counts > 0, sums / np.maximum(counts, 1), 0.)
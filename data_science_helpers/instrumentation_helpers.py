@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+    Library for instrumenting the helpers. Each instrumented call records its
+    wall time, rows and columns in and out, and optionally its peak memory
+    delta, and sends the record to every registered sink. With no sinks
+    registered an instrumented call costs one check before the helper runs
+"""
+
+# Python Library Imports
+import sys
+import os
+import logging
+import functools
+import json
+import threading
+import time
+import tracemalloc
+import pandas as pd
+import numpy as np
+
+from collections import defaultdict
+
+###
+# Instrumentation Registry
+###
+
+_INSTRUMENTATION_SINKS = []
+_INSTRUMENTATION_STATE = threading.local()
+_TRACK_MEMORY = False
+_STARTED_TRACEMALLOC = False
+
+
+def add_instrumentation_sink(sink):
+    """
+        Purpose:
+            Register a sink to receive a record of every instrumented
+            helper call. A sink is any callable taking the record
+            dict, e.g. a function, a MetricsRegistry, or a
+            JsonLinesSink
+        Args:
+            sink (Callable): Sink to register
+        Return
+            sink (Callable): The registered sink
+    """
+
+    _INSTRUMENTATION_SINKS.append(sink)
+
+    return sink
+
+
+def remove_instrumentation_sink(sink):
+    """
+        Purpose:
+            Unregister a sink
+        Args:
+            sink (Callable): Registered sink
+        Return
+            N/A
+    """
+
+    _INSTRUMENTATION_SINKS.remove(sink)
+
+
+def set_memory_tracking(enabled):
+    """
+        Purpose:
+            Turn peak memory measurement of instrumented calls on or
+            off. Memory is measured with tracemalloc, which slows down
+            allocation heavy helpers, so it is off by default. Tracing
+            is started if needed and stopped again when turned off
+        Args:
+            enabled (bool): Measure peak memory deltas
+        Return
+            N/A
+    """
+    global _TRACK_MEMORY, _STARTED_TRACEMALLOC
+
+    _TRACK_MEMORY = enabled
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _STARTED_TRACEMALLOC = True
+    elif not enabled and _STARTED_TRACEMALLOC:
+        tracemalloc.stop()
+        _STARTED_TRACEMALLOC = False
+
+###
+# Instrumentation Decorators
+###
+
+def instrumented(function):
+    """
+        Purpose:
+            Decorator recording each call of a helper to the
+            registered sinks. The record holds the helper name,
+            seconds, rows_in, columns_in, rows_out, columns_out,
+            peak_memory_delta_bytes (None unless memory tracking is
+            on), and error (None unless the helper raised). Rows and
+            columns are read from the first DataFrame, Series, or
+            array argument and from the result (or the first item of
+            a tuple result)
+        Args:
+            function (Function): Helper to instrument
+        Return
+            wrapped_function (Function): Instrumented helper
+    """
+    helper_name = '{module}.{name}'.format(
+        module=function.__module__.rsplit('.', 1)[-1],
+        name=function.__qualname__
+    )
+
+    @functools.wraps(function)
+    def wrapped_function(*args, **kwargs):
+        if not _INSTRUMENTATION_SINKS:
+            return function(*args, **kwargs)
+
+        rows_in, columns_in = _get_call_shape(args, kwargs)
+        memory_start = _start_memory_measurement()
+        start = time.perf_counter()
+        result = None
+        error = None
+        try:
+            result = function(*args, **kwargs)
+            return result
+        except Exception as err:
+            error = '{name}: {err}'.format(name=type(err).__name__, err=err)
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            rows_out, columns_out = _get_shape(
+                result[0] if isinstance(result, tuple) and result else result
+            )
+            _send_instrumentation_record({
+                'helper': helper_name,
+                'seconds': seconds,
+                'rows_in': rows_in,
+                'columns_in': columns_in,
+                'rows_out': rows_out,
+                'columns_out': columns_out,
+                'peak_memory_delta_bytes':
+                    _stop_memory_measurement(memory_start),
+                'error': error,
+            })
+
+    return wrapped_function
+
+
+def _send_instrumentation_record(record):
+    """
+        Purpose:
+            Send a call record to every sink. A failing sink is logged
+            and does not fail the helper
+        Args:
+            record (Dict): Call record
+        Return
+            N/A
+    """
+
+    for sink in list(_INSTRUMENTATION_SINKS):
+        try:
+            sink(record)
+        except Exception:
+            logging.exception('Instrumentation Sink %r Failed', sink)
+
+
+def _get_call_shape(args, kwargs):
+    """
+        Purpose:
+            Get the rows and columns of the first tabular argument
+        Args:
+            args (Tuple): Positional arguments of the call
+            kwargs (Dict): Keyword arguments of the call
+        Return
+            rows (int): Rows of the argument, or None
+            columns (int): Columns of the argument, or None
+    """
+
+    for value in (*args, *kwargs.values()):
+        rows, columns = _get_shape(value)
+        if rows is not None:
+            return rows, columns
+
+    return None, None
+
+
+def _get_shape(value):
+    """
+        Purpose:
+            Get the rows and columns of a DataFrame, Series, or array
+        Args:
+            value (Any): Value to measure
+        Return
+            rows (int): Rows of the value, or None if not tabular
+            columns (int): Columns of the value, or None if not
+                tabular
+    """
+
+    if isinstance(value, pd.DataFrame):
+        return value.shape
+    if isinstance(value, pd.Series):
+        return len(value), 1
+    if isinstance(value, np.ndarray) and value.ndim:
+        return value.shape[0], value.shape[1] if value.ndim > 1 else 1
+
+    return None, None
+
+
+def _start_memory_measurement():
+    """
+        Purpose:
+            Start measuring the peak traced memory of a call. The
+            running peak of an enclosing instrumented call is saved
+            first so nested calls do not hide it
+        Args:
+            N/A
+        Return
+            memory_start (int): Traced bytes at the start of the call,
+                or None when memory tracking is off
+    """
+
+    if not _TRACK_MEMORY or not tracemalloc.is_tracing():
+        return None
+
+    peak_stack = _get_peak_stack()
+    current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    if peak_stack:
+        peak_stack[-1] = max(peak_stack[-1], peak_bytes)
+    tracemalloc.reset_peak()
+    peak_stack.append(current_bytes)
+
+    return current_bytes
+
+
+def _stop_memory_measurement(memory_start):
+    """
+        Purpose:
+            Finish measuring the peak traced memory of a call and
+            carry the peak up to any enclosing instrumented call
+        Args:
+            memory_start (int): Value of _start_memory_measurement
+        Return
+            peak_memory_delta_bytes (int): Peak traced bytes over the
+                start of the call, or None when not measured
+    """
+
+    if memory_start is None or not tracemalloc.is_tracing():
+        return None
+
+    peak_stack = _get_peak_stack()
+    peak_bytes = max(peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+    if peak_stack:
+        peak_stack[-1] = max(peak_stack[-1], peak_bytes)
+
+    return peak_bytes - memory_start
+
+
+def _get_peak_stack():
+    """
+        Purpose:
+            Get this thread's stack of running peaks of the
+            instrumented calls in progress
+        Args:
+            N/A
+        Return
+            peak_stack (List of ints): Peak traced bytes per call
+    """
+
+    if not hasattr(_INSTRUMENTATION_STATE, 'peak_stack'):
+        _INSTRUMENTATION_STATE.peak_stack = []
+
+    return _INSTRUMENTATION_STATE.peak_stack
+
+###
+# Instrumentation Sinks
+###
+
+class MetricsRegistry(object):
+    """
+        Purpose:
+            Prometheus style sink aggregating call records into
+            counters per helper, rendered in the Prometheus text
+            exposition format
+        Attributes:
+            prefix (string): Prefix of every metric name
+            counters (Dict): Value of each (metric, helper) counter
+    """
+
+    # Metric name and the record field it sums (None counts calls)
+    METRICS = (
+        ('calls_total', None),
+        ('errors_total', 'error'),
+        ('seconds_total', 'seconds'),
+        ('rows_in_total', 'rows_in'),
+        ('rows_out_total', 'rows_out'),
+        ('peak_memory_delta_bytes_total', 'peak_memory_delta_bytes'),
+    )
+
+    def __init__(self, prefix='data_science_helpers'):
+        """
+            Purpose:
+                Create an empty registry
+            Args:
+                prefix (string): Prefix of every metric name
+        """
+
+        self.prefix = prefix
+        self.counters = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        """
+            Purpose:
+                Add a call record to the counters
+            Args:
+                record (Dict): Call record
+            Return
+                N/A
+        """
+
+        with self._lock:
+            for metric, field in self.METRICS:
+                if field is None:
+                    value = 1
+                elif field == 'error':
+                    value = int(record['error'] is not None)
+                else:
+                    value = record[field] or 0
+                self.counters[(metric, record['helper'])] += value
+
+    def get_value(self, metric, helper):
+        """
+            Purpose:
+                Get the value of one counter
+            Args:
+                metric (string): Metric name without prefix, e.g.
+                    "calls_total"
+                helper (string): Helper name, e.g.
+                    "data_engineering_helpers.remove_overly_null_columns"
+            Return
+                value (float): Counter value
+        """
+
+        with self._lock:
+            return self.counters.get((metric, helper), 0.0)
+
+    def render(self):
+        """
+            Purpose:
+                Render every counter in the Prometheus text
+                exposition format
+            Args:
+                N/A
+            Return
+                exposition (string): Metrics text
+        """
+
+        lines = []
+        with self._lock:
+            for metric, _ in self.METRICS:
+                metric_name = '{prefix}_{metric}'.format(
+                    prefix=self.prefix, metric=metric
+                )
+                lines.append('# TYPE {name} counter'.format(name=metric_name))
+                for (counter_metric, helper), value in sorted(
+                    self.counters.items()):
+                    if counter_metric == metric:
+                        lines.append('{name}{{helper="{helper}"}} {value}'.format(
+                            name=metric_name, helper=helper, value=value
+                        ))
+
+        return '\n'.join(lines) + '\n'
+
+
+class JsonLinesSink(object):
+    """
+        Purpose:
+            Sink writing each call record as one line of JSON
+        Attributes:
+            stream (File): Open text stream written to
+    """
+
+    def __init__(self, stream):
+        """
+            Purpose:
+                Create a sink writing to an open text stream, e.g.
+                sys.stderr or open("calls.jsonl", "a")
+            Args:
+                stream (File): Text stream to write to
+        """
+
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        """
+            Purpose:
+                Write a call record as a JSON line
+            Args:
+                record (Dict): Call record
+            Return
+                N/A
+        """
+
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
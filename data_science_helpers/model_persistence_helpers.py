@@ -7,41 +7,171 @@
 # Python Library Imports
 import sys
 import os
+import asyncio
+import io
+import mmap
+import struct
 import logging
 import pandas as pd
 import sklearn
 import pickle
+import json
+import shutil
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from sklearn.model_selection import train_test_split
 
+from data_science_helpers.instrumentation_helpers import instrumented
+
 ###
-# Test/Train Split
+# Model Persistence
 ###
 
+# Arrays at least this large are stored in their own .npy file
+MEMORY_MAPPED_ARRAY_BYTES = 1024 * 1024
+
+# Leading bytes of each compressed pickle stream
+COMPRESSION_MAGIC_BYTES = {
+    'lz4': b'\x04\x22\x4d\x18',
+    'zstd': b'\x28\xb5\x2f\xfd',
+}
+
+# Buffer container header: magic, version, alignment, pickle stream
+# length, buffer table offset, and buffer count
+BUFFER_CONTAINER_MAGIC_BYTES = b'DSHMODEL'
+BUFFER_CONTAINER_VERSION = 1
+BUFFER_CONTAINER_HEADER = struct.Struct('<8sIIQQQ')
+BUFFER_CONTAINER_TABLE_ENTRY = struct.Struct('<QQ')
+
 
-def store_model_as_pickle(filename, config={}, metadata={}):
+@instrumented
+def store_model_as_pickle(
+    model, filename, config=None, metadata=None, compression=None,
+    array_threshold=MEMORY_MAPPED_ARRAY_BYTES):
     """
     Purpose:
         Store a model in memory to a .pkl file for later
         usage. ALso store a .config file and .metadata
-        file with information about the model
+        file with information about the model. NumPy arrays of
+        at least array_threshold bytes are stored uncompressed in
+        a .arrays directory next to the .pkl so load_pickled_model
+        can memory map them; the rest of the pickle stream is
+        optionally compressed
     Args:
+        model (Object): Model to store
         filename (String): Filename of a pickled model (.pkl)
         config (Dict): Configuration data for the model
         metadata (Dict): Metadata related to the model/training/etc
+        compression (String): "lz4", "zstd", or None. lz4 and zstd
+            require the lz4 and zstandard packages
+        array_threshold (int): Size in bytes from which arrays are
+            stored separately. None keeps every array in the pickle
+    Return:
+        N/A
+    """
+
+    if compression not in (None, 'none', *COMPRESSION_MAGIC_BYTES):
+        raise ValueError(f"Unsupported Model Compression: {compression}")
+
+    array_directory = get_model_array_directory(filename)
+    if os.path.isdir(array_directory):
+        shutil.rmtree(array_directory)
+
+    model_bytes = io.BytesIO()
+    model_pickler = _ArrayPickler(
+        model_bytes, array_directory, array_threshold
+    )
+    model_pickler.dump(model)
+    model_bytes = _compress_model_bytes(model_bytes.getvalue(), compression)
+
+    with open(filename, 'wb') as model_file:
+        model_file.write(model_bytes)
+
+    _store_model_sidecars(filename, config, metadata)
+
+    logging.info(
+        "Stored Model (%s) with %d Memory Mapped Arrays",
+        filename, model_pickler.array_count
+    )
+
+
+@instrumented
+def store_model_as_buffer_container(
+    model, filename, config=None, metadata=None, alignment=64):
+    """
+    Purpose:
+        Store a model in one container file: a pickle protocol 5
+        stream followed by its out-of-band buffers (e.g. the data of
+        every NumPy array), each starting on an aligned offset, and
+        a table of buffer offsets. load_pickled_model backs the
+        buffers with mmap, so loading does not copy array data and
+        processes loading the same file share its pages. Also
+        stores the .config and .metadata files
+    Args:
+        model (Object): Model to store
+        filename (String): Filename of the model container
+        config (Dict): Configuration data for the model
+        metadata (Dict): Metadata related to the model/training/etc
+        alignment (int): Byte alignment of each buffer
     Return:
         N/A
     """
 
-    print("No-op")
+    model_buffers = []
+    model_bytes = pickle.dumps(
+        model, protocol=5, buffer_callback=model_buffers.append
+    )
+
+    with open(filename, 'wb') as model_file:
+        model_file.write(b'\x00' * BUFFER_CONTAINER_HEADER.size)
+        model_file.write(model_bytes)
+
+        buffer_table = []
+        for model_buffer in model_buffers:
+            buffer_view = model_buffer.raw()
+            buffer_offset = -model_file.tell() % alignment
+            model_file.write(b'\x00' * buffer_offset)
+            buffer_table.append((model_file.tell(), buffer_view.nbytes))
+            model_file.write(buffer_view)
+
+        table_offset = model_file.tell()
+        for buffer_offset, buffer_length in buffer_table:
+            model_file.write(
+                BUFFER_CONTAINER_TABLE_ENTRY.pack(buffer_offset, buffer_length)
+            )
+
+        model_file.seek(0)
+        model_file.write(BUFFER_CONTAINER_HEADER.pack(
+            BUFFER_CONTAINER_MAGIC_BYTES, BUFFER_CONTAINER_VERSION,
+            alignment, len(model_bytes), table_offset, len(buffer_table)
+        ))
+
+    _store_model_sidecars(filename, config, metadata)
+
+    logging.info(
+        "Stored Model (%s) with %d Out-of-Band Buffers",
+        filename, len(buffer_table)
+    )
 
 
-def load_pickled_model(filename):
+@instrumented
+def load_pickled_model(filename, mmap_mode='r'):
     """
     Purpose:
         Load a model that has been pickled and stored to
-        persistance storage into memory
+        persistance storage into memory. Compression is detected
+        from the file, and arrays stored separately by
+        store_model_as_pickle are memory mapped. Files written by
+        store_model_as_buffer_container are detected and their
+        out-of-band buffers are memory mapped
     Args:
         filename (String): Filename of a pickled model (.pkl)
+        mmap_mode (String): Mapping of arrays and buffers ("r"
+            read-only, "c" copy-on-write), or None to read them
+            into memory
     Return:
         model (Pickeled Object): Pickled model loaded from .pkl
     """
@@ -53,9 +183,662 @@ def load_pickled_model(filename):
 
     try:
         with open(filename, 'rb') as model_file:
-            model = pickle.load(model_file)
+            if model_file.read(len(BUFFER_CONTAINER_MAGIC_BYTES)) ==\
+                BUFFER_CONTAINER_MAGIC_BYTES:
+                return _load_buffer_container(model_file, mmap_mode)
+            model_file.seek(0)
+            model_bytes = _decompress_model_bytes(model_file.read())
+        model = _ArrayUnpickler(
+            io.BytesIO(model_bytes), get_model_array_directory(filename),
+            mmap_mode
+        ).load()
     except Exception as err:
-        logging.exception(f"Exception Loading Pickle from File into Memory: {err}")
+        logging.exception("Exception Loading Pickle from File into Memory: %s", err)
         raise err
 
     return model
+
+
+@instrumented
+def load_model_config(filename):
+    """
+    Purpose:
+        Load the .config file stored with a model
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+    Return:
+        config (Dict): Configuration data for the model
+    """
+
+    with open(get_model_sidecar_filename(filename, 'config')) as config_file:
+        return json.load(config_file)
+
+
+@instrumented
+def load_model_metadata(filename):
+    """
+    Purpose:
+        Load the .metadata file stored with a model
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+    Return:
+        metadata (Dict): Metadata related to the model/training/etc
+    """
+
+    metadata_filename = get_model_sidecar_filename(filename, 'metadata')
+    with open(metadata_filename) as metadata_file:
+        return json.load(metadata_file)
+
+
+def get_model_sidecar_filename(filename, sidecar):
+    """
+    Purpose:
+        Get the filename of a file stored with a model, e.g.
+        model.pkl -> model.config
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+        sidecar (String): Extension of the sidecar file
+    Return:
+        sidecar_filename (String): Filename of the sidecar file
+    """
+
+    return f"{os.path.splitext(filename)[0]}.{sidecar}"
+
+
+def get_model_array_directory(filename):
+    """
+    Purpose:
+        Get the directory holding the separately stored arrays
+        of a model
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+    Return:
+        array_directory (String): Directory of .npy files
+    """
+
+    return get_model_sidecar_filename(filename, 'arrays')
+
+
+def get_model_file_signature(filename):
+    """
+    Purpose:
+        Get the mtime and size of a model file, which change when
+        the model is stored again
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+    Return:
+        file_signature (Tuple): Modified time in ns and size in bytes
+    """
+
+    if not os.path.isfile(filename):
+        error_msg = f"Model Filename ({filename}) does not exist, exiting"
+        logging.error(error_msg)
+        raise Exception(error_msg)
+
+    file_stat = os.stat(filename)
+
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def get_model_file_bytes(filename):
+    """
+    Purpose:
+        Get the approximate size of a model as the bytes of its
+        .pkl file and separately stored arrays
+    Args:
+        filename (String): Filename of a pickled model (.pkl)
+    Return:
+        model_bytes (int): Bytes of the model files
+    """
+
+    model_bytes = os.path.getsize(filename)
+    array_directory = get_model_array_directory(filename)
+    if os.path.isdir(array_directory):
+        for array_filename in os.listdir(array_directory):
+            model_bytes += os.path.getsize(
+                os.path.join(array_directory, array_filename)
+            )
+
+    return model_bytes
+
+
+def _store_model_sidecars(filename, config, metadata):
+    """
+    Purpose:
+        Store the .config and .metadata files of a model
+    Args:
+        filename (String): Filename of the model
+        config (Dict): Configuration data for the model
+        metadata (Dict): Metadata related to the model/training/etc
+    Return:
+        N/A
+    """
+
+    for sidecar, sidecar_values in (
+        ('config', config), ('metadata', metadata)
+    ):
+        sidecar_filename = get_model_sidecar_filename(filename, sidecar)
+        with open(sidecar_filename, 'w') as sidecar_file:
+            json.dump(sidecar_values or {}, sidecar_file, indent=4)
+
+
+def _load_buffer_container(model_file, mmap_mode):
+    """
+    Purpose:
+        Load a model from a buffer container, passing slices of a
+        memory mapping of the file as its out-of-band buffers. The
+        mapping stays open while any loaded array references it
+    Args:
+        model_file (File): Open container file
+        mmap_mode (String): "r" read-only, "c" copy-on-write, or
+            None to read the buffers into memory
+    Return:
+        model (Object): Loaded model
+    """
+
+    if mmap_mode is None:
+        model_file.seek(0)
+        model_view = memoryview(bytearray(model_file.read()))
+    else:
+        model_view = memoryview(mmap.mmap(
+            model_file.fileno(), 0,
+            access=mmap.ACCESS_READ if mmap_mode == 'r' else mmap.ACCESS_COPY
+        ))
+
+    _, version, _, pickle_length, table_offset, buffer_count =\
+        BUFFER_CONTAINER_HEADER.unpack_from(model_view)
+    if version != BUFFER_CONTAINER_VERSION:
+        raise pickle.UnpicklingError(
+            f"Unsupported Buffer Container Version: {version}"
+        )
+
+    model_buffers = []
+    for buffer_index in range(buffer_count):
+        buffer_offset, buffer_length =\
+            BUFFER_CONTAINER_TABLE_ENTRY.unpack_from(
+                model_view,
+                table_offset + buffer_index * BUFFER_CONTAINER_TABLE_ENTRY.size
+            )
+        model_buffers.append(
+            model_view[buffer_offset:buffer_offset + buffer_length]
+        )
+
+    pickle_start = BUFFER_CONTAINER_HEADER.size
+
+    return pickle.loads(
+        model_view[pickle_start:pickle_start + pickle_length],
+        buffers=model_buffers
+    )
+
+
+def _compress_model_bytes(model_bytes, compression):
+    """
+    Purpose:
+        Compress a pickle stream
+    Args:
+        model_bytes (Bytes): Pickle stream
+        compression (String): "lz4", "zstd", or None
+    Return:
+        model_bytes (Bytes): Compressed pickle stream
+    """
+
+    if compression == 'lz4':
+        import lz4.frame
+        return lz4.frame.compress(model_bytes)
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor().compress(model_bytes)
+
+    return model_bytes
+
+
+def _decompress_model_bytes(model_bytes):
+    """
+    Purpose:
+        Decompress a pickle stream, detecting the compression from
+        its leading bytes
+    Args:
+        model_bytes (Bytes): Stored pickle stream
+    Return:
+        model_bytes (Bytes): Uncompressed pickle stream
+    """
+
+    if model_bytes.startswith(COMPRESSION_MAGIC_BYTES['lz4']):
+        import lz4.frame
+        return lz4.frame.decompress(model_bytes)
+    if model_bytes.startswith(COMPRESSION_MAGIC_BYTES['zstd']):
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(model_bytes)
+
+    return model_bytes
+
+
+class _ArrayPickler(pickle.Pickler):
+    """
+    Purpose:
+        Pickler writing large NumPy arrays to their own .npy files
+        and referencing them by persistent id
+    Attributes:
+        array_directory (String): Directory of .npy files
+        array_threshold (int): Size in bytes from which arrays are
+            stored separately, or None
+        array_count (int): Arrays stored separately
+    """
+
+    def __init__(self, file, array_directory, array_threshold):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.array_directory = array_directory
+        self.array_threshold = array_threshold
+        self.array_count = 0
+        self._array_filenames = {}
+
+    def persistent_id(self, obj):
+        if (
+            self.array_threshold is None
+            or type(obj) not in (np.ndarray, np.memmap)
+            or obj.dtype.hasobject
+            or obj.nbytes < self.array_threshold
+        ):
+            return None
+
+        if id(obj) not in self._array_filenames:
+            os.makedirs(self.array_directory, exist_ok=True)
+            array_filename = f"array_{self.array_count}.npy"
+            np.save(
+                os.path.join(self.array_directory, array_filename), obj,
+                allow_pickle=False
+            )
+            self._array_filenames[id(obj)] = array_filename
+            self.array_count += 1
+
+        return ('numpy_array', self._array_filenames[id(obj)])
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    """
+    Purpose:
+        Unpickler loading arrays stored by _ArrayPickler
+    Attributes:
+        array_directory (String): Directory of .npy files
+        mmap_mode (String): numpy.load mmap_mode, or None
+    """
+
+    def __init__(self, file, array_directory, mmap_mode):
+        super().__init__(file)
+        self.array_directory = array_directory
+        self.mmap_mode = mmap_mode
+
+    def persistent_load(self, pid):
+        kind, array_filename = pid
+        if kind != 'numpy_array':
+            raise pickle.UnpicklingError(f"Unsupported Persistent Id: {pid}")
+
+        return np.load(
+            os.path.join(self.array_directory, array_filename),
+            mmap_mode=self.mmap_mode, allow_pickle=False
+        )
+
+
+###
+# Model Cache
+###
+
+
+class ModelCache(object):
+    """
+    Purpose:
+        Thread-safe in-process LRU cache of loaded models. Entries
+        are keyed by the model path and checked against the file's
+        mtime and size on every lookup, so a replaced model file is
+        reloaded. Concurrent first loads of the same file share one
+        load. The cache is bounded by model count and by the
+        approximate bytes of each model's files on disk
+    Attributes:
+        max_models (int): Models kept loaded
+        max_bytes (int): Approximate bytes kept loaded, or None
+        mmap_mode (String): load_pickled_model mmap_mode
+        hits (int): Lookups served without a new load
+        misses (int): Lookups that loaded the model
+        evictions (int): Models removed to stay within bounds or
+            because their file changed
+    """
+
+    def __init__(self, max_models=16, max_bytes=None, mmap_mode='r'):
+        """
+        Purpose:
+            Create an empty model cache
+        Args:
+            max_models (int): Models kept loaded
+            max_bytes (int): Approximate bytes kept loaded, or None
+                for no byte bound
+            mmap_mode (String): load_pickled_model mmap_mode
+        Return:
+            N/A
+        """
+
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.cached_bytes = 0
+        self._models = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, filename):
+        """
+        Purpose:
+            Get a model, loading it with load_pickled_model if it is
+            not cached or its file changed since it was loaded
+        Args:
+            filename (String): Filename of a pickled model (.pkl)
+        Return:
+            model (Pickeled Object): Loaded model
+        """
+
+        model_path = os.path.abspath(filename)
+        file_signature = get_model_file_signature(model_path)
+
+        loading_key = (model_path, file_signature)
+
+        with self._lock:
+            cached_model = self._models.get(model_path)
+            if cached_model is not None:
+                if cached_model[0] == file_signature:
+                    self._models.move_to_end(model_path)
+                    self.hits += 1
+                    return cached_model[1]
+                self._remove_model(model_path)
+
+            loading_future = self._loading.get(loading_key)
+            is_loader = loading_future is None
+            if is_loader:
+                loading_future = Future()
+                self._loading[loading_key] = loading_future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not is_loader:
+            return loading_future.result()
+
+        try:
+            model = load_pickled_model(model_path, mmap_mode=self.mmap_mode)
+        except Exception as err:
+            with self._lock:
+                del self._loading[loading_key]
+            loading_future.set_exception(err)
+            raise err
+
+        with self._lock:
+            del self._loading[loading_key]
+            self._models[model_path] = (
+                file_signature, model, get_model_file_bytes(model_path)
+            )
+            self.cached_bytes += self._models[model_path][2]
+            self._evict_models()
+        loading_future.set_result(model)
+
+        return model
+
+    def invalidate(self, filename=None):
+        """
+        Purpose:
+            Remove one model, or every model, from the cache
+        Args:
+            filename (String): Filename of the model to remove, or
+                None to remove every model
+        Return:
+            N/A
+        """
+
+        with self._lock:
+            model_paths = (
+                list(self._models) if filename is None
+                else [os.path.abspath(filename)]
+            )
+            for model_path in model_paths:
+                if model_path in self._models:
+                    self._remove_model(model_path)
+
+    def _remove_model(self, model_path):
+        """
+        Purpose:
+            Remove a cached model and count the eviction. The lock
+            must be held
+        Args:
+            model_path (String): Absolute path of the model
+        Return:
+            N/A
+        """
+
+        self.cached_bytes -= self._models.pop(model_path)[2]
+        self.evictions += 1
+
+    def _evict_models(self):
+        """
+        Purpose:
+            Remove least recently used models until the cache is
+            within its bounds, always keeping the newest model. The
+            lock must be held
+        Args:
+            N/A
+        Return:
+            N/A
+        """
+
+        while len(self._models) > 1 and (
+            len(self._models) > self.max_models
+            or (
+                self.max_bytes is not None
+                and self.cached_bytes > self.max_bytes
+            )
+        ):
+            self._remove_model(next(iter(self._models)))
+
+
+###
+# Model Preloading
+###
+
+
+class ModelPreloader(object):
+    """
+    Purpose:
+        Load a list of models concurrently in a background thread
+        pool. Each model has a Future (or an awaitable through
+        wait_for_model) so a service can start accepting traffic
+        while the remaining models warm, and report readiness and
+        health from get_status. Loads go through a ModelCache when
+        one is passed, so served lookups reuse the preloaded models
+    Attributes:
+        filenames (List of Strings): Filenames of the models
+        model_cache (ModelCache): Cache to load through, or None
+        load_seconds (Dict): Seconds each finished load took
+    """
+
+    def __init__(self, filenames, max_workers=None, model_cache=None):
+        """
+        Purpose:
+            Start loading every model in the background
+        Args:
+            filenames (List of Strings): Filenames of the models
+            max_workers (int): Loader threads. None for the
+                ThreadPoolExecutor default
+            model_cache (ModelCache): Cache to load through, or None
+                to call load_pickled_model directly
+        Return:
+            N/A
+        """
+
+        self.filenames = list(filenames)
+        self.model_cache = model_cache
+        self.load_seconds = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='model-preloader'
+        )
+        self._futures = {
+            filename: self._executor.submit(self._load_model, filename)
+            for filename in self.filenames
+        }
+        logging.info("Preloading %d Models", len(self.filenames))
+
+    def get_future(self, filename):
+        """
+        Purpose:
+            Get the Future of a model's load
+        Args:
+            filename (String): Filename of a preloaded model
+        Return:
+            future (Future): Future resolving to the model
+        """
+
+        return self._futures[filename]
+
+    def get_model(self, filename, timeout=None):
+        """
+        Purpose:
+            Get a model, blocking until its load finishes
+        Args:
+            filename (String): Filename of a preloaded model
+            timeout (float): Seconds to wait, or None to wait until
+                the load finishes
+        Return:
+            model (Pickeled Object): Loaded model
+        """
+
+        return self._futures[filename].result(timeout=timeout)
+
+    async def wait_for_model(self, filename):
+        """
+        Purpose:
+            Await a model without blocking the event loop
+        Args:
+            filename (String): Filename of a preloaded model
+        Return:
+            model (Pickeled Object): Loaded model
+        """
+
+        return await asyncio.wrap_future(self._futures[filename])
+
+    async def wait_until_ready(self):
+        """
+        Purpose:
+            Await every model, raising the first load error
+        Args:
+            N/A
+        Return:
+            models (Dict): Loaded model of each filename
+        """
+
+        models = await asyncio.gather(*(
+            asyncio.wrap_future(self._futures[filename])
+            for filename in self.filenames
+        ))
+
+        return dict(zip(self.filenames, models))
+
+    def is_ready(self, filename=None):
+        """
+        Purpose:
+            Check whether a model, or every model, loaded successfully
+        Args:
+            filename (String): Filename of a preloaded model, or None
+                for every model
+        Return:
+            is_ready (Boolean): Whether the models are ready
+        """
+
+        filenames = self.filenames if filename is None else [filename]
+
+        return all(
+            self._get_model_status(filename) == 'ready'
+            for filename in filenames
+        )
+
+    def get_status(self):
+        """
+        Purpose:
+            Get the readiness and health of the preloaded models
+        Args:
+            N/A
+        Return:
+            status (Dict): Status ("loading", "ready", or "failed")
+                of each model, counts of each status, and the error
+                of each failed model
+        """
+
+        model_status = {
+            filename: self._get_model_status(filename)
+            for filename in self.filenames
+        }
+
+        return {
+            'models': model_status,
+            'loading': list(model_status.values()).count('loading'),
+            'ready': list(model_status.values()).count('ready'),
+            'failed': list(model_status.values()).count('failed'),
+            'errors': {
+                filename: (
+                    'Load Cancelled' if self._futures[filename].cancelled()
+                    else str(self._futures[filename].exception())
+                )
+                for filename, status in model_status.items()
+                if status == 'failed'
+            },
+        }
+
+    def shutdown(self, wait=True):
+        """
+        Purpose:
+            Stop the loader threads, cancelling loads not yet started
+        Args:
+            wait (Boolean): Wait for running loads to finish
+        Return:
+            N/A
+        """
+
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_model_status(self, filename):
+        """
+        Purpose:
+            Get the status of one model's load
+        Args:
+            filename (String): Filename of a preloaded model
+        Return:
+            status (String): "loading", "ready", or "failed"
+        """
+
+        future = self._futures[filename]
+        if not future.done():
+            return 'loading'
+        if future.cancelled() or future.exception() is not None:
+            return 'failed'
+
+        return 'ready'
+
+    def _load_model(self, filename):
+        """
+        Purpose:
+            Load one model in a loader thread
+        Args:
+            filename (String): Filename of the model
+        Return:
+            model (Pickeled Object): Loaded model
+        """
+
+        load_start = time.perf_counter()
+        if self.model_cache is None:
+            model = load_pickled_model(filename)
+        else:
+            model = self.model_cache.get_model(filename)
+        self.load_seconds[filename] = time.perf_counter() - load_start
+        logging.info(
+            "Preloaded Model (%s) in %.3f Seconds",
+            filename, self.load_seconds[filename]
+        )
+
+        return model
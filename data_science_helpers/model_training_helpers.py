@@ -8,23 +8,45 @@
 import sys
 import os
 import logging
+import tempfile
+import time
+import collections
 import pandas as pd
+import numpy as np
 import sklearn
 
-from sklearn.model_selection import train_test_split
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from sklearn.base import clone
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import (
+    GroupKFold, GroupShuffleSplit, KFold, ParameterGrid, StratifiedKFold,
+    TimeSeriesSplit, train_test_split
+)
+from urllib.parse import quote
+
+from data_science_helpers.instrumentation_helpers import instrumented
+
+# Directory name Hive uses for null partition values
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
 
 ###
 # Test/Train Split
 ###
 
+@instrumented
 def split_dataframe_for_model_training(
-    df, dependent_variable, independent_variables=None, train_size=.70):
+    df, dependent_variable, independent_variables=None, train_size=.70,
+    stratify_column=None, group_column=None, time_column=None,
+    random_state=None):
     """
         Purpose:
             Takes in DataFrame and creates 4 DataFrames.
             2 DataFrames holding X varib DataFrames and 2 Model Y DataFrames.
             Train size is defaulted at 70% and the split defaults to using
-            all passed in columns.
+            all passed in columns. Rows are chosen as positional indices
+            (see get_train_test_split_indices) and each output is taken
+            from the passed in DataFrame once, without copying the
+            projected DataFrame first
         Args:
             df (Pandas DataFrame): DataFrame to split
             dependent_variable (string): dependent variable being
@@ -36,6 +58,13 @@ def split_dataframe_for_model_training(
             train_size (float): Percentage of rows in DataFrame
                 to use testing model. Inverse precentage will/can
                 be used to test the model's effectiveness
+            stratify_column (string): Keep the proportion of each value
+                of this column equal in train and test. Defaults to None
+            group_column (string): Keep all rows of each value of this
+                column in either train or test. Defaults to None
+            time_column (string): Train on the earliest rows by this
+                column and test on the latest. Defaults to None
+            random_state (int): Seed of the shuffle. Defaults to None
         Return
             train_x (Pandas DataFrame): DataFrame with all independent variables
                 for training the model. Size is equal to a percentage of the
@@ -52,56 +81,807 @@ def split_dataframe_for_model_training(
     """
     logging.info('Creating Train/Test Split for DataFrame')
     logging.info(
-        'Data Train-Size Set to {train_size}. {test_size} for Testing'.format(
-            train_size=train_size, test_size=(1-train_size)
-        )
+        'Data Train-Size Set to %s. %s for Testing',
+        train_size, 1 - train_size
     )
 
     if not independent_variables:
         independent_variables = list(df.columns)
         independent_variables.remove(dependent_variable)
     logging.info(
-        'Independent Variables for Modeling: {independent_variables}'.format(
-            independent_variables=independent_variables
-        )
+        'Independent Variables for Modeling: %s', independent_variables
     )
 
-    model_variables = independent_variables + list(dependent_variable)
-    df = df[model_variables]
-    train, test =\
-        train_test_split(df, test_size=(1-train_size))
+    independent_positions = df.columns.get_indexer(independent_variables)
+    if (independent_positions == -1).any():
+        raise KeyError('{missing} not in DataFrame columns'.format(
+            missing=[
+                variable for variable, position in zip(
+                    independent_variables, independent_positions
+                ) if position == -1
+            ]
+        ))
+    dependent_position = df.columns.get_loc(dependent_variable)
 
-    train_y_observed = train[dependent_variable]
-    test_y_observed  = test[dependent_variable]
-    train_x = train[independent_variables]
-    test_x  = test[independent_variables]
+    train_indices, test_indices = get_train_test_split_indices(
+        df, train_size=train_size, stratify_column=stratify_column,
+        group_column=group_column, time_column=time_column,
+        random_state=random_state
+    )
+
+    train_y_observed = df.iloc[train_indices, dependent_position]
+    test_y_observed  = df.iloc[test_indices, dependent_position]
+    train_x = df.iloc[train_indices, independent_positions]
+    test_x  = df.iloc[test_indices, independent_positions]
 
     return train_x, test_x, train_y_observed, test_y_observed
 
 
-def split_dataframe_by_column(df, column):
+@instrumented
+def get_train_test_split_indices(
+    df, train_size=.70, stratify_column=None, group_column=None,
+    time_column=None, random_state=None):
+    """
+        Purpose:
+            Get the positional row indices of a train/test split without
+            copying any data. The split is a shuffled holdout by
+            default, or stratified, grouped, or time ordered holdout
+            when the matching column is passed (at most one)
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            train_size (float): Percentage of rows to train on
+            stratify_column (string): Keep the proportion of each value
+                of this column equal in train and test. Defaults to None
+            group_column (string): Keep all rows of each value of this
+                column in either train or test. Defaults to None
+            time_column (string): Train on the earliest rows by this
+                column and test on the latest. Defaults to None
+            random_state (int): Seed of the shuffle. Defaults to None
+        Return
+            train_indices (Numpy Array): Row positions to train on
+            test_indices (Numpy Array): Row positions to test on
+    """
+
+    _check_split_columns(stratify_column, group_column, time_column)
+    row_positions = np.arange(len(df))
+
+    if time_column is not None:
+        row_positions = _get_time_ordered_positions(df, time_column)
+        train_count = int(round(len(df) * train_size))
+        return row_positions[:train_count], row_positions[train_count:]
+
+    if group_column is not None:
+        group_splitter = GroupShuffleSplit(
+            n_splits=1, train_size=train_size, random_state=random_state
+        )
+        return next(group_splitter.split(
+            row_positions, groups=df[group_column]
+        ))
+
+    return train_test_split(
+        row_positions, train_size=train_size, random_state=random_state,
+        stratify=(
+            None if stratify_column is None else df[stratify_column]
+        )
+    )
+
+
+def iterate_k_fold_indices(
+    df, n_splits=5, shuffle=True, stratify_column=None, group_column=None,
+    time_column=None, random_state=None):
+    """
+        Purpose:
+            Lazily yield the positional row indices of each fold of a
+            k-fold split. No data is copied per fold; take rows with
+            df.iloc only when a fold is used. Folds are stratified,
+            grouped, or time ordered (expanding window, training on
+            earlier rows than it tests on) when the matching column is
+            passed (at most one)
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            n_splits (int): Number of folds. Defaults to 5
+            shuffle (bool): Shuffle rows before creating plain or
+                stratified folds. Defaults to True
+            stratify_column (string): Keep the proportion of each value
+                of this column equal in every fold. Defaults to None
+            group_column (string): Keep all rows of each value of this
+                column in one fold. Defaults to None
+            time_column (string): Order rows by this column for
+                expanding window folds. Defaults to None
+            random_state (int): Seed of the shuffle. Defaults to None
+        Return
+            folds (Generator of Tuples): Train and test row positions
+                of each fold
+    """
+
+    _check_split_columns(stratify_column, group_column, time_column)
+    row_positions = np.arange(len(df))
+    shuffle_kwargs = {
+        'shuffle': shuffle, 'random_state': random_state if shuffle else None
+    }
+
+    if time_column is not None:
+        row_positions = _get_time_ordered_positions(df, time_column)
+        for train_folds, test_folds in TimeSeriesSplit(
+            n_splits=n_splits).split(row_positions):
+            yield row_positions[train_folds], row_positions[test_folds]
+    elif group_column is not None:
+        yield from GroupKFold(n_splits=n_splits).split(
+            row_positions, groups=df[group_column]
+        )
+    elif stratify_column is not None:
+        yield from StratifiedKFold(n_splits=n_splits, **shuffle_kwargs).split(
+            row_positions, df[stratify_column]
+        )
+    else:
+        yield from KFold(n_splits=n_splits, **shuffle_kwargs).split(
+            row_positions
+        )
+
+
+def _check_split_columns(stratify_column, group_column, time_column):
+    """
+        Purpose:
+            Check at most one split strategy column is passed
+        Args:
+            stratify_column (string): Stratify column or None
+            group_column (string): Group column or None
+            time_column (string): Time column or None
+        Return
+            N/A
+    """
+
+    split_columns = [
+        split_column
+        for split_column in (stratify_column, group_column, time_column)
+        if split_column is not None
+    ]
+    if len(split_columns) > 1:
+        raise ValueError(
+            'Only one of stratify_column, group_column, and time_column '
+            'can be passed, got {split_columns}'.format(
+                split_columns=split_columns
+            )
+        )
+
+
+def _get_time_ordered_positions(df, time_column):
+    """
+        Purpose:
+            Get row positions ordered by a time column, keeping the
+            original order of ties
+        Args:
+            df (Pandas DataFrame): DataFrame to order
+            time_column (string): Column to order by
+        Return
+            row_positions (Numpy Array): Row positions in time order
+    """
+
+    return np.argsort(df[time_column].to_numpy(), kind='stable')
+
+
+@instrumented
+def split_dataframe_by_column(df, column, dropna=False):
     """
         Purpose:
             Split dataframe into multipel dataframes based on uniqueness
             of columns passed in. The dataframe is then split into smaller
-            dataframes, one for each value of the variable.
+            dataframes, one for each value of the variable. Rows are
+            grouped in a single pass (see get_column_partition_indices)
+            instead of one scan of the data per value
         Args:
             df (Pandas DataFrame): DataFrame to split
             column (string): string of the column name to split on
+            dropna (bool): Leave out rows where the column is null.
+                Defaults to False (null rows are kept under "nan")
         Return
             split_df (Dict of Pandas DataFrames): Dictionary with the
                 split dataframes and the value that the column maps to
                 e.g false/true/0/1
     """
     logging.info('Spliting Dataframes on Column')
+    logging.info('Columns to Split on: %s', column)
+
+    split_df = {}
+    for column_value, partition_df in iterate_dataframe_partitions(
+        df, column, dropna=dropna):
+        split_df[str(column_value)] = partition_df
+
+    return split_df
+
+
+@instrumented
+def get_column_partition_indices(df, column, dropna=False):
+    """
+        Purpose:
+            Get the positional row indices of each value of a column.
+            Values are factorized once and the row positions are
+            grouped with one stable argsort of the codes, so the cost
+            does not grow with the number of distinct values
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            column (string): string of the column name to split on
+            dropna (bool): Leave out rows where the column is null.
+                Defaults to False (null rows form their own partition)
+        Return
+            partition_indices (Dict of Numpy Arrays): Dictionary with
+                each column value, in order of first appearance, and
+                the ascending row positions holding it
+    """
+
+    column_values, row_positions, partition_ends =\
+        _get_sorted_partition_positions(df, column, dropna)
+
+    return dict(zip(
+        column_values, np.split(row_positions, partition_ends[:-1])
+    ))
+
+
+def _get_sorted_partition_positions(df, column, dropna):
+    """
+        Purpose:
+            Order the row positions of a DataFrame by the partition
+            of a column they belong to
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            column (string): string of the column name to split on
+            dropna (bool): Leave out rows where the column is null
+        Return
+            column_values (Array-like): Each column value, in order of
+                first appearance
+            row_positions (Numpy Array): Row positions grouped by
+                partition, ascending within each partition
+            partition_ends (Numpy Array): End offset of each partition
+                in row_positions
+    """
+
+    codes, column_values = pd.factorize(
+        df[column], use_na_sentinel=dropna
+    )
+    if dropna:
+        row_positions = np.flatnonzero(codes >= 0)
+        codes = codes[row_positions]
+    else:
+        row_positions = np.arange(len(codes))
+
+    row_positions = row_positions[np.argsort(codes, kind='stable')]
+    partition_ends = np.cumsum(
+        np.bincount(codes, minlength=len(column_values))
+    )
+
+    return column_values, row_positions, partition_ends
+
+
+def iterate_dataframe_partitions(df, column, dropna=False):
+    """
+        Purpose:
+            Yield the partition of a DataFrame for each value of a
+            column. The rows are reordered by partition with one take,
+            and each partition is a slice of the reordered DataFrame
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            column (string): string of the column name to split on
+            dropna (bool): Leave out rows where the column is null.
+                Defaults to False
+        Return
+            partitions (Generator of Tuples): Column value and the
+                DataFrame of its rows
+    """
+
+    column_values, row_positions, partition_ends =\
+        _get_sorted_partition_positions(df, column, dropna)
+    sorted_df = df.take(row_positions)
+
+    # _slice is the positional row slice groupby uses for its groups; it
+    # skips the per call validation of iloc
+    partition_start = 0
+    for column_value, partition_end in zip(column_values, partition_ends):
+        yield column_value, sorted_df._slice(
+            slice(partition_start, partition_end)
+        )
+        partition_start = partition_end
+
+
+@instrumented
+def write_dataframe_partitions_to_parquet(
+    df, column, directory, dropna=False):
+    """
+        Purpose:
+            Stream each partition of a DataFrame to its own Parquet
+            file using Hive style directories
+            (directory/column=value/part-0.parquet). Only one
+            partition is held in memory at a time, the partition
+            column is stored in the directory name, and null values
+            use the Hive default partition name. Requires pyarrow
+        Args:
+            df (Pandas DataFrame): DataFrame to split
+            column (string): string of the column name to split on
+            directory (string): Root directory of the partitioned
+                dataset
+            dropna (bool): Leave out rows where the column is null.
+                Defaults to False
+        Return
+            partition_filenames (Dict): Dictionary with each column
+                value and the Parquet file holding its rows
+    """
+    logging.info('Writing Partitions of %s to %s', column, directory)
+
+    partition_filenames = {}
+    for column_value, partition_df in iterate_dataframe_partitions(
+        df, column, dropna=dropna):
+        if pd.isna(column_value):
+            partition_name = HIVE_DEFAULT_PARTITION
+        else:
+            partition_name = quote(str(column_value), safe='')
+        partition_directory = os.path.join(
+            directory, '{column}={value}'.format(
+                column=quote(str(column), safe=''), value=partition_name
+            )
+        )
+        os.makedirs(partition_directory, exist_ok=True)
+
+        partition_filename = os.path.join(
+            partition_directory, 'part-0.parquet'
+        )
+        partition_df.drop(columns=[column]).to_parquet(
+            partition_filename, index=False
+        )
+        partition_filenames[column_value] = partition_filename
+
+    return partition_filenames
+
+###
+# Batch Inference Functions
+###
+
+@instrumented
+def predict_dataframe_in_chunks(
+    model, df, chunk_size=100000, n_jobs=None, use_processes=False,
+    method='predict', output=None, parquet_filename=None):
+    """
+        Purpose:
+            Score a large DataFrame in row chunks over a thread or
+            process pool. At most two chunks per worker are in flight,
+            so memory is bounded by the chunk size rather than the
+            DataFrame size. Predictions are written in row order to
+            an output array (e.g. a np.memmap) or streamed to a
+            Parquet file with one row group per chunk (requires
+            pyarrow). Threads suit models that release the GIL while
+            predicting; processes receive the model once per worker
+        Args:
+            model (Object): Fitted model
+            df (Pandas DataFrame): DataFrame to score
+            chunk_size (int): Rows per chunk. Defaults to 100000
+            n_jobs (int): Worker threads or processes. None for one
+                per CPU
+            use_processes (bool): Score in a process pool instead of
+                a thread pool. Defaults to False
+            method (string): Model method to call, e.g.
+                "predict_proba". Defaults to "predict"
+            output (Numpy Array): Array with a row per DataFrame row
+                to write predictions to. Defaults to a new array
+            parquet_filename (string): Stream predictions to this
+                Parquet file instead of an array. Defaults to None
+        Return
+            predictions (Numpy Array): Predictions, or None when
+                streaming to Parquet
+            inference_report (Dict): rows, chunks, seconds, and
+                rows_per_second of the run
+    """
     logging.info(
-        'Columns to Split on: {column}'.format(column=column)
+        'Scoring %d Rows in Chunks of %d', len(df), chunk_size
     )
 
-    column_values = df[column].unique()
+    n_jobs = n_jobs or os.cpu_count() or 1
+    chunk_starts = range(0, len(df), chunk_size)
+    inference_start = time.perf_counter()
 
-    split_df = {}
-    for column_value in column_values:
-        split_df[str(column_value)] = df[df[column] == column_value]
+    if use_processes:
+        executor = ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_set_worker_model,
+            initargs=(model,)
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=n_jobs)
 
-    return split_df
+    parquet_writer = None
+    pending_chunks = collections.deque()
+    try:
+        for chunk_start in chunk_starts:
+            chunk_df = df.iloc[chunk_start:chunk_start + chunk_size]
+            if use_processes:
+                chunk_future = executor.submit(
+                    _predict_worker_chunk, method, chunk_df
+                )
+            else:
+                chunk_future = executor.submit(
+                    _predict_chunk, model, method, chunk_df
+                )
+            pending_chunks.append((chunk_start, chunk_future))
+
+            while pending_chunks and (
+                len(pending_chunks) >= n_jobs * 2
+                or chunk_start == chunk_starts[-1]
+            ):
+                finished_start, chunk_future = pending_chunks.popleft()
+                chunk_predictions = chunk_future.result()
+                if parquet_filename is not None:
+                    parquet_writer = _write_parquet_predictions(
+                        parquet_writer, parquet_filename, chunk_predictions
+                    )
+                    continue
+                if output is None:
+                    output = np.empty(
+                        (len(df), ) + chunk_predictions.shape[1:],
+                        dtype=chunk_predictions.dtype
+                    )
+                output[finished_start:finished_start +
+                       len(chunk_predictions)] = chunk_predictions
+    finally:
+        executor.shutdown(cancel_futures=True)
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    # An empty DataFrame has no chunks to size the output from
+    if output is None and parquet_filename is None:
+        output = np.empty(0)
+
+    inference_seconds = time.perf_counter() - inference_start
+    inference_report = {
+        'rows': len(df),
+        'chunks': len(chunk_starts),
+        'seconds': inference_seconds,
+        'rows_per_second': (
+            len(df) / inference_seconds if inference_seconds else 0.0
+        ),
+    }
+    logging.info(
+        'Scored %d Rows at %.0f Rows per Second',
+        inference_report['rows'], inference_report['rows_per_second']
+    )
+
+    return output, inference_report
+
+
+def _predict_chunk(model, method, chunk_df):
+    """
+        Purpose:
+            Score one chunk of rows
+        Args:
+            model (Object): Fitted model
+            method (string): Model method to call
+            chunk_df (Pandas DataFrame): Rows to score
+        Return
+            chunk_predictions (Numpy Array): Predictions of the rows
+    """
+
+    return np.asarray(getattr(model, method)(chunk_df))
+
+
+_WORKER_MODEL = None
+
+
+def _set_worker_model(model):
+    """
+        Purpose:
+            Process pool initializer storing the model once per worker
+        Args:
+            model (Object): Fitted model
+        Return
+            N/A
+    """
+    global _WORKER_MODEL
+
+    _WORKER_MODEL = model
+
+
+def _predict_worker_chunk(method, chunk_df):
+    """
+        Purpose:
+            Score one chunk of rows with the worker's model
+        Args:
+            method (string): Model method to call
+            chunk_df (Pandas DataFrame): Rows to score
+        Return
+            chunk_predictions (Numpy Array): Predictions of the rows
+    """
+
+    return _predict_chunk(_WORKER_MODEL, method, chunk_df)
+
+
+def _write_parquet_predictions(
+    parquet_writer, parquet_filename, chunk_predictions):
+    """
+        Purpose:
+            Append a chunk of predictions to a Parquet file as a row
+            group, opening the file on the first chunk. 1D predictions
+            are stored in a prediction column and 2D predictions in
+            prediction_0, prediction_1, ... columns
+        Args:
+            parquet_writer (ParquetWriter): Open writer, or None
+            parquet_filename (string): Parquet file to write
+            chunk_predictions (Numpy Array): Predictions of a chunk
+        Return
+            parquet_writer (ParquetWriter): Open writer
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if chunk_predictions.ndim == 1:
+        prediction_columns = {'prediction': chunk_predictions}
+    else:
+        prediction_columns = {
+            'prediction_{index}'.format(index=index):
+                chunk_predictions[:, index]
+            for index in range(chunk_predictions.shape[1])
+        }
+    prediction_table = pa.table(prediction_columns)
+
+    if parquet_writer is None:
+        parquet_writer = pq.ParquetWriter(
+            parquet_filename, prediction_table.schema
+        )
+    parquet_writer.write_table(prediction_table)
+
+    return parquet_writer
+
+
+###
+# Cross Validation Functions
+###
+
+@instrumented
+def cross_validate_parameter_grid(
+    estimator, train_x, train_y_observed, parameter_grid, folds=None,
+    n_splits=5, scoring=None, n_jobs=None, early_stopping_tolerance=None,
+    random_state=None):
+    """
+        Purpose:
+            Cross validate every combination of a parameter grid over
+            a process pool. The training data (e.g. train_x and
+            train_y_observed from split_dataframe_for_model_training)
+            is written once to memory-mapped .npy files that every
+            worker maps read-only, so no worker receives its own
+            pickled copy. Folds are run in rounds; after each round,
+            combinations whose mean score trails the best by more than
+            early_stopping_tolerance are stopped. Higher scores are
+            better, as with scikit-learn scorers
+        Args:
+            estimator (scikit-learn Estimator): Unfitted estimator,
+                cloned for every fit
+            train_x (Pandas DataFrame): Numeric training features
+            train_y_observed (Pandas Series): Training target
+            parameter_grid (Dict or List of Dicts): Parameter values
+                to search, as accepted by ParameterGrid
+            folds (List of Tuples): Train and test row positions of
+                each fold. Defaults to iterate_k_fold_indices
+            n_splits (int): Number of folds when folds is not passed.
+                Defaults to 5
+            scoring (string or Function): scikit-learn scorer name or
+                scorer(estimator, x, y). Defaults to estimator.score
+            n_jobs (int): Worker processes. None for one per CPU;
+                1 runs in this process
+            early_stopping_tolerance (float): Score gap to the best
+                mean that stops a combination. Defaults to None (every
+                combination runs every fold)
+            random_state (int): Seed of the default folds. Defaults
+                to None
+        Return
+            cv_results (Pandas DataFrame): Row per fit with the
+                parameter_index, parameters, fold, fit_time,
+                score_time, and score
+            best_parameters (Dict): Parameters with the best mean
+                score among combinations that ran every fold
+    """
+
+    parameter_combinations = list(ParameterGrid(parameter_grid))
+    if folds is None:
+        folds = iterate_k_fold_indices(
+            train_x, n_splits=n_splits, random_state=random_state
+        )
+    folds = list(folds)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    logging.info(
+        'Cross Validating %d Parameter Combinations over %d Folds',
+        len(parameter_combinations), len(folds)
+    )
+
+    with tempfile.TemporaryDirectory() as training_data_directory:
+        _store_memory_mapped_training_data(
+            training_data_directory, train_x, train_y_observed
+        )
+
+        executor = None
+        if n_jobs > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_load_worker_training_data,
+                initargs=(training_data_directory,)
+            )
+        else:
+            _load_worker_training_data(training_data_directory)
+
+        try:
+            cv_results = _run_cross_validation_rounds(
+                executor, estimator, parameter_combinations, folds,
+                scoring, early_stopping_tolerance
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            _load_worker_training_data(None)
+
+    cv_results = pd.DataFrame(cv_results, columns=[
+        'parameter_index', 'parameters', 'fold', 'fit_time', 'score_time',
+        'score'
+    ])
+    fold_counts = cv_results.groupby('parameter_index')['fold'].count()
+    mean_scores = cv_results.groupby('parameter_index')['score'].mean()
+    best_parameter_index =\
+        mean_scores[fold_counts == len(folds)].idxmax()
+
+    return cv_results, parameter_combinations[best_parameter_index]
+
+
+def _run_cross_validation_rounds(
+    executor, estimator, parameter_combinations, folds, scoring,
+    early_stopping_tolerance):
+    """
+        Purpose:
+            Fit every remaining parameter combination on one fold per
+            round, stopping combinations that trail the best mean
+            score after each round
+        Args:
+            executor (ProcessPoolExecutor): Pool to fit in, or None
+                to fit in this process
+            estimator (scikit-learn Estimator): Unfitted estimator
+            parameter_combinations (List of Dicts): Parameters to fit
+            folds (List of Tuples): Train and test row positions
+            scoring (string or Function): Scorer or None
+            early_stopping_tolerance (float): Score gap that stops a
+                combination, or None
+        Return
+            cv_results (List of Tuples): Row per fit
+    """
+
+    cv_results = []
+    fold_scores = {
+        parameter_index: []
+        for parameter_index in range(len(parameter_combinations))
+    }
+    for fold_index, (train_indices, test_indices) in enumerate(folds):
+        fit_arguments = [
+            (
+                estimator, parameter_combinations[parameter_index],
+                train_indices, test_indices, scoring
+            )
+            for parameter_index in fold_scores
+        ]
+        if executor is None:
+            fold_results = [
+                _fit_worker_parameter_fold(*arguments)
+                for arguments in fit_arguments
+            ]
+        else:
+            fold_results = executor.map(
+                _fit_worker_parameter_fold, *zip(*fit_arguments)
+            )
+
+        for parameter_index, (fit_time, score_time, score) in zip(
+            list(fold_scores), fold_results):
+            fold_scores[parameter_index].append(score)
+            cv_results.append((
+                parameter_index, parameter_combinations[parameter_index],
+                fold_index, fit_time, score_time, score
+            ))
+
+        if early_stopping_tolerance is not None:
+            best_mean_score = max(
+                np.mean(scores) for scores in fold_scores.values()
+            )
+            fold_scores = {
+                parameter_index: scores
+                for parameter_index, scores in fold_scores.items()
+                if np.mean(scores) >= best_mean_score - early_stopping_tolerance
+            }
+            logging.info(
+                '%d Parameter Combinations Remaining after Fold %d',
+                len(fold_scores), fold_index
+            )
+
+    return cv_results
+
+
+def _store_memory_mapped_training_data(
+    directory, train_x, train_y_observed):
+    """
+        Purpose:
+            Write training data to .npy files for workers to map
+        Args:
+            directory (string): Directory to write x.npy and y.npy to
+            train_x (Pandas DataFrame): Numeric training features
+            train_y_observed (Pandas Series): Training target
+        Return
+            N/A
+    """
+
+    for filename, values in (
+        ('x.npy', np.asarray(train_x)), ('y.npy', np.asarray(train_y_observed))
+    ):
+        if values.dtype == object:
+            raise ValueError(
+                'Training data must be numeric to memory map, encode '
+                'categorical columns first'
+            )
+        memory_mapped_values = np.lib.format.open_memmap(
+            os.path.join(directory, filename), mode='w+',
+            dtype=values.dtype, shape=values.shape
+        )
+        memory_mapped_values[:] = values
+        memory_mapped_values.flush()
+        del memory_mapped_values
+
+
+_WORKER_TRAINING_DATA = None
+
+
+def _load_worker_training_data(directory):
+    """
+        Purpose:
+            Process pool initializer mapping the training data
+            read-only once per worker
+        Args:
+            directory (string): Directory holding x.npy and y.npy, or
+                None to release the training data
+        Return
+            N/A
+    """
+    global _WORKER_TRAINING_DATA
+
+    if directory is None:
+        _WORKER_TRAINING_DATA = None
+        return
+
+    _WORKER_TRAINING_DATA = tuple(
+        np.load(os.path.join(directory, filename), mmap_mode='r')
+        for filename in ('x.npy', 'y.npy')
+    )
+
+
+def _fit_worker_parameter_fold(
+    estimator, parameters, train_indices, test_indices, scoring):
+    """
+        Purpose:
+            Fit and score one parameter combination on one fold of
+            the mapped training data
+        Args:
+            estimator (scikit-learn Estimator): Unfitted estimator
+            parameters (Dict): Parameters to set on the clone
+            train_indices (Numpy Array): Row positions to fit on
+            test_indices (Numpy Array): Row positions to score on
+            scoring (string or Function): Scorer or None
+        Return
+            fit_time (float): Seconds spent fitting
+            score_time (float): Seconds spent scoring
+            score (float): Score on the test rows
+    """
+
+    x_values, y_values = _WORKER_TRAINING_DATA
+    fold_estimator = clone(estimator).set_params(**parameters)
+
+    fit_start = time.perf_counter()
+    fold_estimator.fit(x_values[train_indices], y_values[train_indices])
+    fit_time = time.perf_counter() - fit_start
+
+    score_start = time.perf_counter()
+    if scoring is None:
+        score = fold_estimator.score(
+            x_values[test_indices], y_values[test_indices]
+        )
+    else:
+        scorer = get_scorer(scoring) if isinstance(scoring, str) else scoring
+        score = scorer(
+            fold_estimator, x_values[test_indices], y_values[test_indices]
+        )
+    score_time = time.perf_counter() - score_start
+
+    return fit_time, score_time, float(score)
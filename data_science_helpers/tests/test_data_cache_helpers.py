@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for data_cache_helpers.py
+"""
+
+# Python Library Imports
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from unittest import mock
+
+# Import File to Test
+from data_science_helpers import data_cache_helpers
+from data_science_helpers import data_exploration_helpers
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def numeric_df():
+    """
+    Purpose:
+        Small numeric DataFrame to explore
+    """
+
+    random_state = np.random.RandomState(0)
+
+    return pd.DataFrame(random_state.normal(size=(50, 3)), columns=list('abc'))
+
+
+###
+# Mocked Functions
+###
+
+
+# None at the Moment (Empty Test Suite)
+
+
+###
+# Test Payload
+###
+
+
+def test_dataframe_fingerprint_tracks_data_and_schema(numeric_df):
+    """
+    Purpose:
+        Test the fingerprint changes with values, names, and dtypes only
+    """
+
+    fingerprint = data_cache_helpers.get_dataframe_fingerprint(numeric_df)
+
+    assert fingerprint ==\
+        data_cache_helpers.get_dataframe_fingerprint(numeric_df.copy())
+
+    changed_value_df = numeric_df.copy()
+    changed_value_df.iloc[0, 0] += 1
+    changed_name_df = numeric_df.rename(columns={'a': 'z'})
+    changed_dtype_df = numeric_df.astype(np.float32)
+    for changed_df in (changed_value_df, changed_name_df, changed_dtype_df):
+        assert fingerprint !=\
+            data_cache_helpers.get_dataframe_fingerprint(changed_df)
+
+
+def test_cache_key_binds_default_parameters(numeric_df):
+    """
+    Purpose:
+        Test equivalent calls share a key and new parameters do not
+    """
+
+    function = data_exploration_helpers.get_column_pairs_significant_correlation
+
+    key = data_cache_helpers.get_exploration_cache_key(function, numeric_df)
+
+    assert key == data_cache_helpers.get_exploration_cache_key(
+        function, numeric_df, pos_corr=.20
+    )
+    assert key != data_cache_helpers.get_exploration_cache_key(
+        function, numeric_df, .5
+    )
+
+
+def test_cacheable_exploration_returns_cached_result(numeric_df):
+    """
+    Purpose:
+        Test decorated functions only compute once per data and call
+    """
+
+    cache = data_cache_helpers.ExplorationCache()
+    computed_scales = []
+
+    @data_cache_helpers.cacheable_exploration
+    def cached_function(df, scale=1):
+        computed_scales.append(scale)
+        return scale
+
+    assert cached_function(numeric_df, cache=cache) == 1
+    assert cached_function(numeric_df.copy(), scale=1, cache=cache) == 1
+    assert cached_function(numeric_df, 2, cache=cache) == 2
+    assert cached_function(numeric_df) == 1
+    assert computed_scales == [1, 2, 1]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_exploration_functions_accept_cache(numeric_df):
+    """
+    Purpose:
+        Test the exploration helpers give the same results when cached
+    """
+
+    cache = data_cache_helpers.ExplorationCache()
+
+    correlation = data_exploration_helpers.get_column_correlation(numeric_df)
+    pd.testing.assert_series_equal(
+        data_exploration_helpers.get_column_correlation(
+            numeric_df, cache=cache
+        ),
+        correlation
+    )
+    pd.testing.assert_series_equal(
+        data_exploration_helpers.get_column_correlation(
+            numeric_df, cache=cache
+        ),
+        correlation
+    )
+    assert data_exploration_helpers.get_numerical_column_statistics(
+        numeric_df, cache=cache
+    ) == data_exploration_helpers.get_numerical_column_statistics(numeric_df)
+    assert cache.hits == 1
+
+
+def test_cache_memory_tier_evicts_least_recently_used():
+    """
+    Purpose:
+        Test the memory tier keeps only the most recently used entries
+    """
+
+    cache = data_cache_helpers.ExplorationCache(max_memory_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_cache_disk_tier_persists_and_evicts(tmp_path):
+    """
+    Purpose:
+        Test disk results survive a new cache and stay under the limit
+    """
+
+    cache_directory = str(tmp_path / 'cache')
+    cache = data_cache_helpers.ExplorationCache(
+        cache_directory=cache_directory
+    )
+    cache.set('a', np.zeros(10))
+
+    reloaded_cache = data_cache_helpers.ExplorationCache(
+        cache_directory=cache_directory, max_disk_bytes=2000
+    )
+    np.testing.assert_array_equal(reloaded_cache.get('a'), np.zeros(10))
+
+    os.utime(os.path.join(cache_directory, 'a.pkl'), (0, 0))
+    reloaded_cache.set('b', np.zeros(100))
+    reloaded_cache.set('c', np.zeros(100))
+    assert sorted(os.listdir(cache_directory)) == ['b.pkl', 'c.pkl']
+
+    reloaded_cache.clear()
+    assert os.listdir(cache_directory) == []
+    assert reloaded_cache.get('b') is None
@@ -8,6 +8,8 @@
 import os
 import sys
 import pytest
+import numpy as np
+import pandas as pd
 from unittest import mock
 
 # Import File to Test
@@ -19,7 +21,20 @@ from data_science_helpers import data_engineering_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def profiled_df():
+    """
+    Purpose:
+        DataFrame with one column matching each remove_* helper
+    """
+
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4],
+        'mostly_null': [1.0, np.nan, np.nan, 4.0],
+        'constant': [7, 7, 7, 7],
+        'category': ['a', 'b', 'c', 'a'],
+        'value': [1.5, 2.5, 1.5, 2.5],
+    })
 
 
 ###
@@ -35,4 +50,469 @@ from data_science_helpers import data_engineering_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_column_profile(profiled_df):
+    """
+    Purpose:
+        Test ColumnProfile computes counts and classes in one pass
+    """
+
+    column_profile = data_engineering_helpers.ColumnProfile(profiled_df)
+
+    assert column_profile.row_count == 4
+    assert column_profile.categorical_columns == ['category']
+    assert column_profile.get_dtype_class('id') == 'numeric'
+    assert column_profile.null_counts['mostly_null'] == 2
+    assert column_profile.unique_counts['category'] == 3
+    assert column_profile.min_values['value'] == 1.5
+    assert column_profile.max_values['id'] == 4
+
+
+def test_remove_helpers_reuse_profile(profiled_df):
+    """
+    Purpose:
+        Test remove_* helpers make their drops from a shared profile
+    """
+
+    column_profile = data_engineering_helpers.ColumnProfile(profiled_df)
+
+    with mock.patch.object(
+        data_engineering_helpers, 'ColumnProfile'
+    ) as mocked_profile:
+        df = data_engineering_helpers.remove_overly_null_columns(
+            profiled_df, percentage_null=.25, column_profile=column_profile
+        )
+        df = data_engineering_helpers.remove_single_value_columns(
+            df, column_profile=column_profile
+        )
+        df = data_engineering_helpers.remove_high_cardinality_numerical_columns(
+            df, column_profile=column_profile
+        )
+        df = data_engineering_helpers.remove_high_cardinality_categorical_columns(
+            df, max_unique_values=2, column_profile=column_profile
+        )
+
+    mocked_profile.assert_not_called()
+    assert list(df.columns) == ['value']
+
+
+def test_remove_helpers_without_profile(profiled_df):
+    """
+    Purpose:
+        Test remove_* helpers still work when no profile is passed
+    """
+
+    df = data_engineering_helpers.remove_single_value_columns(profiled_df)
+
+    assert 'constant' not in df.columns
+    assert len(df.columns) == 4
+
+
+def test_profile_dataframe_chunks_matches_column_profile(profiled_df):
+    """
+    Purpose:
+        Test streamed chunks give the same drop decisions as a full profile
+    """
+
+    chunks = [profiled_df.iloc[:2], profiled_df.iloc[2:]]
+    streaming_profile =\
+        data_engineering_helpers.profile_dataframe_chunks(chunks)
+    column_profile = data_engineering_helpers.ColumnProfile(profiled_df)
+
+    assert streaming_profile.row_count == 4
+    assert streaming_profile.null_counts.equals(column_profile.null_counts)
+    assert streaming_profile.unique_counts.equals(column_profile.unique_counts)
+    assert streaming_profile.categorical_columns == ['category']
+    assert data_engineering_helpers.get_columns_to_drop(
+        streaming_profile, max_unique_values=2
+    ) == data_engineering_helpers.get_columns_to_drop(
+        column_profile, max_unique_values=2
+    )
+
+
+def test_streaming_column_profile_merge(profiled_df):
+    """
+    Purpose:
+        Test profiles of separate partitions merge into one profile
+    """
+
+    profile_a = data_engineering_helpers.profile_dataframe_chunks(
+        [profiled_df.iloc[:1]]
+    )
+    profile_b = data_engineering_helpers.profile_dataframe_chunks(
+        [profiled_df.iloc[1:]]
+    )
+    profile_a.merge(profile_b)
+
+    assert profile_a.row_count == 4
+    assert profile_a.unique_counts['id'] == 4
+    assert profile_a.min_values['value'] == 1.5
+    assert profile_a.max_values['id'] == 4
+
+
+@pytest.mark.parametrize('approximate', [False, True])
+def test_remove_quantile_equality_columns(approximate):
+    """
+    Purpose:
+        Test columns with equal low/high quantiles are removed
+    """
+
+    df = pd.DataFrame({
+        'spread': np.arange(100, dtype=float),
+        'spiked': [0.0] * 99 + [100.0],
+        'category': ['a'] * 100,
+    })
+
+    df = data_engineering_helpers.remove_quantile_equality_columns(
+        df, approximate=approximate
+    )
+
+    assert list(df.columns) == ['spread', 'category']
+
+
+def test_mask_outliers_numerical_columns():
+    """
+    Purpose:
+        Test outliers are set to the low/high quantile values
+    """
+
+    df = pd.DataFrame({
+        'value': np.arange(101, dtype=float),
+        'category': ['a'] * 101,
+    })
+
+    masked_df = data_engineering_helpers.mask_outliers_numerical_columns(df)
+
+    assert masked_df['value'].min() == 5
+    assert masked_df['value'].max() == 95
+    assert df['value'].max() == 100
+
+
+def test_mask_outliers_numerical_columns_keeps_integer_dtypes():
+    """
+    Purpose:
+        Test integer columns are clipped without becoming float
+    """
+
+    df = pd.DataFrame({
+        'integer': np.arange(101),
+        'nullable': pd.array(list(range(100)) + [None], dtype='Int64'),
+    })
+
+    masked_df = data_engineering_helpers.mask_outliers_numerical_columns(df)
+
+    assert masked_df['integer'].dtype == np.int64
+    assert masked_df['nullable'].dtype == pd.Int64Dtype()
+    assert (masked_df['integer'].min(), masked_df['integer'].max()) ==\
+        (5, 95)
+    assert masked_df['nullable'].max() == 94
+    assert masked_df['nullable'].isna().sum() == 1
+
+
+@pytest.mark.parametrize('approximate', [False, True])
+def test_quantile_helpers_ignore_bool_columns(approximate):
+    """
+    Purpose:
+        Test bool columns are left out of quantile based helpers
+    """
+
+    df = pd.DataFrame({
+        'value': np.arange(100, dtype=float),
+        'flag': [True, False] * 50,
+    })
+
+    masked_df = data_engineering_helpers.mask_outliers_numerical_columns(
+        df.copy(), approximate=approximate
+    )
+    removed_df = data_engineering_helpers.remove_quantile_equality_columns(
+        df, approximate=approximate
+    )
+
+    assert masked_df['flag'].equals(df['flag'])
+    assert list(removed_df.columns) == ['value', 'flag']
+
+
+def test_outlier_clipper_save_and_load(tmp_path):
+    """
+    Purpose:
+        Test OutlierClipper reuses fitted bounds on new data
+    """
+
+    train_df = pd.DataFrame({
+        'value': np.arange(101, dtype=float),
+        'category': ['a'] * 101,
+    })
+    outlier_clipper = data_engineering_helpers.OutlierClipper().fit(train_df)
+    outlier_clipper.save(str(tmp_path / 'bounds.json'))
+
+    loaded_clipper = data_engineering_helpers.OutlierClipper.load(
+        str(tmp_path / 'bounds.json')
+    )
+    score_df = pd.DataFrame({'value': [-50.0, 50.0, 500.0], 'category': 'b'})
+    with mock.patch.object(
+        data_engineering_helpers, 'get_column_quantiles'
+    ) as mocked_quantiles:
+        score_df = loaded_clipper.transform(score_df)
+
+    mocked_quantiles.assert_not_called()
+    assert list(score_df['value']) == [5.0, 50.0, 95.0]
+
+
+def test_outlier_clipper_requires_fit():
+    """
+    Purpose:
+        Test OutlierClipper raises if transform is called before fit
+    """
+
+    with pytest.raises(ValueError):
+        data_engineering_helpers.OutlierClipper().transform(pd.DataFrame())
+
+
+def test_convert_categorical_columns_to_dummies_matches_get_dummies():
+    """
+    Purpose:
+        Test dummies match pd.get_dummies with the original naming
+    """
+
+    df = pd.DataFrame({
+        'category': ['x', 'y', None, 'z'],
+        'number': [1, 2, 3, 4],
+    })
+
+    dummies_df =\
+        data_engineering_helpers.convert_categorical_columns_to_dummies(df)
+
+    assert dummies_df.equals(pd.get_dummies(
+        df, columns=['category'], prefix_sep=':', drop_first=True
+    ))
+
+
+def test_categorical_dummy_encoder_frozen_layout(tmp_path):
+    """
+    Purpose:
+        Test scoring batches get the fitted layout, including unseen
+        categories, sparse columns, and after save/load
+    """
+
+    train_df = pd.DataFrame({
+        'small': ['a', 'b', 'a'],
+        'large': ['x', 'y', 'z'],
+        'number': [1, 2, 3],
+    })
+    dummy_encoder = data_engineering_helpers.CategoricalDummyEncoder(
+        drop_first=False, sparse_threshold=2
+    ).fit(train_df)
+    dummy_encoder.save(str(tmp_path / 'vocabularies.json'))
+    dummy_encoder = data_engineering_helpers.CategoricalDummyEncoder.load(
+        str(tmp_path / 'vocabularies.json')
+    )
+
+    score_df = dummy_encoder.transform(pd.DataFrame({
+        'small': ['b', 'c'],
+        'large': ['z', 'z'],
+        'number': [4, 5],
+    }))
+    dummy_matrix = dummy_encoder.transform_sparse_matrix(train_df)
+
+    assert list(score_df.columns) ==\
+        ['number'] + dummy_encoder.feature_names
+    assert list(score_df['small:b']) == [True, False]
+    assert not score_df['small:a'].any()
+    assert isinstance(score_df['large:z'].dtype, pd.SparseDtype)
+    assert dummy_matrix.shape == (3, 5)
+    assert dummy_matrix.sum() == 6
+
+
+def test_categorical_dummy_encoder_save_and_load_datetime(tmp_path):
+    """
+    Purpose:
+        Test datetime categories survive save/load and encode the same
+    """
+
+    df = pd.DataFrame({
+        'category': ['a', 'b', 'a'],
+        'date': pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-01']),
+    })
+    dummy_encoder = data_engineering_helpers.CategoricalDummyEncoder(
+        drop_first=False
+    ).fit(df)
+    dummy_encoder.save(str(tmp_path / 'vocabularies.json'))
+    loaded_encoder = data_engineering_helpers.CategoricalDummyEncoder.load(
+        str(tmp_path / 'vocabularies.json')
+    )
+
+    assert loaded_encoder.vocabularies == dummy_encoder.vocabularies
+    assert loaded_encoder.transform(df).equals(dummy_encoder.transform(df))
+
+
+def test_encode_categorical_columns_as_integer():
+    """
+    Purpose:
+        Test categorical columns are replaced with sorted integer codes
+    """
+
+    df = pd.DataFrame({
+        'category': ['b', 'a', 'c', 'a'],
+        'number': [1, 2, 3, 4],
+    })
+
+    encoded_df =\
+        data_engineering_helpers.encode_categorical_columns_as_integer(df)
+
+    assert list(encoded_df.columns) == ['number', 'LabelEncoded:category']
+    assert list(encoded_df['LabelEncoded:category']) == [1, 0, 2, 0]
+
+
+def test_categorical_integer_encoder_unseen_values(tmp_path):
+    """
+    Purpose:
+        Test unseen values get the reserved code after save/load
+    """
+
+    integer_encoder = data_engineering_helpers.CategoricalIntegerEncoder(
+        unknown_code=-9
+    ).fit(pd.DataFrame({'category': ['a', 'b']}))
+    integer_encoder.save(str(tmp_path / 'vocabularies.json'))
+    integer_encoder = data_engineering_helpers.CategoricalIntegerEncoder.load(
+        str(tmp_path / 'vocabularies.json')
+    )
+
+    encoded_df = integer_encoder.transform(
+        pd.DataFrame({'category': ['b', 'z', None]})
+    )
+
+    assert list(encoded_df['LabelEncoded:category']) == [1, -9, -9]
+    assert list(integer_encoder.encode_values('category', ['a'])) == [0]
+
+
+def test_categorical_integer_encoder_save_and_load_datetime(tmp_path):
+    """
+    Purpose:
+        Test datetime categories survive save/load and encode the same
+    """
+
+    df = pd.DataFrame({
+        'category': ['a', 'b', 'a'],
+        'date': pd.to_datetime(['2020-01-02', '2020-01-01', '2020-01-02']),
+    })
+    integer_encoder =\
+        data_engineering_helpers.CategoricalIntegerEncoder().fit(df)
+    integer_encoder.save(str(tmp_path / 'vocabularies.json'))
+    loaded_encoder = data_engineering_helpers.CategoricalIntegerEncoder.load(
+        str(tmp_path / 'vocabularies.json')
+    )
+
+    encoded_df = loaded_encoder.transform(df)
+
+    assert loaded_encoder.vocabularies == integer_encoder.vocabularies
+    assert encoded_df.equals(integer_encoder.transform(df))
+    assert list(encoded_df['LabelEncoded:date']) == [1, 0, 1]
+
+
+def test_optimize_dataframe_memory():
+    """
+    Purpose:
+        Test columns shrink only when their values are kept exactly
+    """
+
+    df = pd.DataFrame({
+        'small_int': np.arange(100, dtype=np.int64),
+        'negative_int': -np.arange(100, dtype=np.int64),
+        'half_float': np.arange(100) * .5,
+        'precise_float': np.arange(100) * .1,
+        'category': ['a', 'b'] * 50,
+        'identifier': [str(value) for value in range(100)],
+    })
+
+    optimized_df, memory_report, dtype_map =\
+        data_engineering_helpers.optimize_dataframe_memory(df)
+
+    assert dtype_map == {
+        'small_int': 'uint8',
+        'negative_int': 'int8',
+        'half_float': 'float32',
+        'category': 'category',
+    }
+    assert optimized_df['half_float'].equals(df['half_float'].astype('float32'))
+    assert memory_report['bytes_after'].sum() <\
+        memory_report['bytes_before'].sum()
+    assert memory_report.loc['small_int', 'bytes_after'] == 100
+
+
+def test_optimize_dataframe_memory_nullable_integers():
+    """
+    Purpose:
+        Test nullable integer columns with nulls shrink to nullable dtypes
+    """
+
+    df = pd.DataFrame({
+        'small_int': pd.array([1, None, 200], dtype='Int64'),
+        'negative_int': pd.array([-5, None, 300], dtype='Int64'),
+        'all_null': pd.array([None, None, None], dtype='Int64'),
+    })
+
+    optimized_df, _, dtype_map =\
+        data_engineering_helpers.optimize_dataframe_memory(df)
+
+    assert dtype_map == {'small_int': 'UInt8', 'negative_int': 'Int16'}
+    assert optimized_df['small_int'].isna().tolist() == [False, True, False]
+    assert optimized_df['negative_int'].tolist()[::2] == [-5, 300]
+
+
+def test_replace_null_values_helpers():
+    """
+    Purpose:
+        Test numeric and categorical null replacement stay separate
+    """
+
+    df = pd.DataFrame({
+        'number': [1.0, np.nan, 3.0],
+        'category': ['a', None, 'b'],
+    })
+
+    numeric_df =\
+        data_engineering_helpers.replace_null_values_numeric_columns(df)
+    categorical_df =\
+        data_engineering_helpers.replace_null_values_categorical_columns(df)
+
+    assert list(numeric_df['number']) == [1.0, 2.0, 3.0]
+    assert numeric_df['category'].isnull().sum() == 1
+    assert list(categorical_df['category']) == ['a', 'Unknown', 'b']
+    assert categorical_df['number'].isnull().sum() == 1
+
+
+def test_null_imputer_group_fill_values(tmp_path):
+    """
+    Purpose:
+        Test group-wise fill values fall back to the overall fill
+        value for unseen groups after save/load
+    """
+
+    train_df = pd.DataFrame({
+        'group': ['a', 'a', 'b', 'b'],
+        'number': [1.0, 3.0, 10.0, np.nan],
+        'category': pd.Categorical(['x', None, 'y', 'y']),
+    })
+    null_imputer = data_engineering_helpers.NullImputer(
+        group_column='group'
+    ).fit(train_df)
+    null_imputer.save(str(tmp_path / 'fill_values.json'))
+    null_imputer = data_engineering_helpers.NullImputer.load(
+        str(tmp_path / 'fill_values.json')
+    )
+
+    score_df = null_imputer.transform(train_df.assign(
+        group=['a', 'b', 'b', 'z'], number=np.nan
+    ))
+
+    assert list(score_df['number']) == [2.0, 10.0, 10.0, 3.0]
+    assert list(score_df['category']) == ['x', 'Unknown', 'y', 'y']
+
+
+def test_null_imputer_unknown_operation():
+    """
+    Purpose:
+        Test NullImputer rejects unknown operations
+    """
+
+    with pytest.raises(ValueError):
+        data_engineering_helpers.NullImputer(numeric_operation='mode')
@@ -8,6 +8,8 @@
 import os
 import sys
 import pytest
+import numpy as np
+import pandas as pd
 from unittest import mock
 
 # Import File to Test
@@ -35,4 +37,240 @@ from data_science_helpers import data_exploration_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.mark.parametrize('approximate', [False, True])
+def test_get_numerical_column_statistics(approximate):
+    """
+    Purpose:
+        Test numerical statistics skip categorical columns
+    """
+
+    df = pd.DataFrame({
+        'value': np.arange(101, dtype=float),
+        'category': ['a'] * 101,
+    })
+
+    num_statistics = data_exploration_helpers.get_numerical_column_statistics(
+        df, approximate=approximate
+    )
+
+    assert list(num_statistics.keys()) == ['value']
+    assert abs(num_statistics['value']['quantile_50'] - 50) <= 2
+    assert num_statistics['value']['max'] == 100
+
+
+def test_get_numerical_column_statistics_dataframe_matches_pandas():
+    """
+    Purpose:
+        Test the NumPy statistics engine matches pandas reductions,
+        including null and zero counts
+    """
+
+    df = pd.DataFrame({
+        'value': [0.0, 1.0, np.nan, 4.0, 10.0, 0.0],
+        'empty': np.nan,
+        'category': 'a',
+    })
+
+    statistics_df =\
+        data_exploration_helpers.get_numerical_column_statistics_dataframe(df)
+
+    assert list(statistics_df.index) == ['value', 'empty']
+    assert statistics_df.loc['value', 'count_null'] == 1
+    assert statistics_df.loc['value', 'count_0'] == 2
+    for statistic, expected in (
+        ('quantile_25', df['value'].quantile(.25)),
+        ('median', df['value'].median()),
+        ('mean', df['value'].mean()),
+        ('skew', df['value'].skew()),
+        ('std', df['value'].std()),
+        ('sum', df['value'].sum()),
+    ):
+        assert statistics_df.loc['value', statistic] == pytest.approx(expected)
+    assert statistics_df.loc['empty', 'count_null'] == 6
+    assert np.isnan(statistics_df.loc['empty', 'mean'])
+
+
+@pytest.mark.parametrize('approximate', [False, True])
+def test_get_numerical_column_statistics_dataframe_zero_rows(approximate):
+    """
+    Purpose:
+        Test a DataFrame without rows gets null statistics
+    """
+
+    df = pd.DataFrame({'value': pd.Series([], dtype=float)})
+
+    statistics_df =\
+        data_exploration_helpers.get_numerical_column_statistics_dataframe(
+            df, approximate=approximate
+        )
+
+    assert statistics_df.loc['value', 'total_count'] == 0
+    for statistic in ('min', 'max', 'mean', 'median', 'std'):
+        assert np.isnan(statistics_df.loc['value', statistic])
+
+
+def test_get_column_pairs_significant_correlation():
+    """
+    Purpose:
+        Test pairs are thresholded by sign and sorted strongest first
+    """
+
+    base = np.arange(20, dtype=float)
+    noise = np.tile([1.0, -1.0], 10)
+    df = pd.DataFrame({
+        'base': base,
+        'close': base + noise,
+        'loose': base + 8 * noise,
+        'inverse': -base,
+        'category': 'a',
+    })
+
+    positive_pairs, negative_pairs =\
+        data_exploration_helpers.get_column_pairs_significant_correlation(df)
+
+    assert positive_pairs[0] == ('base', 'close')
+    assert set(positive_pairs) ==\
+        {('base', 'close'), ('base', 'loose'), ('close', 'loose')}
+    assert negative_pairs[0] == ('base', 'inverse')
+    assert ('loose', 'inverse') in negative_pairs
+
+    top_positive, top_negative =\
+        data_exploration_helpers.get_column_pairs_significant_correlation(
+            df, top_k=1, as_dataframe=True
+        )
+
+    assert len(top_positive.index) == 1
+    assert top_positive['column_b'].iloc[0] == 'close'
+    assert top_negative['correlation'].iloc[0] == pytest.approx(-1)
+
+
+def test_get_streaming_column_correlation():
+    """
+    Purpose:
+        Test chunked correlation matches df.corr() pairs
+    """
+
+    values = np.random.default_rng(3).normal(size=(200, 3))
+    df = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    df.loc[::7, 'b'] = np.nan
+
+    streaming_correlation =\
+        data_exploration_helpers.get_streaming_column_correlation(
+            [df.iloc[:50], df.iloc[50:120], df.iloc[120:]]
+        )
+    correlation = df.corr()
+
+    assert list(streaming_correlation.index) ==\
+        [('a', 'b'), ('a', 'c'), ('b', 'c')]
+    for column_a, column_b in streaming_correlation.index:
+        assert streaming_correlation[(column_a, column_b)] ==\
+            pytest.approx(correlation.loc[column_a, column_b])
+
+
+def test_write_blocked_correlation_matrix(tmp_path):
+    """
+    Purpose:
+        Test the memory-mapped matrix matches df.corr() across blocks
+    """
+
+    values = np.random.default_rng(5).normal(size=(100, 5))
+    df = pd.DataFrame(values, columns=list('abcde'))
+    df['e'] = df['a'] - df['d']
+
+    correlation_matrix =\
+        data_exploration_helpers.write_blocked_correlation_matrix(
+            lambda: [df.iloc[:60], df.iloc[60:]],
+            str(tmp_path / 'correlation.npy'), list(df.columns),
+            block_size=2, dtype=np.float64
+        )
+
+    assert isinstance(correlation_matrix, np.memmap)
+    assert np.allclose(correlation_matrix, df.corr().to_numpy())
+
+
+def test_rank_correlation_explorers():
+    """
+    Purpose:
+        Test Spearman and Kendall match pandas in pair format, with
+        Kendall spread over a process pool
+    """
+
+    values = np.random.default_rng(11).normal(size=(60, 3))
+    df = pd.DataFrame(values, columns=['a', 'b', 'c'])
+    df['b'] = df['a'] ** 3
+    df['category'] = 'x'
+
+    spearman_correlation =\
+        data_exploration_helpers.get_column_spearman_correlation(df)
+    kendall_correlation =\
+        data_exploration_helpers.get_column_kendall_correlation(df, n_jobs=2)
+
+    assert list(kendall_correlation.index) ==\
+        [('a', 'b'), ('a', 'c'), ('b', 'c')]
+    assert spearman_correlation[('a', 'b')] == pytest.approx(1)
+    for pair in kendall_correlation.index:
+        assert kendall_correlation[pair] == pytest.approx(
+            df[['a', 'b', 'c']].corr(method='kendall').loc[pair]
+        )
+
+
+def test_get_column_mutual_information():
+    """
+    Purpose:
+        Test dependent columns share more information than
+        independent columns
+    """
+
+    rng = np.random.default_rng(13)
+    df = pd.DataFrame({'a': rng.normal(size=1000)})
+    df['dependent'] = np.abs(df['a'])
+    df['independent'] = rng.normal(size=1000)
+    df.loc[::10, 'independent'] = np.nan
+
+    mutual_information =\
+        data_exploration_helpers.get_column_mutual_information(
+            df, bins=8, n_jobs=1
+        )
+
+    assert mutual_information[('a', 'dependent')] > .5
+    assert mutual_information[('a', 'independent')] < .1
+
+
+def test_column_pair_helpers_share_order():
+    """
+    Purpose:
+        Test lazy pairs, pair indices, and the pair set agree
+    """
+
+    df = pd.DataFrame(columns=['c', 'a', 'b'])
+
+    lazy_pairs = data_exploration_helpers.iterate_unique_column_pairs(df)
+    rows, cols = data_exploration_helpers.get_unique_column_pair_indices(df)
+    indexed_pairs = list(zip(df.columns[rows], df.columns[cols]))
+
+    assert not isinstance(lazy_pairs, (list, set))
+    assert list(lazy_pairs) == [('c', 'a'), ('c', 'b'), ('a', 'b')]
+    assert indexed_pairs == [('c', 'a'), ('c', 'b'), ('a', 'b')]
+    assert data_exploration_helpers.get_unique_column_paris(df) ==\
+        set(indexed_pairs)
+
+
+def test_get_column_correlation():
+    """
+    Purpose:
+        Test correlation pairs skip categorical columns
+    """
+
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0, 4.0],
+        'b': [4.0, 3.0, 2.0, 1.0],
+        'category': ['w', 'x', 'y', 'z'],
+    })
+
+    correlation = data_exploration_helpers.get_column_correlation(df)
+    abs_correlation =\
+        data_exploration_helpers.get_column_absolute_correlation(df)
+
+    assert list(correlation.index) == [('a', 'b')]
+    assert correlation[('a', 'b')] == pytest.approx(-1)
+    assert abs_correlation[('a', 'b')] == pytest.approx(1)
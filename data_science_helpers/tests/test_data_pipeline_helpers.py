@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for data_pipeline_helpers.py
+"""
+
+# Python Library Imports
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from unittest import mock
+
+# Import File to Test
+from data_science_helpers import data_engineering_helpers
+from data_science_helpers import data_pipeline_helpers
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def training_df():
+    """
+    Purpose:
+        DataFrame with columns for each drop and transform step
+    """
+
+    return pd.DataFrame({
+        'id': [1, 2, 3, 4],
+        'mostly_null': [1.0, np.nan, np.nan, np.nan],
+        'constant': [7, 7, 7, 7],
+        'number': [1.0, np.nan, 3.0, 3.0],
+        'category': ['a', 'b', None, 'a'],
+    })
+
+
+@pytest.fixture
+def pipeline_steps():
+    """
+    Purpose:
+        Steps matching a chain of the data engineering helpers
+    """
+
+    return [
+        'remove_overly_null_columns',
+        'remove_single_value_columns',
+        'remove_high_cardinality_numerical_columns',
+        ('replace_null_values_numeric_columns', {'replace_operation': 'mean'}),
+        'replace_null_values_categorical_columns',
+        ('convert_categorical_columns_to_dummies', {'drop_first': False}),
+    ]
+
+
+###
+# Mocked Functions
+###
+
+
+# None at the Moment (Empty Test Suite)
+
+
+###
+# Test Payload
+###
+
+
+def test_pipeline_plans_fused_drop_stage(pipeline_steps):
+    """
+    Purpose:
+        Test consecutive drop steps are planned as one stage
+    """
+
+    pipeline = data_pipeline_helpers.Pipeline(pipeline_steps)
+
+    assert [stage[0] for stage in pipeline.stages] ==\
+        ['drop', 'transform', 'transform', 'transform']
+    assert len(pipeline.stages[0][1]) == 3
+
+
+def test_pipeline_matches_chained_helpers(training_df, pipeline_steps):
+    """
+    Purpose:
+        Test the pipeline gives the same result as chaining helpers,
+        profiling the data once for all drop steps
+    """
+
+    chained_df = data_engineering_helpers.remove_overly_null_columns(
+        training_df
+    )
+    chained_df =\
+        data_engineering_helpers.remove_single_value_columns(chained_df)
+    chained_df = data_engineering_helpers.\
+        remove_high_cardinality_numerical_columns(chained_df)
+    chained_df = data_engineering_helpers.\
+        replace_null_values_numeric_columns(chained_df, 'mean')
+    chained_df = data_engineering_helpers.\
+        replace_null_values_categorical_columns(chained_df)
+    chained_df = data_engineering_helpers.\
+        convert_categorical_columns_to_dummies(chained_df, drop_first=False)
+
+    pipeline = data_pipeline_helpers.Pipeline(pipeline_steps)
+    with mock.patch.object(
+        data_pipeline_helpers, 'ColumnProfile',
+        wraps=data_engineering_helpers.ColumnProfile
+    ) as mocked_profile:
+        pipeline_df = pipeline.fit_transform(training_df)
+
+    assert mocked_profile.call_count == 1
+    assert pipeline_df.equals(chained_df)
+    assert training_df['number'].isnull().sum() == 1
+
+
+def test_pipeline_transform_new_batch(training_df, pipeline_steps):
+    """
+    Purpose:
+        Test new batches reuse fitted drops and transformers
+    """
+
+    pipeline = data_pipeline_helpers.Pipeline(pipeline_steps).fit(training_df)
+
+    score_df = pipeline.transform(pd.DataFrame({
+        'id': [9],
+        'mostly_null': [2.0],
+        'constant': [8],
+        'number': [np.nan],
+        'category': ['c'],
+    }))
+
+    assert list(score_df.columns) ==\
+        ['number', 'category:Unknown', 'category:a', 'category:b']
+    assert score_df['number'].iloc[0] == pytest.approx(7.0 / 3.0)
+    assert not score_df.iloc[0, 1:].any()
+
+
+def test_pipeline_errors():
+    """
+    Purpose:
+        Test unsupported steps and unfitted pipelines raise
+    """
+
+    with pytest.raises(ValueError):
+        data_pipeline_helpers.Pipeline(['get_numeric_columns'])
+
+    with pytest.raises(ValueError):
+        data_pipeline_helpers.Pipeline(
+            ['remove_single_value_columns']
+        ).transform(pd.DataFrame())
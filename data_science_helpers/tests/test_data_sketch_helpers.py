@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for data_sketch_helpers.py
+"""
+
+# Python Library Imports
+import os
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+from unittest import mock
+
+# Import File to Test
+from data_science_helpers import data_sketch_helpers
+
+
+###
+# Fixtures
+###
+
+
+# None at the Moment (Empty Test Suite)
+
+
+###
+# Mocked Functions
+###
+
+
+# None at the Moment (Empty Test Suite)
+
+
+###
+# Test Payload
+###
+
+
+def test_hash_column_values_ignores_numeric_dtype():
+    """
+    Purpose:
+        Test the same numeric value hashes the same across dtypes
+    """
+
+    int_hashes = data_sketch_helpers.hash_column_values(pd.Series([1, 2]))
+    float_hashes = data_sketch_helpers.hash_column_values(
+        pd.Series([1.0, np.nan, 2.0])
+    )
+
+    assert list(int_hashes) == list(float_hashes)
+
+
+def test_hyperloglog_exact_and_estimated_counts():
+    """
+    Purpose:
+        Test HyperLogLog is exact under exact_limit and close above it
+    """
+
+    sketch = data_sketch_helpers.HyperLogLog(exact_limit=100)
+    sketch.update(data_sketch_helpers.hash_column_values(
+        pd.Series(['a', 'b', 'a'])
+    ))
+    assert sketch.count() == 2
+
+    sketch.update(data_sketch_helpers.hash_column_values(
+        pd.Series(np.arange(100000))
+    ))
+    assert sketch.exact_hashes is None
+    assert abs(sketch.count() - 100002) / 100002 < .05
+
+
+def test_hyperloglog_merge():
+    """
+    Purpose:
+        Test merged sketches count the union of their values
+    """
+
+    sketch_a = data_sketch_helpers.HyperLogLog()
+    sketch_b = data_sketch_helpers.HyperLogLog()
+    sketch_a.update(data_sketch_helpers.hash_column_values(
+        pd.Series([1, 2, 3])
+    ))
+    sketch_b.update(data_sketch_helpers.hash_column_values(
+        pd.Series([3, 4])
+    ))
+    sketch_a.merge(sketch_b)
+
+    assert sketch_a.count() == 4
+
+    with pytest.raises(ValueError):
+        sketch_a.merge(data_sketch_helpers.HyperLogLog(precision=12))
+
+
+def test_kll_sketch_quantiles_and_serialization():
+    """
+    Purpose:
+        Test KLLSketch quantiles are within rank error and survive
+        serialization and merging
+    """
+
+    values = np.random.default_rng(7).permutation(100000).astype(float)
+    sketch_a = data_sketch_helpers.KLLSketch(k=200, seed=7)
+    sketch_b = data_sketch_helpers.KLLSketch(k=200, seed=7)
+    sketch_a.update(values[:50000])
+    sketch_b.update(values[50000:])
+    sketch_a.merge(
+        data_sketch_helpers.KLLSketch.from_bytes(sketch_b.to_bytes())
+    )
+
+    quantile_values = sketch_a.quantiles([0, .05, .5, .95, 1])
+
+    assert sketch_a.count == 100000
+    assert quantile_values[0] == 0
+    assert quantile_values[-1] == 99999
+    assert np.all(
+        np.abs(quantile_values[1:4] - [5000, 50000, 95000]) < 2500
+    )
+
+
+def test_column_quantile_sketch():
+    """
+    Purpose:
+        Test ColumnQuantileSketch matches the layout of df.quantile
+    """
+
+    df = pd.DataFrame({
+        'number': np.arange(100, dtype=float),
+        'category': ['a'] * 100,
+    })
+    column_sketch = data_sketch_helpers.sketch_dataframe_chunk_quantiles(
+        [df.iloc[:50], df.iloc[50:]]
+    )
+    column_sketch = data_sketch_helpers.ColumnQuantileSketch.from_dict(
+        column_sketch.to_dict()
+    )
+
+    quantiles = column_sketch.quantiles([0, 1])
+
+    assert list(quantiles.columns) == ['number']
+    assert list(quantiles['number']) == [0, 99]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+    Purpose:
+        Test File for instrumentation_helpers.py
+"""
+
+# Python Library Imports
+import io
+import os
+import sys
+import json
+import logging
+import pytest
+import numpy as np
+import pandas as pd
+from unittest import mock
+
+# Import File to Test
+from data_science_helpers import instrumentation_helpers
+from data_science_helpers import data_engineering_helpers
+
+
+###
+# Fixtures
+###
+
+
+@pytest.fixture
+def null_df():
+    """
+    Purpose:
+        DataFrame with two mostly null columns
+    """
+
+    return pd.DataFrame({
+        'keep': np.arange(8.0),
+        'null_a': [np.nan] * 7 + [1.0],
+        'null_b': [np.nan] * 6 + [1.0, 2.0],
+    })
+
+
+@pytest.fixture
+def call_records():
+    """
+    Purpose:
+        Records of instrumented calls, collected by a callback sink that
+        is removed after the test
+    """
+
+    call_records = []
+    instrumentation_helpers.add_instrumentation_sink(call_records.append)
+    yield call_records
+    instrumentation_helpers.remove_instrumentation_sink(call_records.append)
+    instrumentation_helpers.set_memory_tracking(False)
+
+
+###
+# Mocked Functions
+###
+
+
+# None at the Moment (Empty Test Suite)
+
+
+###
+# Test Payload
+###
+
+
+def test_instrumented_records_shapes_and_nested_calls(null_df, call_records):
+    """
+    Purpose:
+        Test a helper call records its timing and the shapes in and out,
+        with nested helper calls recorded first
+    """
+
+    data_engineering_helpers.remove_overly_null_columns(null_df)
+
+    helpers = [call_record['helper'] for call_record in call_records]
+    assert helpers == [
+        'data_engineering_helpers.get_overly_null_columns',
+        'data_engineering_helpers.remove_overly_null_columns',
+    ]
+
+    call_record = call_records[-1]
+    assert call_record['seconds'] >= 0
+    assert (call_record['rows_in'], call_record['columns_in']) == (8, 3)
+    assert (call_record['rows_out'], call_record['columns_out']) == (8, 1)
+    assert call_record['peak_memory_delta_bytes'] is None
+    assert call_record['error'] is None
+
+
+def test_instrumented_records_errors(call_records):
+    """
+    Purpose:
+        Test a failing helper is recorded and still raises
+    """
+
+    @instrumentation_helpers.instrumented
+    def failing_helper(df):
+        raise ValueError('bad input')
+
+    with pytest.raises(ValueError):
+        failing_helper(pd.Series([1, 2]))
+
+    assert call_records[-1]['error'] == 'ValueError: bad input'
+    assert call_records[-1]['rows_in'] == 2
+    assert call_records[-1]['rows_out'] is None
+
+
+def test_instrumented_survives_failing_sink(null_df):
+    """
+    Purpose:
+        Test a failing sink does not fail the helper
+    """
+
+    failing_sink = mock.Mock(side_effect=RuntimeError)
+    instrumentation_helpers.add_instrumentation_sink(failing_sink)
+    try:
+        df = data_engineering_helpers.remove_overly_null_columns(null_df)
+    finally:
+        instrumentation_helpers.remove_instrumentation_sink(failing_sink)
+
+    assert list(df.columns) == ['keep']
+    assert failing_sink.called
+
+
+def test_instrumented_memory_tracking(call_records):
+    """
+    Purpose:
+        Test an enclosing call's peak includes its nested calls' peaks
+    """
+
+    @instrumentation_helpers.instrumented
+    def allocating_helper():
+        return np.ones(1000000)
+
+    @instrumentation_helpers.instrumented
+    def enclosing_helper():
+        allocating_helper()
+        return None
+
+    instrumentation_helpers.set_memory_tracking(True)
+    enclosing_helper()
+
+    allocating_record, enclosing_record = call_records
+    assert allocating_record['peak_memory_delta_bytes'] >= 8000000
+    assert enclosing_record['peak_memory_delta_bytes'] >=\
+        allocating_record['peak_memory_delta_bytes']
+
+
+def test_metrics_registry_and_json_lines_sinks(null_df):
+    """
+    Purpose:
+        Test the registry aggregates counters and the JSON sink writes
+        one line per call
+    """
+
+    metrics_registry = instrumentation_helpers.MetricsRegistry()
+    stream = io.StringIO()
+    json_sink = instrumentation_helpers.JsonLinesSink(stream)
+    instrumentation_helpers.add_instrumentation_sink(metrics_registry)
+    instrumentation_helpers.add_instrumentation_sink(json_sink)
+    try:
+        for _ in range(2):
+            data_engineering_helpers.get_numeric_columns(null_df)
+    finally:
+        instrumentation_helpers.remove_instrumentation_sink(metrics_registry)
+        instrumentation_helpers.remove_instrumentation_sink(json_sink)
+
+    helper = 'data_engineering_helpers.get_numeric_columns'
+    assert metrics_registry.get_value('calls_total', helper) == 2
+    assert metrics_registry.get_value('rows_in_total', helper) == 16
+    assert 'data_science_helpers_calls_total{{helper="{helper}"}} 2.0'.format(
+        helper=helper
+    ) in metrics_registry.render()
+
+    json_records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [json_record['helper'] for json_record in json_records] ==\
+        [helper, helper]
+
+
+def test_dropped_columns_logged_once(null_df, caplog):
+    """
+    Purpose:
+        Test dropped columns are logged in one line, not one per column
+    """
+
+    with caplog.at_level(logging.INFO):
+        data_engineering_helpers.remove_overly_null_columns(null_df)
+
+    drop_messages = [
+        record.getMessage() for record in caplog.records
+        if record.getMessage().startswith('Dropping')
+    ]
+    assert drop_messages == [
+        "Dropping 2 Columns due to high null counts: ['null_a', 'null_b']"
+    ]
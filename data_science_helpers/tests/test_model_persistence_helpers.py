@@ -7,8 +7,13 @@
 # Python Library Imports
 import os
 import sys
+import asyncio
 import pytest
+import threading
+import time
+import numpy as np
 from unittest import mock
+from sklearn.ensemble import RandomForestRegressor
 
 # Import File to Test
 from data_science_helpers import model_persistence_helpers
@@ -19,7 +24,18 @@ from data_science_helpers import model_persistence_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def fitted_model():
+    """
+    Purpose:
+        Small fitted tree ensemble and the rows it was fit on
+    """
+
+    random_state = np.random.RandomState(0)
+    x = random_state.normal(size=(200, 4))
+    model = RandomForestRegressor(n_estimators=5, random_state=0)
+
+    return model.fit(x, x.sum(axis=1)), x
 
 
 ###
@@ -35,4 +51,251 @@ from data_science_helpers import model_persistence_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.mark.parametrize('compression', [None, 'lz4', 'zstd'])
+def test_store_and_load_pickled_model(fitted_model, tmp_path, compression):
+    """
+    Purpose:
+        Test a stored model loads with memory mapped arrays and sidecars
+    """
+
+    if compression is not None:
+        pytest.importorskip({'lz4': 'lz4', 'zstd': 'zstandard'}[compression])
+    model, x = fitted_model
+    filename = str(tmp_path / 'model.pkl')
+
+    model_persistence_helpers.store_model_as_pickle(
+        model, filename, config={'n_estimators': 5},
+        metadata={'rows': 200}, compression=compression, array_threshold=1024
+    )
+    loaded_model = model_persistence_helpers.load_pickled_model(filename)
+
+    np.testing.assert_array_equal(loaded_model.predict(x), model.predict(x))
+    assert os.listdir(str(tmp_path / 'model.arrays'))
+    assert model_persistence_helpers.load_model_config(filename) ==\
+        {'n_estimators': 5}
+    assert model_persistence_helpers.load_model_metadata(filename) ==\
+        {'rows': 200}
+
+
+def test_load_pickled_model_memory_maps_arrays(tmp_path):
+    """
+    Purpose:
+        Test large arrays are memory mapped and small arrays are not
+    """
+
+    filename = str(tmp_path / 'model.pkl')
+    large_array = np.arange(1000, dtype=np.float64)
+    model = {'large': large_array, 'same': large_array, 'small': np.ones(2)}
+
+    model_persistence_helpers.store_model_as_pickle(
+        model, filename, array_threshold=1024
+    )
+    loaded_model = model_persistence_helpers.load_pickled_model(filename)
+
+    assert isinstance(loaded_model['large'], np.memmap)
+    assert not isinstance(loaded_model['small'], np.memmap)
+    assert len(os.listdir(str(tmp_path / 'model.arrays'))) == 1
+    np.testing.assert_array_equal(loaded_model['same'], large_array)
+
+
+def test_load_pickled_model_missing_file(tmp_path):
+    """
+    Purpose:
+        Test loading a missing model raises
+    """
+
+    with pytest.raises(Exception):
+        model_persistence_helpers.load_pickled_model(
+            str(tmp_path / 'missing.pkl')
+        )
+
+
+def test_model_cache_hits_and_reloads_changed_files(tmp_path):
+    """
+    Purpose:
+        Test cached models are reused until their file changes
+    """
+
+    filename = str(tmp_path / 'model.pkl')
+    model_persistence_helpers.store_model_as_pickle({'version': 1}, filename)
+    model_cache = model_persistence_helpers.ModelCache()
+
+    model = model_cache.get_model(filename)
+    assert model_cache.get_model(filename) is model
+    assert (model_cache.hits, model_cache.misses) == (1, 1)
+
+    model_persistence_helpers.store_model_as_pickle({'version': 22}, filename)
+    assert model_cache.get_model(filename) == {'version': 22}
+    assert (model_cache.misses, model_cache.evictions) == (2, 1)
+
+
+def test_model_cache_evicts_least_recently_used(tmp_path):
+    """
+    Purpose:
+        Test the cache stays within its model count and byte bounds
+    """
+
+    filenames = []
+    for model_index in range(3):
+        filenames.append(str(tmp_path / f'model_{model_index}.pkl'))
+        model_persistence_helpers.store_model_as_pickle(
+            np.zeros(100), filenames[-1]
+        )
+    model_cache = model_persistence_helpers.ModelCache(max_models=2)
+
+    model_cache.get_model(filenames[0])
+    model_cache.get_model(filenames[1])
+    model_cache.get_model(filenames[0])
+    model_cache.get_model(filenames[2])
+    assert model_cache.evictions == 1
+    model_cache.get_model(filenames[0])
+    assert model_cache.misses == 3
+
+    model_cache = model_persistence_helpers.ModelCache(
+        max_bytes=model_persistence_helpers.get_model_file_bytes(
+            filenames[0]
+        ) + 1
+    )
+    model_cache.get_model(filenames[0])
+    model_cache.get_model(filenames[1])
+    assert model_cache.evictions == 1
+    model_cache.invalidate()
+    assert model_cache.cached_bytes == 0
+
+
+def test_model_cache_collapses_concurrent_loads(tmp_path):
+    """
+    Purpose:
+        Test simultaneous first lookups of a model load it once
+    """
+
+    filename = str(tmp_path / 'model.pkl')
+    model_persistence_helpers.store_model_as_pickle({'version': 1}, filename)
+    model_cache = model_persistence_helpers.ModelCache()
+    load_pickled_model = model_persistence_helpers.load_pickled_model
+
+    def slow_load_pickled_model(*args, **kwargs):
+        time.sleep(.2)
+        return load_pickled_model(*args, **kwargs)
+
+    with mock.patch.object(
+        model_persistence_helpers, 'load_pickled_model',
+        side_effect=slow_load_pickled_model) as mocked_load:
+        models = []
+        threads = [
+            threading.Thread(
+                target=lambda: models.append(model_cache.get_model(filename))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mocked_load.call_count == 1
+    assert all(model is models[0] for model in models)
+    assert (model_cache.hits, model_cache.misses) == (3, 1)
+
+
+def test_store_model_as_buffer_container(fitted_model, tmp_path):
+    """
+    Purpose:
+        Test a buffer container model loads with the same predictions
+    """
+
+    model, x = fitted_model
+    filename = str(tmp_path / 'model.pkl')
+
+    model_persistence_helpers.store_model_as_buffer_container(
+        model, filename, config={'n_estimators': 5}
+    )
+    loaded_model = model_persistence_helpers.load_pickled_model(filename)
+
+    np.testing.assert_array_equal(loaded_model.predict(x), model.predict(x))
+    assert model_persistence_helpers.load_model_config(filename) ==\
+        {'n_estimators': 5}
+
+
+@pytest.mark.parametrize('mmap_mode', ['r', 'c', None])
+def test_load_buffer_container_memory_maps_buffers(tmp_path, mmap_mode):
+    """
+    Purpose:
+        Test container arrays are aligned views of the file mapping
+    """
+
+    filename = str(tmp_path / 'model.pkl')
+    model = {'weights': np.arange(1000.0), 'bias': np.arange(3, dtype=np.int8)}
+
+    model_persistence_helpers.store_model_as_buffer_container(
+        model, filename, alignment=64
+    )
+    loaded_model = model_persistence_helpers.load_pickled_model(
+        filename, mmap_mode=mmap_mode
+    )
+
+    for name, values in model.items():
+        np.testing.assert_array_equal(loaded_model[name], values)
+        assert not loaded_model[name].flags.owndata
+        if mmap_mode is not None:
+            assert loaded_model[name].ctypes.data % 64 == 0
+    assert loaded_model['weights'].flags.writeable == (mmap_mode != 'r')
+
+
+def test_model_preloader_status_and_futures(tmp_path):
+    """
+    Purpose:
+        Test preloaded models resolve and failed loads are reported
+    """
+
+    filename = str(tmp_path / 'model.pkl')
+    missing_filename = str(tmp_path / 'missing.pkl')
+    model_persistence_helpers.store_model_as_pickle({'version': 1}, filename)
+    model_cache = model_persistence_helpers.ModelCache()
+
+    model_preloader = model_persistence_helpers.ModelPreloader(
+        [filename, missing_filename], max_workers=2, model_cache=model_cache
+    )
+    assert model_preloader.get_model(filename) == {'version': 1}
+    with pytest.raises(Exception):
+        model_preloader.get_future(missing_filename).result()
+
+    status = model_preloader.get_status()
+    assert status['models'] == {
+        filename: 'ready', missing_filename: 'failed'
+    }
+    assert (status['ready'], status['failed']) == (1, 1)
+    assert missing_filename in status['errors']
+    assert model_preloader.is_ready(filename)
+    assert not model_preloader.is_ready()
+    assert model_cache.get_model(filename) is model_preloader.get_model(
+        filename
+    )
+    model_preloader.shutdown()
+
+
+def test_model_preloader_awaitables(tmp_path):
+    """
+    Purpose:
+        Test preloaded models can be awaited from an event loop
+    """
+
+    filenames = []
+    for model_index in range(3):
+        filenames.append(str(tmp_path / f'model_{model_index}.pkl'))
+        model_persistence_helpers.store_model_as_pickle(
+            {'version': model_index}, filenames[-1]
+        )
+    model_preloader = model_persistence_helpers.ModelPreloader(filenames)
+
+    async def wait_for_models():
+        first_model = await model_preloader.wait_for_model(filenames[0])
+        return first_model, await model_preloader.wait_until_ready()
+
+    first_model, models = asyncio.run(wait_for_models())
+
+    assert first_model == {'version': 0}
+    assert [models[filename]['version'] for filename in filenames] ==\
+        [0, 1, 2]
+    assert set(model_preloader.load_seconds) == set(filenames)
+    model_preloader.shutdown()
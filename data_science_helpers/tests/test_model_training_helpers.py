@@ -8,7 +8,10 @@
 import os
 import sys
 import pytest
+import numpy as np
+import pandas as pd
 from unittest import mock
+from sklearn.linear_model import Ridge
 
 # Import File to Test
 from data_science_helpers import model_training_helpers
@@ -19,7 +22,17 @@ from data_science_helpers import model_training_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def grouped_df():
+    """
+    Purpose:
+        DataFrame with a grouping column holding a null value
+    """
+
+    return pd.DataFrame({
+        'group': ['b', 'a', None, 'b', 'a'],
+        'value': [1, 2, 3, 4, 5],
+    })
 
 
 ###
@@ -35,4 +48,287 @@ from data_science_helpers import model_training_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+def test_split_dataframe_by_column_keeps_null_group(grouped_df):
+    """
+    Purpose:
+        Test every value, including null, gets its own DataFrame
+    """
+
+    split_df = model_training_helpers.split_dataframe_by_column(
+        grouped_df, 'group'
+    )
+
+    assert list(split_df) == ['b', 'a', 'nan']
+    assert list(split_df['b']['value']) == [1, 4]
+    assert list(split_df['a']['value']) == [2, 5]
+    assert list(split_df['nan']['value']) == [3]
+
+    split_df = model_training_helpers.split_dataframe_by_column(
+        grouped_df, 'group', dropna=True
+    )
+    assert list(split_df) == ['b', 'a']
+
+
+def test_iterate_dataframe_partitions_keeps_index(grouped_df):
+    """
+    Purpose:
+        Test partitions keep their original index labels in row order
+    """
+
+    partitions = dict(model_training_helpers.iterate_dataframe_partitions(
+        grouped_df.set_index('value'), 'group', dropna=True
+    ))
+
+    assert list(partitions['b'].index) == [1, 4]
+    assert list(partitions['a'].index) == [2, 5]
+    assert list(partitions['a']['group']) == ['a', 'a']
+
+
+def test_get_column_partition_indices(grouped_df):
+    """
+    Purpose:
+        Test partitions are positional indices in first appearance order
+    """
+
+    partition_indices = model_training_helpers.get_column_partition_indices(
+        grouped_df.set_index('value'), 'group', dropna=True
+    )
+
+    assert list(partition_indices) == ['b', 'a']
+    np.testing.assert_array_equal(partition_indices['b'], [0, 3])
+    np.testing.assert_array_equal(partition_indices['a'], [1, 4])
+
+
+def test_write_dataframe_partitions_to_parquet(grouped_df, tmp_path):
+    """
+    Purpose:
+        Test partitions are written to Hive style Parquet directories
+    """
+
+    with mock.patch.object(pd.DataFrame, 'to_parquet') as to_parquet:
+        partition_filenames =\
+            model_training_helpers.write_dataframe_partitions_to_parquet(
+                grouped_df, 'group', str(tmp_path)
+            )
+
+    assert [
+        os.path.relpath(filename, str(tmp_path))
+        for filename in partition_filenames.values()
+    ] == [
+        os.path.join('group=b', 'part-0.parquet'),
+        os.path.join('group=a', 'part-0.parquet'),
+        os.path.join(
+            'group=__HIVE_DEFAULT_PARTITION__', 'part-0.parquet'
+        ),
+    ]
+    assert to_parquet.call_count == 3
+
+
+def test_split_dataframe_for_model_training_multi_character_target():
+    """
+    Purpose:
+        Test a dependent variable name longer than one character splits
+    """
+
+    df = pd.DataFrame({
+        'feature': np.arange(10), 'target': np.arange(10) * 2
+    })
+
+    train_x, test_x, train_y_observed, test_y_observed =\
+        model_training_helpers.split_dataframe_for_model_training(
+            df, 'target', train_size=.8, random_state=0
+        )
+
+    assert list(train_x.columns) == ['feature']
+    assert (len(train_x), len(test_x)) == (8, 2)
+    assert list(train_y_observed) == list(train_x['feature'] * 2)
+    assert list(test_y_observed) == list(test_x['feature'] * 2)
+
+
+def test_split_dataframe_for_model_training_unknown_column():
+    """
+    Purpose:
+        Test an unknown independent variable raises instead of selecting
+        another column
+    """
+
+    df = pd.DataFrame({'a': np.arange(10), 'y': np.arange(10)})
+
+    with pytest.raises(KeyError, match='typo'):
+        model_training_helpers.split_dataframe_for_model_training(
+            df, 'y', independent_variables=['a', 'typo']
+        )
+
+
+def test_get_train_test_split_indices_strategies():
+    """
+    Purpose:
+        Test stratified, grouped, and time ordered holdouts
+    """
+
+    df = pd.DataFrame({
+        'label': [0] * 10 + [1] * 10,
+        'group': np.repeat(np.arange(5), 4),
+        'time': np.arange(20)[::-1],
+    })
+
+    train_indices, test_indices =\
+        model_training_helpers.get_train_test_split_indices(
+            df, train_size=.5, stratify_column='label', random_state=0
+        )
+    assert df['label'].iloc[test_indices].sum() == 5
+
+    train_indices, test_indices =\
+        model_training_helpers.get_train_test_split_indices(
+            df, train_size=.6, group_column='group', random_state=0
+        )
+    assert not set(df['group'].iloc[train_indices]) &\
+        set(df['group'].iloc[test_indices])
+
+    train_indices, test_indices =\
+        model_training_helpers.get_train_test_split_indices(
+            df, train_size=.75, time_column='time'
+        )
+    assert df['time'].iloc[train_indices].max() <\
+        df['time'].iloc[test_indices].min()
+    assert len(test_indices) == 5
+
+    with pytest.raises(ValueError):
+        model_training_helpers.get_train_test_split_indices(
+            df, stratify_column='label', group_column='group'
+        )
+
+
+def test_iterate_k_fold_indices():
+    """
+    Purpose:
+        Test k-fold indices test every row once and respect groups
+    """
+
+    df = pd.DataFrame({
+        'group': np.repeat(np.arange(6), 3), 'time': np.arange(18)
+    })
+
+    folds = model_training_helpers.iterate_k_fold_indices(
+        df, n_splits=3, random_state=0
+    )
+    test_indices = np.concatenate([test_indices for _, test_indices in folds])
+    assert sorted(test_indices) == list(range(18))
+
+    folds = model_training_helpers.iterate_k_fold_indices(
+        df, n_splits=3, group_column='group'
+    )
+    for train_indices, test_indices in folds:
+        assert not set(df['group'].iloc[train_indices]) &\
+            set(df['group'].iloc[test_indices])
+
+    folds = model_training_helpers.iterate_k_fold_indices(
+        df, n_splits=3, time_column='time'
+    )
+    for train_indices, test_indices in folds:
+        assert train_indices.max() < test_indices.min()
+
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_cross_validate_parameter_grid(n_jobs):
+    """
+    Purpose:
+        Test every combination and fold is scored and timed
+    """
+
+    random_state = np.random.RandomState(0)
+    train_x = pd.DataFrame(random_state.normal(size=(60, 3)))
+    train_y_observed = train_x.sum(axis=1)
+
+    cv_results, best_parameters =\
+        model_training_helpers.cross_validate_parameter_grid(
+            Ridge(), train_x, train_y_observed,
+            {'alpha': [.01, 1000.0]}, n_splits=3, n_jobs=n_jobs,
+            random_state=0
+        )
+
+    assert len(cv_results) == 6
+    assert (cv_results['fit_time'] >= 0).all()
+    assert best_parameters == {'alpha': .01}
+
+
+def test_cross_validate_parameter_grid_early_stopping():
+    """
+    Purpose:
+        Test combinations trailing the best score stop after a fold
+    """
+
+    random_state = np.random.RandomState(0)
+    train_x = pd.DataFrame(random_state.normal(size=(60, 3)))
+    train_y_observed = train_x.sum(axis=1)
+
+    cv_results, best_parameters =\
+        model_training_helpers.cross_validate_parameter_grid(
+            Ridge(), train_x, train_y_observed,
+            {'alpha': [.01, 1000.0]}, n_splits=3, n_jobs=1,
+            scoring='neg_mean_squared_error', early_stopping_tolerance=.1,
+            random_state=0
+        )
+
+    assert list(cv_results.groupby('parameter_index')['fold'].count()) ==\
+        [3, 1]
+    assert best_parameters == {'alpha': .01}
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_predict_dataframe_in_chunks(use_processes):
+    """
+    Purpose:
+        Test chunked predictions match predicting the whole DataFrame
+    """
+
+    random_state = np.random.RandomState(0)
+    df = pd.DataFrame(random_state.normal(size=(103, 3)))
+    model = Ridge().fit(df, df.sum(axis=1))
+
+    predictions, inference_report =\
+        model_training_helpers.predict_dataframe_in_chunks(
+            model, df, chunk_size=10, n_jobs=2, use_processes=use_processes
+        )
+
+    np.testing.assert_allclose(predictions, model.predict(df))
+    assert inference_report['rows'] == 103
+    assert inference_report['chunks'] == 11
+    assert inference_report['rows_per_second'] > 0
+
+
+def test_predict_dataframe_in_chunks_empty_dataframe():
+    """
+    Purpose:
+        Test an empty DataFrame gets an empty prediction array
+    """
+
+    df = pd.DataFrame({'x': np.arange(10.0)})
+    model = Ridge().fit(df, df['x'])
+
+    predictions, inference_report =\
+        model_training_helpers.predict_dataframe_in_chunks(model, df.iloc[:0])
+
+    assert len(predictions) == 0
+    assert inference_report['chunks'] == 0
+
+
+def test_predict_dataframe_in_chunks_to_parquet(tmp_path):
+    """
+    Purpose:
+        Test chunked predictions stream to Parquet in row order
+    """
+
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'x': np.arange(25.0)})
+    model = Ridge(alpha=0).fit(df, df['x'] * 2)
+    parquet_filename = str(tmp_path / 'predictions.parquet')
+
+    predictions, _ = model_training_helpers.predict_dataframe_in_chunks(
+        model, df, chunk_size=10, n_jobs=2, parquet_filename=parquet_filename
+    )
+
+    assert predictions is None
+    np.testing.assert_allclose(
+        pd.read_parquet(parquet_filename)['prediction'], df['x'] * 2
+    )